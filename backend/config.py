@@ -9,6 +9,12 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    # Request connection pool (per worker process)
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle_seconds: int = 1800
+    # Fail fast with an error instead of queueing when the pool is exhausted
+    db_pool_timeout_seconds: float = 5
 
     # JWT
     secret_key: str
@@ -43,6 +49,20 @@ class Settings(BaseSettings):
     # Environment
     environment: str = "development"
 
+    # Schema bootstrap: create missing tables on startup via SQLModel metadata.
+    # Convenient for local development; disable (AUTO_CREATE_TABLES=false) in
+    # deployed environments where the schema is provisioned ahead of time.
+    auto_create_tables: bool = True
+
+    # Sync jobs: leave queued jobs to the standalone worker (python -m
+    # sync_worker) instead of running them in the API process
+    sync_worker_enabled: bool = False
+    sync_worker_poll_seconds: float = 2
+    # Active jobs whose runner has not heartbeated for this long are assumed
+    # orphaned (runners heartbeat every 30 seconds): the sync worker requeues
+    # them, and in-process mode fails and replaces them on the next sync
+    sync_job_stale_after_minutes: int = 5
+
     # Logging
     log_level: str = "INFO"
     sql_log_level: str = "WARNING"
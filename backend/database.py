@@ -2,6 +2,7 @@
 
 from contextlib import contextmanager
 
+from sqlalchemy import DDL, event
 from sqlalchemy.pool import QueuePool
 from sqlmodel import Session, SQLModel, create_engine
 
@@ -14,16 +15,56 @@ engine = create_engine(
     settings.database_url,
     echo=False,  # SQL logging controlled via Python logging (see main.py)
     poolclass=QueuePool,
-    pool_size=5,  # Number of connections to maintain
-    max_overflow=10,  # Additional connections if pool exhausted
+    pool_size=settings.db_pool_size,  # Number of connections to maintain
+    max_overflow=settings.db_max_overflow,  # Additional connections if pool exhausted
     pool_pre_ping=True,  # Verify connections before using
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_recycle=settings.db_pool_recycle_seconds,  # Recycle long-lived connections
+    pool_timeout=settings.db_pool_timeout_seconds,  # Max wait for a free connection
+    query_cache_size=1200,  # Compiled-statement cache (default 500)
+    **(
+        # Batch executemany INSERT/UPDATEs into multi-row statements
+        {"executemany_mode": "values_plus_batch"}
+        if settings.database_url.startswith(("postgresql://", "postgresql+psycopg2://"))
+        else {}
+    ),
 )
 
+# Small dedicated pool for health/readiness probes so a saturated request pool
+# cannot make probes time out (and probes never steal request connections)
+health_engine = create_engine(
+    settings.database_url,
+    echo=False,
+    poolclass=QueuePool,
+    pool_size=2,
+    max_overflow=0,  # Never grow beyond the probe pool
+    pool_pre_ping=False,  # The probe itself is the ping
+    connect_args=(
+        {"connect_timeout": 2} if settings.database_url.startswith("postgresql") else {}
+    ),
+)
+
+
+def pool_stats() -> dict[str, int]:
+    """Request pool occupancy, for comparing checked_out against capacity."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_connections": pool.size() + settings.db_max_overflow,
+    }
+
 
 def get_session():
-    """Get database session (FastAPI dependency)."""
-    with Session(engine) as session:
+    """Get database session (FastAPI dependency).
+
+    Objects are not expired on commit: the session lives for one request, so
+    a committed object's in-memory state is current and re-reading it after
+    every commit would only add SELECTs.
+    """
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
@@ -47,6 +88,14 @@ def get_session_context():
         session.close()
 
 
+# Trigram GIN indexes on searchable text columns need pg_trgm installed first
+event.listen(
+    SQLModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 def create_db_and_tables():
     """Create all database tables."""
     SQLModel.metadata.create_all(engine)
@@ -29,37 +29,41 @@ SettingsDep = Annotated[Settings, Depends(get_settings)]
 
 
 # Service dependencies
-def get_user_service(session: SessionDep) -> UserService:
+# async def where constructing the service does no I/O, so resolving it on
+# the event loop saves a threadpool round trip per request
+async def get_user_service(session: SessionDep) -> UserService:
     """Get UserService instance."""
     return UserService(session)
 
 
-def get_project_service(session: SessionDep) -> ProjectService:
+async def get_project_service(session: SessionDep) -> ProjectService:
     """Get ProjectService instance."""
     return ProjectService(session)
 
 
+# Plain def: AuthService initializes Firebase on first use, which may read the
+# service account file, so it is built in the threadpool
 def get_auth_service(session: SessionDep, settings: SettingsDep) -> AuthService:
     """Get AuthService instance."""
     return AuthService(session, settings)
 
 
-def get_sync_service(session: SessionDep, settings: SettingsDep) -> SyncService:
+async def get_sync_service(session: SessionDep, settings: SettingsDep) -> SyncService:
     """Get SyncService instance."""
     return SyncService(session, settings)
 
 
-def get_risk_service(session: SessionDep) -> RiskService:
+async def get_risk_service(session: SessionDep) -> RiskService:
     """Get RiskService instance."""
     return RiskService(session)
 
 
-def get_action_service(session: SessionDep) -> ActionService:
+async def get_action_service(session: SessionDep) -> ActionService:
     """Get ActionService instance."""
     return ActionService(session)
 
 
-def get_sync_job_service(session: SessionDep) -> SyncJobService:
+async def get_sync_job_service(session: SessionDep) -> SyncJobService:
     """Get SyncJobService instance."""
     return SyncJobService(session)
 
@@ -75,7 +79,9 @@ SyncJobServiceDep = Annotated[SyncJobService, Depends(get_sync_job_service)]
 
 
 # Authentication dependencies
-async def get_current_user(
+# Plain def: the user lookup is blocking DB work, so FastAPI runs this in its
+# threadpool instead of on the event loop
+def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     auth_service: AuthServiceDep,
     user_service: UserServiceDep,
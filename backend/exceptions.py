@@ -1,34 +1,49 @@
-"""Custom exceptions for the application."""
+"""Custom exceptions for the application.
+
+Each class carries the HTTP ``status_code`` and ``error_type`` used by the
+global exception handler in ``main.py`` to build the error envelope.
+"""
 
 
 class PMAppException(Exception):
     """Base exception for the application."""
 
-    pass
+    status_code: int = 500
+    error_type: str = "PMAppException"
+    # Whether str(exc) is safe to return to clients outside development
+    expose_detail: bool = False
 
 
 class AuthenticationError(PMAppException):
     """Authentication failures."""
 
-    pass
+    status_code = 401
+    error_type = "AuthenticationError"
+    expose_detail = True
 
 
 class AuthorizationError(PMAppException):
     """Authorization/permission failures."""
 
-    pass
+    status_code = 403
+    error_type = "AuthorizationError"
+    expose_detail = True
 
 
 class ResourceNotFoundError(PMAppException):
     """Resource not found."""
 
-    pass
+    status_code = 404
+    error_type = "ResourceNotFoundError"
+    expose_detail = True
 
 
 class ValidationError(PMAppException):
     """Business validation failures."""
 
-    pass
+    status_code = 400
+    error_type = "ValidationError"
+    expose_detail = True
 
 
 class ExternalServiceError(PMAppException):
@@ -40,16 +55,22 @@ class ExternalServiceError(PMAppException):
 class IntegrationError(ExternalServiceError):
     """Integration-specific errors with external services."""
 
-    pass
+    status_code = 502
+    error_type = "IntegrationError"
+    expose_detail = True
 
 
 class ConfigurationError(PMAppException):
     """Configuration or environment variable errors."""
 
-    pass
+    status_code = 500
+    error_type = "ConfigurationError"
+    expose_detail = True
 
 
 class DuplicateResourceError(PMAppException):
     """Attempting to create a resource that already exists."""
 
-    pass
+    status_code = 409
+    error_type = "DuplicateResourceError"
+    expose_detail = True
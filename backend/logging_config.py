@@ -0,0 +1,150 @@
+"""Structured logging setup shared by the API and the sync worker."""
+
+import atexit
+import copy
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+import structlog
+
+from config import Settings
+
+# Background listener that renders queued log records to stdout (see configure_logging)
+_log_listener: QueueListener | None = None
+
+
+def _stop_log_listener() -> None:
+    """Drain and stop the current listener (registered once with atexit)."""
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() formats every record before enqueueing it, which would
+    run the renderer on the logging thread. structlog records keep their event
+    dict as-is; foreign records only get their %-args merged so a later
+    mutation of an argument cannot change the message.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if hasattr(record, "_logger"):  # Attached by wrap_for_formatter
+            return record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _BatchingStreamHandler(logging.StreamHandler):
+    """StreamHandler that flushes only once the log queue has drained.
+
+    When stdout is not a terminal (containers, log collectors) Python
+    block-buffers it, so a burst of records is flushed in a few large writes
+    instead of one syscall per line. Nothing is held back once the queue is
+    idle.
+    """
+
+    def __init__(self, stream, log_queue: queue.Queue) -> None:
+        super().__init__(stream)
+        self._log_queue = log_queue
+
+    def flush(self) -> None:
+        if self._log_queue.empty():
+            super().flush()
+
+
+def _capture_exc_info(logger, method_name: str, event_dict: dict) -> dict:
+    """Resolve ``exc_info=True`` while still on the thread handling the error."""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+def configure_logging(settings: Settings) -> None:
+    """Configure structured logging with structlog.
+
+    Log records are handed to a QueueHandler so request handlers only enqueue;
+    a background QueueListener thread renders them and does the stdout I/O.
+    """
+    global _log_listener
+
+    # Get log level from settings (configurable via environment)
+    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
+    sql_log_level = getattr(logging, settings.sql_log_level.upper(), logging.WARNING)
+
+    # Processors that run on the calling thread: cheap, and they need its
+    # context (contextvars, the active exception, the stack, the time of the call)
+    caller_processors = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+    ]
+
+    if settings.environment == "development":
+        # Pretty console output for development
+        caller_processors.append(structlog.dev.set_exc_info)
+        render_processors = [structlog.dev.ConsoleRenderer()]
+    else:
+        # JSON for production (easy to parse in log aggregators)
+        render_processors = [
+            structlog.processors.format_exc_info,
+            # Event values may be UUIDs etc.; stringify them only when a record
+            # is actually rendered (callers pass raw values, not str(...))
+            structlog.processors.JSONRenderer(default=str),
+        ]
+    caller_processors.append(_capture_exc_info)
+
+    # Rendering happens on the listener thread, for structlog and stdlib records alike
+    formatter = structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=[
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+        ],
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.UnicodeDecoder(),
+            *render_processors,
+        ],
+    )
+
+    # Configure standard logging: root -> queue -> listener thread -> stdout.
+    # Repeated calls replace the previous listener after draining it.
+    _stop_log_listener()
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    stream_handler = _BatchingStreamHandler(sys.stdout, log_queue)
+    stream_handler.setFormatter(formatter)
+    _log_listener = QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [_DeferredQueueHandler(log_queue)]
+    root_logger.setLevel(log_level)
+
+    # Configure third-party loggers to reduce noise
+    logging.getLogger("sqlalchemy.engine").setLevel(sql_log_level)
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    # Configure structlog. The filtering wrapper drops below-level calls before
+    # any processor runs, so filtered-out events cost only the method call.
+    structlog.configure(
+        processors=[
+            *caller_processors,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
@@ -1,97 +1,54 @@
 """FastAPI application entry point."""
 
-import logging
-import sys
+import asyncio
+import functools
+import json
 import traceback
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
+import anyio.to_thread
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from config import get_settings
-from database import create_db_and_tables, engine
+from database import create_db_and_tables, engine, health_engine, pool_stats
+from dependencies import CogniterUser
 from exceptions import (
     AuthenticationError,
-    AuthorizationError,
     ConfigurationError,
-    DuplicateResourceError,
     IntegrationError,
     PMAppException,
-    ResourceNotFoundError,
-    ValidationError,
 )
 from integrations import JiraClient, SalesforcePrecursiveClient
-from middleware import RequestContextMiddleware, RequestLoggingMiddleware
+from logging_config import configure_logging
+from middleware import (
+    QueryCountMiddleware,
+    RequestContextMiddleware,
+    RequestLoggingMiddleware,
+    install_statement_counter,
+)
 from routers import actions, auth, projects, risks, sync, uploads, users
 
 settings = get_settings()
 
+# Resolved once at import: gates tracebacks and raw error details in responses
+_DEV_MODE = settings.environment == "development"
 
-# ============================================================================
-# Structured Logging Configuration
-# ============================================================================
-
-
-def configure_logging():
-    """Configure structured logging with structlog."""
-
-    # Get log level from settings (configurable via environment)
-    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
-    sql_log_level = getattr(logging, settings.sql_log_level.upper(), logging.WARNING)
-
-    # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        level=log_level,
-        stream=sys.stdout,
-    )
-
-    # Configure third-party loggers to reduce noise
-    logging.getLogger("sqlalchemy.engine").setLevel(sql_log_level)
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-
-    # Shared processors for both dev and prod
-    # Note: Using processors compatible with PrintLoggerFactory (not stdlib)
-    shared_processors = [
-        structlog.contextvars.merge_contextvars,
-        structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.UnicodeDecoder(),
-    ]
-
-    if settings.environment == "development":
-        # Pretty console output for development
-        processors = shared_processors + [
-            structlog.dev.set_exc_info,
-            structlog.dev.ConsoleRenderer(),
-        ]
-    else:
-        # JSON for production (easy to parse in log aggregators)
-        processors = shared_processors + [
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
-        ]
-
-    # Configure structlog
-    structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(log_level),
-        context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=True,
-    )
+# Generic 500 messages returned outside development
+_INTERNAL_ERROR_MESSAGE = "An internal error occurred"
+_UNEXPECTED_ERROR_MESSAGE = "An unexpected error occurred"
+_POOL_EXHAUSTED_MESSAGE = "Service is busy, please retry"
 
 
 # Initialize logging
-configure_logging()
+configure_logging(settings)
 logger = structlog.get_logger()
 
 
@@ -127,10 +84,10 @@ def validate_required_config():
     logger.info("Configuration validated successfully")
 
 
-def log_integration_status():
+def log_integration_status(
+    jira_client: JiraClient, precursive_client: SalesforcePrecursiveClient
+):
     """Log the status of optional integrations."""
-    jira_client = JiraClient(settings)
-    precursive_client = SalesforcePrecursiveClient(settings)
 
     if jira_client.is_configured:
         logger.info(
@@ -228,17 +185,32 @@ async def lifespan(app: FastAPI):
     # Validate configuration (fail fast)
     validate_required_config()
 
-    # Create database tables
-    create_db_and_tables()
-    logger.info("Database tables initialized")
+    # Blocking request work (plain-def handlers, sync dependencies and
+    # run_in_threadpool calls) runs in AnyIO's threadpool. Size it to one
+    # thread per pooled connection so threads never outnumber the connections
+    # they wait on. Health probes use the loop's default executor and their
+    # own health_engine, so they still answer when request threads are busy.
+    db_connections = settings.db_pool_size + settings.db_max_overflow
+    anyio.to_thread.current_default_thread_limiter().total_tokens = db_connections
+
+    # Create database tables (skipped when the schema is provisioned externally)
+    if settings.auto_create_tables:
+        create_db_and_tables()
+        logger.info("Database tables initialized")
+    else:
+        logger.info("Skipping database table auto-creation")
 
     # Create upload directories
     upload_dir = Path("uploads")
     (upload_dir / "logos").mkdir(parents=True, exist_ok=True)
     logger.info("Upload directories initialized")
 
+    # Shared integration clients (reused by health checks for HTTP keep-alive)
+    app.state.jira_client = JiraClient(settings)
+    app.state.precursive_client = SalesforcePrecursiveClient(settings)
+
     # Log integration status
-    log_integration_status()
+    log_integration_status(app.state.jira_client, app.state.precursive_client)
 
     # Seed QA personas in development mode (idempotent)
     if settings.environment == "development":
@@ -250,6 +222,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Application shutting down")
+    await app.state.jira_client.close()
+    await app.state.precursive_client.close()
 
 
 # ============================================================================
@@ -273,6 +247,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Continuation token of GET /users/
 )
 
 # Request Logging Middleware (logs request completion with timing)
@@ -280,6 +255,11 @@ app.add_middleware(
 # RequestLoggingMiddleware should run after RequestContextMiddleware has set context
 app.add_middleware(RequestLoggingMiddleware)  # type: ignore[arg-type]
 
+# Query Count Middleware (development only: flags N+1 regressions per request)
+if _DEV_MODE:
+    install_statement_counter(engine)
+    app.add_middleware(QueryCountMiddleware)  # type: ignore[arg-type]
+
 # Request Context Middleware (sets correlation IDs and request metadata)
 app.add_middleware(RequestContextMiddleware)  # type: ignore[arg-type]
 
@@ -304,7 +284,7 @@ def create_error_response(
     }
 
     # Include stack trace in development mode
-    if include_trace and exc and settings.environment == "development":
+    if include_trace and exc and _DEV_MODE:
         response["traceback"] = traceback.format_exception(
             type(exc), exc, exc.__traceback__
         )
@@ -312,97 +292,92 @@ def create_error_response(
     return response
 
 
-@app.exception_handler(ResourceNotFoundError)
-async def resource_not_found_handler(request: Request, exc: ResourceNotFoundError):
-    """Handle resource not found errors."""
-    logger.warning("Resource not found", path=request.url.path, detail=str(exc))
-    return JSONResponse(
-        status_code=404,
-        content=create_error_response(404, str(exc), "ResourceNotFoundError"),
-    )
+def _error_body_suffix(error_type: str, status_code: int) -> bytes:
+    """Pre-encode the constant tail of an error envelope (everything after detail)."""
+    return f',"error_type":"{error_type}","status_code":{status_code}}}'.encode()
 
 
-@app.exception_handler(AuthorizationError)
-async def authorization_error_handler(request: Request, exc: AuthorizationError):
-    """Handle authorization errors."""
-    logger.warning("Authorization denied", path=request.url.path, detail=str(exc))
-    return JSONResponse(
-        status_code=403,
-        content=create_error_response(403, str(exc), "AuthorizationError"),
+def fast_error_response(
+    status_code: int,
+    detail: str,
+    suffix: bytes,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Build an error envelope by byte concatenation (no dict, no full encode).
+
+    Produces the same JSON as create_error_response without a traceback; only the
+    detail string is encoded per call.
+    """
+    body = b'{"detail":' + json.dumps(detail, ensure_ascii=False).encode() + suffix
+    return Response(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
     )
 
 
+@functools.cache
+def _suffix_for(exc_type: type[PMAppException]) -> bytes:
+    """Pre-encoded envelope tail per exception class, built on first use."""
+    return _error_body_suffix(exc_type.error_type, exc_type.status_code)
+
+
 @app.exception_handler(AuthenticationError)
 async def authentication_error_handler(request: Request, exc: AuthenticationError):
     """Handle authentication errors."""
     logger.warning("Authentication failed", path=request.url.path, detail=str(exc))
-    return JSONResponse(
-        status_code=401,
-        content=create_error_response(401, str(exc), "AuthenticationError"),
+    return fast_error_response(
+        exc.status_code,
+        str(exc),
+        _suffix_for(type(exc)),
         headers={"WWW-Authenticate": "Bearer"},
     )
 
 
-@app.exception_handler(ValidationError)
-async def validation_error_handler(request: Request, exc: ValidationError):
-    """Handle business validation errors."""
-    logger.warning("Validation error", path=request.url.path, detail=str(exc))
-    return JSONResponse(
-        status_code=400, content=create_error_response(400, str(exc), "ValidationError")
-    )
-
-
-@app.exception_handler(DuplicateResourceError)
-async def duplicate_resource_handler(request: Request, exc: DuplicateResourceError):
-    """Handle duplicate resource errors."""
-    logger.warning("Duplicate resource", path=request.url.path, detail=str(exc))
-    return JSONResponse(
-        status_code=409,
-        content=create_error_response(409, str(exc), "DuplicateResourceError"),
-    )
-
+@app.exception_handler(PMAppException)
+async def pm_app_exception_handler(request: Request, exc: PMAppException):
+    """Handle application errors using the status/error type declared on the class."""
+    status_code = exc.status_code
+    if status_code < 500:
+        logger.warning(
+            "Request rejected",
+            path=request.url.path,
+            error_type=exc.error_type,
+            detail=str(exc),
+        )
+        return fast_error_response(status_code, str(exc), _suffix_for(type(exc)))
 
-@app.exception_handler(IntegrationError)
-async def integration_error_handler(request: Request, exc: IntegrationError):
-    """Handle integration/external service errors."""
     logger.error(
-        "Integration error", path=request.url.path, detail=str(exc), exc_info=exc
-    )
-    return JSONResponse(
-        status_code=502,
-        content=create_error_response(
-            502, str(exc), "IntegrationError", include_trace=True, exc=exc
-        ),
+        "Application error",
+        path=request.url.path,
+        error_type=exc.error_type,
+        detail=str(exc),
+        exc_info=exc,
     )
+    detail = str(exc) if (exc.expose_detail or _DEV_MODE) else _INTERNAL_ERROR_MESSAGE
+    if _DEV_MODE:
+        return JSONResponse(
+            status_code=status_code,
+            content=create_error_response(
+                status_code, detail, exc.error_type, include_trace=True, exc=exc
+            ),
+        )
+    return fast_error_response(status_code, detail, _suffix_for(type(exc)))
 
 
-@app.exception_handler(ConfigurationError)
-async def configuration_error_handler(request: Request, exc: ConfigurationError):
-    """Handle configuration errors."""
-    logger.error("Configuration error", path=request.url.path, detail=str(exc))
-    return JSONResponse(
-        status_code=500,
-        content=create_error_response(500, str(exc), "ConfigurationError"),
-    )
+_POOL_EXHAUSTED_SUFFIX = _error_body_suffix("ServiceUnavailable", 503)
 
 
-@app.exception_handler(PMAppException)
-async def pm_app_exception_handler(request: Request, exc: PMAppException):
-    """Handle general application errors."""
-    logger.error(
-        "Application error", path=request.url.path, detail=str(exc), exc_info=exc
-    )
-    return JSONResponse(
-        status_code=500,
-        content=create_error_response(
-            500,
-            str(exc)
-            if settings.environment == "development"
-            else "An internal error occurred",
-            "PMAppException",
-            include_trace=True,
-            exc=exc,
-        ),
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """Shed load with a 503 when no pooled connection frees up in time."""
+    logger.warning("Database pool exhausted", path=request.url.path, pool=pool_stats())
+    return fast_error_response(
+        503,
+        _POOL_EXHAUSTED_MESSAGE,
+        _POOL_EXHAUSTED_SUFFIX,
+        headers={"Retry-After": "1"},
     )
 
 
@@ -414,9 +389,7 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
         status_code=500,
         content=create_error_response(
             500,
-            str(exc)
-            if settings.environment == "development"
-            else "An unexpected error occurred",
+            str(exc) if _DEV_MODE else _UNEXPECTED_ERROR_MESSAGE,
             type(exc).__name__,
             include_trace=True,
             exc=exc,
@@ -444,6 +417,17 @@ app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 # Health & Status Endpoints
 # ============================================================================
 
+# Upper bound for any single external dependency check in /health
+HEALTH_CHECK_TIMEOUT_SECONDS = 2.0
+
+# Static service statuses reused across /health calls (never mutated).
+_NOT_CONFIGURED_STATUS: dict[str, Any] = {"status": "not_configured"}
+_PRECURSIVE_CONFIGURED_STATUS: dict[str, Any] = {
+    "status": "configured",
+    "type": "salesforce",
+    "note": "Connection tested on first sync to preserve API rate limits",
+}
+
 
 @app.get("/")
 def read_root():
@@ -456,59 +440,88 @@ def read_root():
     }
 
 
+def _ping_health_database() -> None:
+    """Run a trivial query on the dedicated health-check pool."""
+    with health_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+async def _check_database() -> tuple[dict[str, Any], bool]:
+    """Probe the database off the event loop. Returns (status, degraded)."""
+    try:
+        await asyncio.wait_for(
+            asyncio.to_thread(_ping_health_database),
+            timeout=HEALTH_CHECK_TIMEOUT_SECONDS,
+        )
+        return {"status": "connected"}, False
+    except asyncio.TimeoutError:
+        return {"status": "timeout"}, True
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": str(e) if _DEV_MODE else "Connection failed",
+        }, True
+
+
+async def _check_jira(jira_client: JiraClient) -> tuple[dict[str, Any], bool]:
+    """Probe Jira (if configured) with a bounded timeout. Returns (status, degraded)."""
+    if not jira_client.is_configured:
+        return _NOT_CONFIGURED_STATUS, False
+    try:
+        # Bound the probe so a stalled Jira cannot hang /health
+        jira_status = await asyncio.wait_for(
+            jira_client.test_connection(), timeout=HEALTH_CHECK_TIMEOUT_SECONDS
+        )
+        return jira_status, False
+    except asyncio.TimeoutError:
+        return {"status": "timeout"}, True
+    except IntegrationError as e:
+        return {"status": "error", "error": str(e)}, True
+
+
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """
     Comprehensive health check endpoint.
     Returns status of all services and connections.
     """
+    jira_client: JiraClient = request.app.state.jira_client
+    precursive_client: SalesforcePrecursiveClient = request.app.state.precursive_client
+
+    # Probes are independent, so run them concurrently: latency is the slowest
+    # probe rather than the sum of all of them.
+    results = await asyncio.gather(
+        _check_database(),
+        _check_jira(jira_client),
+        return_exceptions=True,
+    )
+
     health_status: dict[str, Any] = {
         "status": "healthy",
         "environment": settings.environment,
         "services": {},
     }
-
-    # Check database connection
-    try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-        health_status["services"]["database"] = {"status": "connected"}
-    except Exception as e:
-        health_status["status"] = "degraded"
-        health_status["services"]["database"] = {
-            "status": "error",
-            "error": str(e)
-            if settings.environment == "development"
-            else "Connection failed",
-        }
-
-    # Check Jira connection (if configured)
-    jira_client = JiraClient(settings)
-    if jira_client.is_configured:
-        try:
-            jira_status = await jira_client.test_connection()
-            health_status["services"]["jira"] = jira_status
-        except IntegrationError as e:
+    for name, result in zip(("database", "jira"), results):
+        if isinstance(result, BaseException):
+            health_status["status"] = "degraded"
+            health_status["services"][name] = {
+                "status": "error",
+                "error": str(result) if _DEV_MODE else "Check failed",
+            }
+            continue
+        service_status, degraded = result
+        health_status["services"][name] = service_status
+        if degraded:
             health_status["status"] = "degraded"
-            health_status["services"]["jira"] = {"status": "error", "error": str(e)}
-        finally:
-            await jira_client.close()
-    else:
-        health_status["services"]["jira"] = {"status": "not_configured"}
 
     # Check Precursive configuration status (no API calls to preserve rate limits)
-    precursive_client = SalesforcePrecursiveClient(settings)
     if precursive_client.is_configured:
         # Report configured status without making actual Salesforce API calls
         # to preserve rate limits. Actual connection is tested on first sync.
-        health_status["services"]["precursive"] = {
-            "status": "configured",
-            "type": "salesforce",
-            "note": "Connection tested on first sync to preserve API rate limits",
-        }
+        health_status["services"]["precursive"] = _PRECURSIVE_CONFIGURED_STATUS
     else:
         # Precursive is optional - not having it configured is not an error
-        health_status["services"]["precursive"] = {"status": "not_configured"}
+        health_status["services"]["precursive"] = _NOT_CONFIGURED_STATUS
 
     # Set appropriate HTTP status code
     status_code = 200 if health_status["status"] == "healthy" else 503
@@ -522,6 +535,15 @@ def liveness_check():
     return {"status": "alive"}
 
 
+@app.get("/health/pool")
+async def pool_status(_: CogniterUser):
+    """Request pool occupancy (checked out / overflow), for capacity tuning.
+
+    Authenticated unlike the other probes: it reveals deployment sizing.
+    """
+    return pool_stats()
+
+
 @app.get("/health/ready")
 async def readiness_check():
     """
@@ -529,9 +551,17 @@ async def readiness_check():
     Checks database connectivity.
     """
     try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        # Run the ping off the event loop so a slow database cannot stall the worker
+        await asyncio.wait_for(
+            asyncio.to_thread(_ping_health_database),
+            timeout=HEALTH_CHECK_TIMEOUT_SECONDS,
+        )
         return {"status": "ready"}
+    except asyncio.TimeoutError:
+        logger.error("Readiness check timed out")
+        return JSONResponse(
+            status_code=503, content={"status": "not_ready", "error": "timeout"}
+        )
     except Exception as e:
         logger.error("Readiness check failed", error=str(e))
         return JSONResponse(
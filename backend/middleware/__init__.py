@@ -1,6 +1,12 @@
 """Middleware package."""
 
 from middleware.logging import RequestLoggingMiddleware
+from middleware.query_count import QueryCountMiddleware, install_statement_counter
 from middleware.request_context import RequestContextMiddleware
 
-__all__ = ["RequestContextMiddleware", "RequestLoggingMiddleware"]
+__all__ = [
+    "QueryCountMiddleware",
+    "RequestContextMiddleware",
+    "RequestLoggingMiddleware",
+    "install_statement_counter",
+]
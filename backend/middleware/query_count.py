@@ -0,0 +1,59 @@
+"""Development middleware that counts SQL statements executed per request."""
+
+from contextvars import ContextVar
+
+import structlog
+from sqlalchemy import Engine, event
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = structlog.get_logger()
+
+# Holds a one-element list so increments made in threadpool workers (which run
+# in a copy of the request context) are visible to the middleware.
+_statement_counter: ContextVar[list[int] | None] = ContextVar(
+    "statement_counter", default=None
+)
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    counter = _statement_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def install_statement_counter(engine: Engine) -> None:
+    """Count every statement executed on ``engine`` against the current request."""
+    event.listen(engine, "before_cursor_execute", _count_statement)
+
+
+class QueryCountMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that logs how many SQL statements each request executed.
+
+    Requests above ``threshold`` are logged as warnings so N+1 regressions
+    surface immediately during development. Requires install_statement_counter().
+    """
+
+    def __init__(self, app, threshold: int = 20):
+        super().__init__(app)
+        self.threshold = threshold
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        counter = [0]
+        token = _statement_counter.set(counter)
+        try:
+            response = await call_next(request)
+        finally:
+            _statement_counter.reset(token)
+
+        log = getattr(request.state, "log", logger)
+        if counter[0] > self.threshold:
+            log.warning(
+                "high_query_count", statements=counter[0], threshold=self.threshold
+            )
+        else:
+            log.debug("request_queries", statements=counter[0])
+
+        return response
@@ -4,6 +4,8 @@
 
 from enum import Enum
 
+from sqlalchemy.orm import configure_mappers
+
 
 class UserRole(str, Enum):
     COGNITER = "Cogniter"
@@ -57,6 +59,10 @@ from models.risk import Risk
 from models.sync_job import SyncJob, SyncJobStatus, SyncJobType
 from models.user import User
 
+# Resolve relationships/back-populates once at import time so the first query
+# in a worker does not pay for mapper configuration (and misconfigurations fail fast).
+configure_mappers()
+
 __all__ = [
     # Enums
     "UserRole",
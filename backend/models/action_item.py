@@ -4,19 +4,68 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
+from sqlalchemy import ColumnElement, Index, column, func, literal_column, text
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlmodel import Field, Relationship, SQLModel
 
 from models import ActionStatus, Priority
+from models.ids import new_id
 
 if TYPE_CHECKING:
     from models.comment import Comment
     from models.project import Project
 
 
+# 'simple' config: no stemming or stop words, so Jira keys and names match as typed
+ACTION_SEARCH_CONFIG = literal_column("'simple'", REGCONFIG)
+
+
+def action_search_document(title, jira_id) -> ColumnElement:
+    """Full-text document searched by the action list (PostgreSQL only).
+
+    Literal arguments keep the expression identical between the GIN index
+    on ActionItem and the query in ActionRepository, so the planner can
+    match them.
+    """
+    empty = literal_column("''")
+    return func.to_tsvector(
+        ACTION_SEARCH_CONFIG,
+        func.coalesce(title, empty)
+        .op("||")(literal_column("' '"))
+        .op("||")(func.coalesce(jira_id, empty)),
+    )
+
+
 class ActionItem(SQLModel, table=True):
     """Action Item model for project tasks and actions."""
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    __table_args__ = (
+        # Query patterns: list actions for a project filtered by status and
+        # ordered by due date, or grouped/ordered by priority
+        Index("ix_actionitem_project_status_due", "project_id", "status", "due_date"),
+        Index("ix_actionitem_project_priority", "project_id", "priority"),
+        # Keyset pagination: WHERE project_id = ? AND id < ? ORDER BY id DESC
+        # (a backward range scan serves the descending order)
+        Index("ix_actionitem_project_keyset", "project_id", "id"),
+        # Same keyset over open actions only, for page_by_project called with
+        # statuses=[TO_DO, IN_PROGRESS] (?status=TO_DO&status=IN_PROGRESS on
+        # the action list); a fraction of the rows once most are complete
+        Index(
+            "ix_actionitem_project_open_keyset",
+            "project_id",
+            "id",
+            postgresql_where=text("status IN ('TO_DO', 'IN_PROGRESS')"),
+            sqlite_where=text("status IN ('TO_DO', 'IN_PROGRESS')"),
+        ),
+        # Word search on title / Jira id (see action_search_document)
+        Index(
+            "ix_actionitem_search",
+            action_search_document(column("title"), column("jira_id")),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    id: uuid.UUID = Field(default_factory=new_id, primary_key=True)
     project_id: uuid.UUID = Field(foreign_key="project.id", index=True)
     title: str
     status: ActionStatus = Field(default=ActionStatus.TO_DO)
@@ -32,6 +81,15 @@ class ActionItem(SQLModel, table=True):
     # Sync tracking
     last_synced_at: Optional[datetime] = None
 
+    # Denormalized number of comments, bumped in the same transaction as each
+    # new comment so list queries read it straight off the row
+    comment_count: int = Field(
+        default=0, sa_column_kwargs={"server_default": "0", "nullable": False}
+    )
+
     # Relationships
     project: "Project" = Relationship(back_populates="actions")
-    comments: List["Comment"] = Relationship(back_populates="action_item")
+    # Read-only reverse side: comments are written through action_item_id
+    comments: List["Comment"] = Relationship(
+        back_populates="action_item", sa_relationship_kwargs={"viewonly": True}
+    )
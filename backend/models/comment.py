@@ -1,12 +1,14 @@
 """Comment model."""
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import CheckConstraint, Index
+from sqlalchemy import CheckConstraint, Column, DateTime, Index, func, text
 from sqlmodel import Field, Relationship, SQLModel
 
+from models.ids import new_id
+
 if TYPE_CHECKING:
     from models.action_item import ActionItem
     from models.risk import Risk
@@ -20,6 +22,9 @@ class Comment(SQLModel, table=True):
     Exactly one of action_item_id or risk_id should be set.
     """
 
+    # Return the server-filled created_at from the INSERT itself (RETURNING)
+    # instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         # Enforce exactly one parent reference (action_item_id XOR risk_id)
         CheckConstraint(
@@ -27,23 +32,40 @@ class Comment(SQLModel, table=True):
             "(action_item_id IS NULL AND risk_id IS NOT NULL)",
             name="ck_comment_exactly_one_parent",
         ),
-        # Query patterns: list comments for a parent ordered by created_at
-        Index("ix_comment_action_item_id_created_at", "action_item_id", "created_at"),
-        Index("ix_comment_risk_id_created_at", "risk_id", "created_at"),
+        # Query patterns: list comments for a parent ordered by created_at.
+        # Partial indexes skip the rows whose FK is NULL (roughly half of each),
+        # and also serve plain parent_id lookups, so the FKs need no own index.
+        Index(
+            "ix_comment_action_item_id_created_at",
+            "action_item_id",
+            "created_at",
+            postgresql_where=text("action_item_id IS NOT NULL"),
+            sqlite_where=text("action_item_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_comment_risk_id_created_at",
+            "risk_id",
+            "created_at",
+            postgresql_where=text("risk_id IS NOT NULL"),
+            sqlite_where=text("risk_id IS NOT NULL"),
+        ),
     )
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=new_id, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="user.id")
     content: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Filled in by the database on INSERT (no per-row Python callback)
+    created_at: datetime = Field(
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=False
+        )
+    )
 
     # Parent references (one should be set, not both)
     action_item_id: Optional[uuid.UUID] = Field(
-        default=None, foreign_key="actionitem.id", index=True
-    )
-    risk_id: Optional[uuid.UUID] = Field(
-        default=None, foreign_key="risk.id", index=True
+        default=None, foreign_key="actionitem.id"
     )
+    risk_id: Optional[uuid.UUID] = Field(default=None, foreign_key="risk.id")
 
     # Relationships
     action_item: Optional["ActionItem"] = Relationship(back_populates="comments")
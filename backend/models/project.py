@@ -1,10 +1,11 @@
 from datetime import date, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel
 
+from models.ids import new_id
 from models.links import UserProjectLink
 
 if TYPE_CHECKING:
@@ -82,8 +83,13 @@ class ProjectBase(SQLModel):
     precursive_status_summary: Optional[str] = None  # Overall status summary text
 
 
+# Budget columns hidden from users who may not view financials
+# (see permissions.can_view_financials)
+PROJECT_FINANCIAL_FIELDS = ("total_budget", "spent_budget", "remaining_budget")
+
+
 class Project(ProjectBase, table=True):
-    id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
+    id: Optional[UUID] = Field(default_factory=new_id, primary_key=True)
     health_status: HealthStatus = Field(default=HealthStatus.GREEN)
     last_synced_at: Optional[datetime] = None
 
@@ -91,5 +97,10 @@ class Project(ProjectBase, table=True):
     users: List["User"] = Relationship(
         back_populates="projects", link_model=UserProjectLink
     )
-    actions: List["ActionItem"] = Relationship(back_populates="project")
-    risks: List["Risk"] = Relationship(back_populates="project")
+    # Read-only reverse sides: children are written through their project_id FK
+    actions: List["ActionItem"] = Relationship(
+        back_populates="project", sa_relationship_kwargs={"viewonly": True}
+    )
+    risks: List["Risk"] = Relationship(
+        back_populates="project", sa_relationship_kwargs={"viewonly": True}
+    )
@@ -4,9 +4,11 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from models import RiskImpact, RiskProbability, RiskStatus
+from models.ids import new_id
 
 if TYPE_CHECKING:
     from models.comment import Comment
@@ -16,7 +18,12 @@ if TYPE_CHECKING:
 class Risk(SQLModel, table=True):
     """Risk model for project risk tracking."""
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    __table_args__ = (
+        # Query pattern: open/closed risks per project
+        Index("ix_risk_project_status", "project_id", "status"),
+    )
+
+    id: uuid.UUID = Field(default_factory=new_id, primary_key=True)
     project_id: uuid.UUID = Field(foreign_key="project.id", index=True)
     title: str = Field(default="")
     description: str
@@ -46,4 +53,7 @@ class Risk(SQLModel, table=True):
     # Note: resolved_by and reopened_by relationships removed due to SQLModel
     # limitations with multiple FKs to the same table. Use resolved_by_id and
     # reopened_by_id foreign keys directly instead.
-    comments: List["Comment"] = Relationship(back_populates="risk")
+    # Read-only reverse side: comments are written through risk_id
+    comments: List["Comment"] = Relationship(
+        back_populates="risk", sa_relationship_kwargs={"viewonly": True}
+    )
@@ -1,12 +1,15 @@
 """Sync Job model for tracking background sync operations."""
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from sqlalchemy import Column, DateTime, Index, func, text
 from sqlmodel import Field, SQLModel
 
+from models.ids import new_id
+
 
 class SyncJobType(str, Enum):
     """Type of sync operation."""
@@ -34,17 +37,74 @@ class SyncJob(SQLModel, table=True):
     """
 
     __tablename__ = "syncjob"
+    # Return the server-filled created_at from the INSERT itself (RETURNING)
+    # instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Status polling: jobs for a project and type, by status, newest
+        # first. Also serves project_id-only lookups (leading column).
+        Index(
+            "ix_syncjob_project_type_status_created",
+            "project_id",
+            "job_type",
+            "status",
+            "created_at",
+        ),
+        # Last succeeded/completed job per project and type: backward scan on
+        # completed_at streams newest first. Only terminal rows have a
+        # completed_at, so the index skips queued/running jobs.
+        # Enum columns store member names, hence the upper-case literals.
+        Index(
+            "ix_syncjob_project_type_completed",
+            "project_id",
+            "job_type",
+            "completed_at",
+            postgresql_where=text("status IN ('SUCCEEDED', 'FAILED')"),
+            sqlite_where=text("status IN ('SUCCEEDED', 'FAILED')"),
+        ),
+        # Dedupe / status card (get_running_job): at most one in-flight job
+        # per project and type, enforced by the database so concurrent
+        # enqueues cannot both insert. Holds only QUEUED/RUNNING rows, so it
+        # stays O(active jobs) however much job history accumulates.
+        Index(
+            "ix_syncjob_active_project_type",
+            "project_id",
+            "job_type",
+            unique=True,
+            postgresql_where=text("status IN ('QUEUED', 'RUNNING')"),
+            sqlite_where=text("status IN ('QUEUED', 'RUNNING')"),
+        ),
+        # Tiny index over in-flight jobs only (pending sweeps, stuck-job checks).
+        Index(
+            "ix_syncjob_active",
+            "status",
+            "created_at",
+            postgresql_where=text("status IN ('QUEUED', 'RUNNING')"),
+            sqlite_where=text("status IN ('QUEUED', 'RUNNING')"),
+        ),
+    )
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    project_id: uuid.UUID = Field(foreign_key="project.id", index=True)
+    id: uuid.UUID = Field(default_factory=new_id, primary_key=True)
+    project_id: uuid.UUID = Field(foreign_key="project.id")
     job_type: SyncJobType
     status: SyncJobStatus = Field(default=SyncJobStatus.QUEUED)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Filled in by the database on INSERT (no per-row Python callback)
+    created_at: datetime = Field(
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=False
+        )
+    )
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
+    # Lease held by the runner of a RUNNING job: a fresh claim_id per claim
+    # fences out a runner whose job was requeued, and heartbeat_at is
+    # refreshed while it works so live long syncs are never treated as stale
+    claim_id: Optional[uuid.UUID] = None
+    heartbeat_at: Optional[datetime] = None
+
     # Tracking
     requested_by_user_id: Optional[uuid.UUID] = Field(
         default=None, foreign_key="user.id"
@@ -3,9 +3,11 @@
 import uuid
 from typing import TYPE_CHECKING, List
 
+from sqlalchemy import Index, column, event, func
 from sqlmodel import Field, Relationship, SQLModel
 
 from models import AuthProvider, UserRole
+from models.ids import new_id
 from models.links import UserProjectLink
 
 if TYPE_CHECKING:
@@ -16,7 +18,27 @@ if TYPE_CHECKING:
 class User(SQLModel, table=True):
     """User model representing both Cogniters and Clients."""
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    __table_args__ = (
+        # Substring search (ILIKE '%term%') on name / email; needs pg_trgm
+        Index(
+            "ix_user_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_user_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        # Keyset-paginated user search ordered by (name, id)
+        Index("ix_user_name_id", "name", "id"),
+        # Case-insensitive email lookups: lower(email) = ? hits this directly
+        Index("ix_user_email_lower", func.lower(column("email")), unique=True),
+    )
+
+    id: uuid.UUID = Field(default_factory=new_id, primary_key=True)
     email: str = Field(index=True, unique=True)
     name: str
     role: UserRole
@@ -30,4 +52,17 @@ class User(SQLModel, table=True):
     projects: List["Project"] = Relationship(
         back_populates="users", link_model=UserProjectLink
     )
-    comments: List["Comment"] = Relationship(back_populates="user")
+    # Read-only reverse side: comments are written through user_id
+    comments: List["Comment"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"viewonly": True}
+    )
+
+
+# Mapper events rather than @validates: SQLModel's __init__ bypasses
+# attribute validators, while these run for every flushed INSERT/UPDATE
+@event.listens_for(User, "before_insert")
+@event.listens_for(User, "before_update")
+def _normalize_email(mapper, connection, user: User) -> None:
+    """Store emails lower-cased so lookups can compare case-insensitively."""
+    if user.email:
+        user.email = user.email.strip().lower()
@@ -1,8 +1,12 @@
 """
-Centralized permission logic using pure functions.
+Centralized permission logic using simple functions.
 
 This module provides simple, testable permission checks for role-based access control.
-All functions are pure (no side effects) and take a User object as input.
+Every check takes a User object and depends only on its role. The one side
+effect is a per-instance memo: the first check stores the role's bitmask in the
+user's ``__dict__`` (``_caps_cached``). SQLAlchemy listeners drop it when the
+role is set or the instance is refreshed or expired, so it never outlives the
+role it was computed from.
 
 Role Hierarchy:
 - COGNITER: Internal Cognite employees - full access to everything
@@ -12,27 +16,86 @@ Role Hierarchy:
 All client roles (CLIENT, CLIENT_FINANCIALS) require explicit project assignment
 to access project data. This is enforced at the router/service level, not here.
 
-Note on Redundancy:
-Several functions below (can_manage_team, can_edit_project, can_create_project,
-can_resolve_risk, can_reopen_risk, can_delete_action, can_update_risk, can_delete_risk,
-can_publish_project) have identical implementations: `return user.role == UserRole.COGNITER`.
-
-This is intentional for:
+Each role maps to a precomputed capability bitmask (see ``Cap``), so a check is
+a dict lookup and a single ``&``. Most capabilities are granted only to
+COGNITER, yet each keeps its own bit and function. This is intentional for:
 1. Semantic clarity - each function documents a specific capability
 2. Future flexibility - permissions can evolve independently without refactoring callers
 3. Explicit access control - callers import the specific permission they need
 """
 
+from enum import IntFlag
+
+from sqlalchemy import event
+
 from models import User, UserRole
 
 
+class Cap(IntFlag):
+    """Capability bits granted to roles."""
+
+    INTERNAL = 1
+    VIEW_FINANCIALS = 2
+    MANAGE_TEAM = 4
+    EDIT_PROJECT = 8
+    CREATE_PROJECT = 16
+    PUBLISH_PROJECT = 32
+    RESOLVE_RISK = 64
+    REOPEN_RISK = 128
+    UPDATE_RISK = 256
+    DELETE_RISK = 512
+    DELETE_ACTION = 1024
+
+
+# Stored as plain ints: bitwise ops on IntFlag members build new flag objects
+_ROLE_CAPS: dict[UserRole, int] = {
+    UserRole.COGNITER: int(~Cap(0)),  # Every capability
+    UserRole.CLIENT_FINANCIALS: int(Cap.VIEW_FINANCIALS),
+    UserRole.CLIENT: 0,
+}
+
+
+# Instance attribute holding the memoized bitmask (plain int in __dict__)
+_CAPS_ATTR = "_caps_cached"
+
+
+def _caps_for(user: User) -> int:
+    """Return the user's capability bitmask, memoized on the instance.
+
+    The first check on a user resolves the role once; later checks in the same
+    request read a plain int. The memo is dropped whenever role is set,
+    refreshed or expired (see listeners below).
+    """
+    caps = user.__dict__.get(_CAPS_ATTR)
+    if caps is None:
+        caps = _ROLE_CAPS.get(user.role, 0)
+        user.__dict__[_CAPS_ATTR] = caps
+    return caps
+
+
+def _has_cap(user: User, cap: Cap) -> bool:
+    """Check a capability bit against the user's role bitmask."""
+    return (_caps_for(user) & cap._value_) != 0
+
+
+@event.listens_for(User.role, "set")
+def _reset_caps_on_role_change(target, value, oldvalue, initiator):
+    target.__dict__.pop(_CAPS_ATTR, None)
+
+
+@event.listens_for(User, "refresh")
+@event.listens_for(User, "expire")
+def _reset_caps_on_reload(target, *args):
+    target.__dict__.pop(_CAPS_ATTR, None)
+
+
 def is_internal_user(user: User) -> bool:
     """
     Check if user is an internal Cognite employee.
 
     Internal users have full access to all features and all projects.
     """
-    return user.role == UserRole.COGNITER
+    return _has_cap(user, Cap.INTERNAL)
 
 
 def can_view_financials(user: User) -> bool:
@@ -42,7 +105,7 @@ def can_view_financials(user: User) -> bool:
     Allowed for: COGNITER, CLIENT_FINANCIALS
     Denied for: CLIENT
     """
-    return user.role in (UserRole.COGNITER, UserRole.CLIENT_FINANCIALS)
+    return _has_cap(user, Cap.VIEW_FINANCIALS)
 
 
 def can_manage_team(user: User) -> bool:
@@ -52,7 +115,7 @@ def can_manage_team(user: User) -> bool:
     This includes assigning/removing users and sending invitations.
     Only internal users (Cogniters) can manage teams.
     """
-    return user.role == UserRole.COGNITER
+    return _has_cap(user, Cap.MANAGE_TEAM)
 
 
 def can_edit_project(user: User) -> bool:
@@ -62,7 +125,7 @@ def can_edit_project(user: User) -> bool:
     This includes changing project name, URLs, health status, etc.
     Only internal users (Cogniters) can edit projects.
     """
-    return user.role == UserRole.COGNITER
+    return _has_cap(user, Cap.EDIT_PROJECT)
 
 
 def can_create_project(user: User) -> bool:
@@ -71,7 +134,7 @@ def can_create_project(user: User) -> bool:
 
     Only internal users (Cogniters) can create projects.
     """
-    return user.role == UserRole.COGNITER
+    return _has_cap(user, Cap.CREATE_PROJECT)
 
 
 def can_resolve_risk(user: User) -> bool:
@@ -81,7 +144,7 @@ def can_resolve_risk(user: User) -> bool:
     Only internal users (Cogniters) can change risk status.
     Clients can comment on risks but not resolve them.
     """
-    return user.role == UserRole.COGNITER
+    return _has_cap(user, Cap.RESOLVE_RISK)
 
 
 def can_reopen_risk(user: User) -> bool:
@@ -90,7 +153,7 @@ def can_reopen_risk(user: User) -> bool:
 
     Only internal users (Cogniters) can reopen risks.
     """
-    return user.role == UserRole.COGNITER
+    return _has_cap(user, Cap.REOPEN_RISK)
 
 
 def can_delete_action(user: User) -> bool:
@@ -99,7 +162,7 @@ def can_delete_action(user: User) -> bool:
 
     Only internal users (Cogniters) can delete action items.
     """
-    return user.role == UserRole.COGNITER
+    return _has_cap(user, Cap.DELETE_ACTION)
 
 
 def can_update_risk(user: User) -> bool:
@@ -108,7 +171,7 @@ def can_update_risk(user: User) -> bool:
 
     Only internal users (Cogniters) can update risks.
     """
-    return user.role == UserRole.COGNITER
+    return _has_cap(user, Cap.UPDATE_RISK)
 
 
 def can_delete_risk(user: User) -> bool:
@@ -117,7 +180,7 @@ def can_delete_risk(user: User) -> bool:
 
     Only internal users (Cogniters) can delete risks.
     """
-    return user.role == UserRole.COGNITER
+    return _has_cap(user, Cap.DELETE_RISK)
 
 
 def can_publish_project(user: User) -> bool:
@@ -126,4 +189,4 @@ def can_publish_project(user: User) -> bool:
 
     Only internal users (Cogniters) can publish/unpublish projects.
     """
-    return user.role == UserRole.COGNITER
+    return _has_cap(user, Cap.PUBLISH_PROJECT)
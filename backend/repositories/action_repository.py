@@ -1,11 +1,13 @@
 """Action repository."""
 
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import ColumnElement, lambda_stmt, or_
 from sqlmodel import Session, col, func, select
 
 from models import ActionItem, ActionStatus
+from models.action_item import ACTION_SEARCH_CONFIG, action_search_document
 from repositories.base import BaseRepository
 
 
@@ -15,81 +17,155 @@ class ActionRepository(BaseRepository[ActionItem]):
     def __init__(self, session: Session):
         super().__init__(ActionItem, session)
 
+    def find(
+        self,
+        project_id: UUID,
+        *,
+        status: Optional[ActionStatus] = None,
+        assignee: Optional[str] = None,
+    ) -> List[ActionItem]:
+        """Get a project's action items, optionally filtered by status/assignee.
+
+        One lambda_stmt whose optional filters are appended as further lambdas,
+        so each filter combination is built and cache-keyed once and the
+        values always travel as bound parameters.
+        """
+        statement = lambda_stmt(
+            lambda: select(ActionItem).where(ActionItem.project_id == project_id)
+        )
+        if status is not None:
+            statement += lambda s: s.where(ActionItem.status == status)
+        if assignee is not None:
+            statement += lambda s: s.where(ActionItem.assignee == assignee)
+        return list(self.session.exec(statement).scalars().all())
+
     def get_by_project(self, project_id: UUID) -> List[ActionItem]:
         """Get all action items for a project."""
-        statement = select(ActionItem).where(ActionItem.project_id == project_id)
-        return list(self.session.exec(statement).all())
+        return self.find(project_id)
+
+    def count_by_project(self, project_id: UUID) -> int:
+        """Count the action items in a project."""
+        statement = select(func.count()).where(ActionItem.project_id == project_id)
+        return self.session.exec(statement).one()
+
+    def iter_batches_by_project(
+        self, project_id: UUID, batch_size: int = 500
+    ) -> Iterator[List[ActionItem]]:
+        """Stream a project's action items in batches of up to batch_size.
+
+        Uses yield_per, so rows are fetched (server-side cursor on PostgreSQL)
+        and hydrated one batch at a time instead of all at once. Iterate while
+        the session is still open.
+        """
+        statement = (
+            select(ActionItem)
+            .where(ActionItem.project_id == project_id)
+            .execution_options(yield_per=batch_size)
+        )
+        for batch in self.session.exec(statement).partitions():
+            yield list(batch)
+
+    @staticmethod
+    def search_filter(search: str, dialect: str) -> ColumnElement[bool]:
+        """Predicate matching ``search`` against an action's title or jira_id.
+
+        On PostgreSQL this is full-text search over the GIN-indexed
+        action_search_document: whole words in any order, case-insensitive,
+        unstemmed ('simple' config), so "login" matches "Fix login bug" but
+        "log" does not. Other databases (SQLite in tests and local
+        development) fall back to a case-insensitive substring match, where
+        "log" matches too.
+        """
+        if dialect == "postgresql":
+            document = action_search_document(ActionItem.title, ActionItem.jira_id)
+            return document.bool_op("@@")(
+                func.plainto_tsquery(ACTION_SEARCH_CONFIG, search)
+            )
+        pattern = f"%{search}%"
+        return or_(
+            col(ActionItem.title).ilike(pattern), col(ActionItem.jira_id).ilike(pattern)
+        )
 
     def page_by_project(
         self,
         project_id: UUID,
         limit: int = 25,
-        offset: int = 0,
+        cursor_id: Optional[UUID] = None,
         search: Optional[str] = None,
         statuses: Optional[List[ActionStatus]] = None,
-    ) -> Tuple[List[ActionItem], int]:
+        with_total: bool = True,
+    ) -> Tuple[List[ActionItem], Optional[int], Optional[UUID]]:
         """
-        Get paginated action items for a project with optional filtering.
+        Get a keyset-paginated page of action items for a project.
+
+        Pages are ordered by id descending; passing the last id of the
+        previous page as ``cursor_id`` continues from there without the
+        scan-and-discard cost of OFFSET.
 
         Args:
             project_id: The project UUID
             limit: Maximum number of results (default 25)
-            offset: Number of results to skip (default 0)
-            search: Optional search term for title or jira_id
+            cursor_id: Return only actions with an id below this one
+            search: Optional search term for title or jira_id (see
+                search_filter for how matching differs by database)
             statuses: Optional list of statuses to filter by
+            with_total: Count all matching rows (one extra query); skip when
+                the caller only needs to know whether there is a next page
 
         Returns:
-            Tuple of (list of actions, total count matching filters)
+            Tuple of (list of actions, total count matching filters or None,
+            cursor for the next page or None on the last page)
         """
         # Build base query
         base_query = select(ActionItem).where(ActionItem.project_id == project_id)
 
-        # Apply search filter
         if search:
-            search_pattern = f"%{search}%"
-            base_query = base_query.where(
-                col(ActionItem.title).ilike(search_pattern)
-                | col(ActionItem.jira_id).ilike(search_pattern)
-            )
+            dialect = self.session.get_bind().dialect.name
+            base_query = base_query.where(self.search_filter(search, dialect))
 
         # Apply status filter
         if statuses:
             base_query = base_query.where(col(ActionItem.status).in_(statuses))
 
-        # Get total count (before pagination)
-        count_query = select(func.count()).select_from(base_query.subquery())
-        total = self.session.exec(count_query).one()
-
-        # Apply pagination and ordering (order by id since ActionItem has no created_at)
-        paginated_query = (
-            base_query.order_by(ActionItem.id.desc())  # type: ignore[union-attr]
-            .offset(offset)
-            .limit(limit)
+        # Keyset pagination on the (project_id, id) index; ids are
+        # time-ordered UUIDv7 so descending id is newest first
+        paginated_query = base_query
+        if cursor_id is not None:
+            paginated_query = paginated_query.where(col(ActionItem.id) < cursor_id)
+        paginated_query = paginated_query.order_by(col(ActionItem.id).desc()).limit(
+            limit
         )
-
         items = list(self.session.exec(paginated_query).all())
-        return items, total
+
+        total = None
+        if with_total:
+            # Separate count over the filters only (not the cursor), so the
+            # page query itself stays a bounded index range scan
+            count_query = select(func.count()).select_from(base_query.subquery())
+            total = self.session.exec(count_query).one()
+
+        next_cursor = items[-1].id if len(items) == limit else None
+        return items, total, next_cursor
 
     def get_by_jira_key(self, jira_key: str) -> Optional[ActionItem]:
         """Get action item by Jira key."""
-        statement = select(ActionItem).where(ActionItem.jira_key == jira_key)
-        return self.session.exec(statement).first()
+        # lambda_stmt: per-issue lookup during sync, so skip rebuilding it
+        statement = lambda_stmt(
+            lambda: select(ActionItem).where(ActionItem.jira_key == jira_key).limit(1)
+        )
+        return self.session.scalar(statement)
 
     def get_by_status(self, project_id: UUID, status: ActionStatus) -> List[ActionItem]:
         """Get action items filtered by status."""
-        statement = select(ActionItem).where(
-            ActionItem.project_id == project_id, ActionItem.status == status
-        )
-        return list(self.session.exec(statement).all())
+        return self.find(project_id, status=status)
 
     def get_by_assignee(self, project_id: UUID, assignee: str) -> List[ActionItem]:
         """Get action items assigned to a specific person."""
-        statement = select(ActionItem).where(
-            ActionItem.project_id == project_id, ActionItem.assignee == assignee
-        )
-        return list(self.session.exec(statement).all())
+        return self.find(project_id, assignee=assignee)
 
     def get_by_jira_id(self, jira_id: str) -> Optional[ActionItem]:
         """Get action item by Jira internal ID."""
-        statement = select(ActionItem).where(ActionItem.jira_id == jira_id)
-        return self.session.exec(statement).first()
+        statement = lambda_stmt(
+            lambda: select(ActionItem).where(ActionItem.jira_id == jira_id).limit(1)
+        )
+        return self.session.scalar(statement)
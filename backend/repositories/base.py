@@ -1,8 +1,10 @@
 """Base repository with common CRUD operations."""
 
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import Any, Generic, List, Optional, Type, TypeVar, Union
 from uuid import UUID
 
+from sqlalchemy import exists, insert
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlmodel import Session, SQLModel, select
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
@@ -15,8 +17,21 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.session = session
 
+    def _dialect_insert(
+        self, model: Type[SQLModel]
+    ) -> Union[postgresql.Insert, sqlite.Insert]:
+        """INSERT construct for the bound dialect, with ON CONFLICT support."""
+        if self.session.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(model)
+        return sqlite.insert(model)
+
     def get_by_id(self, id: UUID) -> Optional[ModelType]:
-        """Get a single record by ID."""
+        """Get a single record by ID.
+
+        Session.get answers from the session's identity map when the object
+        is already loaded, so repeat lookups within a request (from any
+        repository sharing the session) issue no SQL.
+        """
         return self.session.get(self.model, id)
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
@@ -25,17 +40,29 @@ class BaseRepository(Generic[ModelType]):
         return list(self.session.exec(statement).all())
 
     def create(self, obj: ModelType) -> ModelType:
-        """Create a new record."""
+        """Create a new record.
+
+        No refresh: ids are generated client-side and server defaults come
+        back via RETURNING (eager_defaults), so the object is already complete.
+        """
         self.session.add(obj)
         self.session.commit()
-        self.session.refresh(obj)
         return obj
 
+    def bulk_insert(self, rows: List[dict[str, Any]]) -> None:
+        """Insert many records with one executemany INSERT.
+
+        Rows are plain column dicts, so no model instances are built; model
+        default factories do not run, so rows must carry their own ``id``.
+        Does not commit - the caller owns the transaction.
+        """
+        if rows:
+            self.session.connection().execute(insert(self.model), rows)
+
     def update(self, obj: ModelType) -> ModelType:
-        """Update an existing record."""
+        """Update an existing record (no server-side onupdate columns to reload)."""
         self.session.add(obj)
         self.session.commit()
-        self.session.refresh(obj)
         return obj
 
     def delete(self, id: UUID) -> bool:
@@ -48,5 +75,6 @@ class BaseRepository(Generic[ModelType]):
         return False
 
     def exists(self, id: UUID) -> bool:
-        """Check if a record exists."""
-        return self.get_by_id(id) is not None
+        """Check if a record exists (SELECT EXISTS, no row is loaded)."""
+        statement = select(exists().where(self.model.id == id))  # type: ignore[attr-defined]
+        return bool(self.session.scalar(statement))
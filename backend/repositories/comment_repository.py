@@ -1,12 +1,12 @@
 """Comment repository for shared comment queries with author info."""
 
-from typing import Dict, List, Tuple
+from typing import List
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
-from models import Comment, User
+from models import Comment
 
 
 class CommentRepository:
@@ -15,51 +15,38 @@ class CommentRepository:
     def __init__(self, session: Session):
         self.session = session
 
-    def list_for_action(self, action_item_id: UUID) -> List[Tuple[Comment, User]]:
-        """
-        Get all comments for an action item with their authors.
-        Returns (Comment, User) tuples ordered by created_at ascending.
+    def _list_for_parent(self, parent_column, parent_id: UUID) -> List[Comment]:
+        """Comments for one parent with authors loaded, served by its partial index.
+
+        Authors come from one batched ``IN`` query (selectinload) rather than
+        a join, so an author's row is fetched once however many comments
+        they wrote.
         """
         statement = (
-            select(Comment, User)
-            .join(User, Comment.user_id == User.id)  # type: ignore[arg-type]
-            .where(Comment.action_item_id == action_item_id)
-            .order_by(Comment.created_at.asc())  # type: ignore[union-attr]
+            select(Comment)
+            .options(selectinload(Comment.user))  # type: ignore[arg-type]
+            .where(parent_column == parent_id)
+            # id (UUIDv7) breaks ties between comments created in the same instant
+            .order_by(Comment.created_at.asc(), Comment.id.asc())  # type: ignore[union-attr]
         )
         return list(self.session.exec(statement).all())
 
-    def list_for_risk(self, risk_id: UUID) -> List[Tuple[Comment, User]]:
+    def list_for_action(self, action_item_id: UUID) -> List[Comment]:
+        """
+        Get all comments for an action item with their authors.
+        Returns comments (author on ``comment.user``) ordered by created_at.
+        """
+        return self._list_for_parent(Comment.action_item_id, action_item_id)
+
+    def list_for_risk(self, risk_id: UUID) -> List[Comment]:
         """
         Get all comments for a risk with their authors.
-        Returns (Comment, User) tuples ordered by created_at ascending.
+        Returns comments (author on ``comment.user``) ordered by created_at.
         """
-        statement = (
-            select(Comment, User)
-            .join(User, Comment.user_id == User.id)  # type: ignore[arg-type]
-            .where(Comment.risk_id == risk_id)
-            .order_by(Comment.created_at.asc())  # type: ignore[union-attr]
-        )
-        return list(self.session.exec(statement).all())
+        return self._list_for_parent(Comment.risk_id, risk_id)
 
     def create(self, comment: Comment) -> Comment:
         """Create a new comment."""
         self.session.add(comment)
         self.session.commit()
-        self.session.refresh(comment)
         return comment
-
-    def count_for_actions(self, action_ids: List[UUID]) -> Dict[UUID, int]:
-        """
-        Get comment counts for multiple action items in a single query.
-        Returns a dict mapping action_item_id -> count.
-        """
-        if not action_ids:
-            return {}
-
-        statement = (
-            select(Comment.action_item_id, func.count(Comment.id))
-            .where(Comment.action_item_id.in_(action_ids))  # type: ignore[union-attr]
-            .group_by(Comment.action_item_id)
-        )
-        rows = self.session.exec(statement).all()
-        return {action_id: count for action_id, count in rows}
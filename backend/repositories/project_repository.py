@@ -1,11 +1,14 @@
 """Project repository."""
 
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy import delete, exists, lambda_stmt
+from sqlalchemy.orm import defer
+from sqlmodel import Session, col, func, select
 
 from models import Project, User, UserProjectLink
+from models.project import PROJECT_FINANCIAL_FIELDS
 from repositories.base import BaseRepository
 
 
@@ -17,56 +20,185 @@ class ProjectRepository(BaseRepository[Project]):
 
     def get_by_precursive_url(self, url: str) -> Optional[Project]:
         """Get project by Precursive URL."""
-        statement = select(Project).where(Project.precursive_url == url)
-        return self.session.exec(statement).first()
+        statement = lambda_stmt(
+            lambda: select(Project).where(Project.precursive_url == url).limit(1)
+        )
+        return self.session.scalar(statement)
 
     def get_published_projects(self) -> List[Project]:
         """Get all published projects."""
         statement = select(Project).where(Project.is_published)
         return list(self.session.exec(statement).all())
 
-    def get_user_projects(self, user_id: UUID) -> List[Project]:
-        """Get all projects assigned to a user."""
+    @staticmethod
+    def _project_ids_for_user(user_id: UUID):
+        """Subquery of project ids linked to a user.
+
+        Filtering with IN (subquery) instead of joining the link table keeps
+        each project to one row and selects no link columns.
+        """
+        return select(UserProjectLink.project_id).where(
+            UserProjectLink.user_id == user_id
+        )
+
+    def get_user_projects(
+        self, user_id: UUID, include_financials: bool = True
+    ) -> List[Project]:
+        """Get all published projects assigned to a user.
+
+        With include_financials=False the budget columns are deferred (not
+        selected); callers must not read them.
+        """
         statement = (
             select(Project)
-            .join(UserProjectLink)
-            .where(UserProjectLink.user_id == user_id)
+            .where(col(Project.id).in_(self._project_ids_for_user(user_id)))
             .where(Project.is_published)
         )
+        if not include_financials:
+            statement = statement.options(
+                *(defer(getattr(Project, name)) for name in PROJECT_FINANCIAL_FIELDS)
+            )
         return list(self.session.exec(statement).all())
 
-    def add_user_to_project(self, project_id: UUID, user_id: UUID) -> None:
-        """Assign a user to a project."""
-        link = UserProjectLink(project_id=project_id, user_id=user_id)
-        self.session.add(link)
+    def list_summary(self, user_id: Optional[UUID] = None) -> Sequence[Any]:
+        """Get (id, name, health_status, is_published, client_name) rows.
+
+        Selects only the listing columns instead of full Project rows. With
+        user_id, restricts to published projects assigned to that user.
+        """
+        statement = select(
+            Project.id,
+            Project.name,
+            Project.health_status,
+            Project.is_published,
+            Project.client_name,
+        ).order_by(Project.name)
+        if user_id is not None:
+            statement = statement.where(
+                col(Project.id).in_(self._project_ids_for_user(user_id))
+            ).where(Project.is_published)
+        return self.session.exec(statement).all()
+
+    def find_user_for_invite(
+        self, project_id: UUID, email: str
+    ) -> Tuple[bool, Optional[User]]:
+        """Check a project exists and look up a user by email in one query.
+
+        The user is LEFT JOINed onto the project row, so a missing project
+        yields no row and an unknown email yields a NULL user.
+        Returns (project exists, user or None).
+        """
+        statement = (
+            select(Project.id, User)
+            .select_from(Project)
+            .outerjoin(User, func.lower(User.email) == email.strip().lower())
+            .where(Project.id == project_id)
+        )
+        row = self.session.exec(statement).first()
+        if row is None:
+            return False, None
+        return True, row[1]
+
+    def add_user_to_project(self, project_id: UUID, user_id: UUID) -> bool:
+        """Assign a user to a project.
+
+        One INSERT ... ON CONFLICT DO NOTHING against the link's primary key,
+        so re-assigning is a no-op rather than an integrity error.
+        Returns True if a new assignment was created.
+        """
+        statement = (
+            self._dialect_insert(UserProjectLink)
+            .values(project_id=project_id, user_id=user_id)
+            .on_conflict_do_nothing()
+        )
+        result = self.session.connection().execute(statement)
+        self.session.commit()
+        return result.rowcount > 0
+
+    def add_users_to_project(self, project_id: UUID, user_ids: List[UUID]) -> int:
+        """Assign several users to a project.
+
+        A single multi-row INSERT ... ON CONFLICT DO NOTHING, so users who are
+        already assigned are skipped. Returns the number of new assignments.
+        """
+        if not user_ids:
+            return 0
+        statement = (
+            self._dialect_insert(UserProjectLink)
+            .values([{"project_id": project_id, "user_id": uid} for uid in user_ids])
+            .on_conflict_do_nothing()
+        )
+        result = self.session.connection().execute(statement)
         self.session.commit()
+        return result.rowcount
+
+    def remove_user_from_project(self, project_id: UUID, user_id: UUID) -> bool:
+        """Remove a user from a project.
 
-    def remove_user_from_project(self, project_id: UUID, user_id: UUID) -> None:
-        """Remove a user from a project."""
-        statement = select(UserProjectLink).where(
-            UserProjectLink.project_id == project_id, UserProjectLink.user_id == user_id
+        A single DELETE; returns True if an assignment was removed.
+        """
+        statement = delete(UserProjectLink).where(
+            col(UserProjectLink.project_id) == project_id,
+            col(UserProjectLink.user_id) == user_id,
         )
-        link = self.session.exec(statement).first()
-        if link:
-            self.session.delete(link)
-            self.session.commit()
+        result = self.session.connection().execute(statement)
+        self.session.commit()
+        return result.rowcount > 0
 
     def user_has_access(self, project_id: UUID, user_id: UUID) -> bool:
         """Check if a user has access to a project."""
-        statement = select(UserProjectLink).where(
-            UserProjectLink.project_id == project_id, UserProjectLink.user_id == user_id
+        # lambda_stmt: runs on every project-scoped request, so skip rebuilding it
+        statement = lambda_stmt(
+            lambda: select(
+                exists().where(
+                    UserProjectLink.project_id == project_id,
+                    UserProjectLink.user_id == user_id,
+                )
+            )
         )
-        return self.session.exec(statement).first() is not None
+        return bool(self.session.exec(statement).scalar())
 
-    def get_project_users(self, project_id: UUID) -> List[User]:
-        """Get all users assigned to a project."""
-        statement = (
-            select(User)
-            .join(UserProjectLink)
-            .where(UserProjectLink.project_id == project_id)
+    def get_with_access(
+        self, project_id: UUID, user_id: UUID
+    ) -> Optional[Tuple[Project, bool]]:
+        """Get a project together with whether the user is assigned to it.
+
+        Client-facing reads need both; fetching them in one SELECT avoids a
+        second round trip for the membership check.
+
+        Returns:
+            Tuple of (project, is_member), or None if the project doesn't exist
+        """
+        is_member = (
+            exists()
+            .where(
+                UserProjectLink.project_id == Project.id,
+                UserProjectLink.user_id == user_id,
+            )
+            .label("is_member")
         )
-        return list(self.session.exec(statement).all())
+        statement = select(Project, is_member).where(Project.id == project_id)
+        row = self.session.exec(statement).first()
+        if row is None:
+            return None
+        project, member = row
+        return project, bool(member)
+
+    def get_project_users(self, project_id: UUID) -> Sequence[Any]:
+        """Get (id, email, name, role, is_pending) rows for a project's users.
+
+        Selects only the listing columns as plain rows, so no User entities
+        are built or tracked in the session.
+        """
+        member_ids = select(UserProjectLink.user_id).where(
+            UserProjectLink.project_id == project_id
+        )
+        statement = select(
+            User.id, User.email, User.name, User.role, User.is_pending
+        ).where(col(User.id).in_(member_ids))
+        return self.session.exec(statement).all()
 
     def precursive_url_exists(self, url: str) -> bool:
         """Check if Precursive URL already exists."""
-        return self.get_by_precursive_url(url) is not None
+        statement = select(exists().where(Project.precursive_url == url))
+        return bool(self.session.scalar(statement))
@@ -1,11 +1,12 @@
 """Risk repository."""
 
-from typing import List
+from typing import List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import exists, lambda_stmt
 from sqlmodel import Session, col, select
 
-from models import Risk, RiskStatus
+from models import Project, Risk, RiskStatus, UserProjectLink
 from repositories.base import BaseRepository
 
 
@@ -15,17 +16,54 @@ class RiskRepository(BaseRepository[Risk]):
     def __init__(self, session: Session):
         super().__init__(Risk, session)
 
+    def get_with_access(
+        self, risk_id: UUID, user_id: UUID
+    ) -> Optional[Tuple[Risk, bool, bool]]:
+        """Get a risk with what a client access check needs, in one query.
+
+        The risk is joined to its project and carries an EXISTS flag for the
+        user's assignment, replacing separate risk, project and membership
+        lookups.
+
+        Returns:
+            Tuple of (risk, project is published, user is assigned), or None
+            if the risk doesn't exist
+        """
+        is_member = (
+            exists()
+            .where(
+                UserProjectLink.project_id == Risk.project_id,
+                UserProjectLink.user_id == user_id,
+            )
+            .label("is_member")
+        )
+        statement = (
+            select(Risk, Project.is_published, is_member)
+            .join(Project, col(Project.id) == Risk.project_id)
+            .where(Risk.id == risk_id)
+        )
+        row = self.session.exec(statement).first()
+        if row is None:
+            return None
+        risk, is_published, member = row
+        return risk, bool(is_published), bool(member)
+
     def get_by_project(self, project_id: UUID) -> List[Risk]:
         """Get all risks for a project."""
-        statement = select(Risk).where(Risk.project_id == project_id)
-        return list(self.session.exec(statement).all())
+        # lambda_stmt: built and cache-keyed once, project_id becomes a bound param
+        statement = lambda_stmt(
+            lambda: select(Risk).where(Risk.project_id == project_id)
+        )
+        return list(self.session.exec(statement).scalars().all())
 
     def get_open_risks(self, project_id: UUID) -> List[Risk]:
         """Get only open risks for a project."""
-        statement = select(Risk).where(
-            Risk.project_id == project_id, Risk.status == RiskStatus.OPEN
+        statement = lambda_stmt(
+            lambda: select(Risk).where(
+                Risk.project_id == project_id, Risk.status == RiskStatus.OPEN
+            )
         )
-        return list(self.session.exec(statement).all())
+        return list(self.session.exec(statement).scalars().all())
 
     def get_by_status(self, project_id: UUID, status: RiskStatus) -> List[Risk]:
         """Get risks filtered by status."""
@@ -1,11 +1,13 @@
 """Sync Job repository."""
 
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select, update
 
 from models import SyncJob, SyncJobStatus, SyncJobType
+from models.ids import new_id
 from repositories.base import BaseRepository
 
 
@@ -31,6 +33,24 @@ class SyncJobRepository(BaseRepository[SyncJob]):
         )
         return self.session.exec(statement).first()
 
+    def create_if_no_active(self, job: SyncJob) -> Optional[SyncJob]:
+        """
+        Insert a job unless one of its type is already queued/running.
+
+        A single INSERT ... ON CONFLICT DO NOTHING RETURNING against the
+        ix_syncjob_active_project_type unique partial index, so concurrent
+        enqueues cannot create duplicates. Returns the inserted job (attached
+        to the session, not committed), or None if an active job exists.
+        """
+        statement = (
+            self._dialect_insert(SyncJob)
+            # created_at is filled in by the database
+            .values(**job.model_dump(exclude={"created_at"}))
+            .on_conflict_do_nothing()
+            .returning(SyncJob)
+        )
+        return self.session.scalars(statement).first()
+
     def get_last_successful_job(
         self, project_id: UUID, job_type: SyncJobType
     ) -> Optional[SyncJob]:
@@ -51,12 +71,49 @@ class SyncJobRepository(BaseRepository[SyncJob]):
         )
         return self.session.exec(statement).first()
 
+    def last_successful_per_project(self, job_type: SyncJobType) -> Dict[UUID, SyncJob]:
+        """
+        Get the most recent successful job of a type for every project at once.
+
+        One query instead of a get_last_successful_job round trip per project:
+        DISTINCT ON (project_id) on PostgreSQL, a row_number() window elsewhere.
+        """
+        filters = (
+            SyncJob.job_type == job_type,
+            SyncJob.status == SyncJobStatus.SUCCEEDED,
+        )
+        if self.session.get_bind().dialect.name == "postgresql":
+            statement = (
+                select(SyncJob)
+                .where(*filters)
+                .distinct(SyncJob.project_id)
+                .order_by(SyncJob.project_id, SyncJob.completed_at.desc())  # type: ignore[union-attr]
+            )
+        else:
+            ranked = (
+                select(
+                    SyncJob.id,
+                    func.row_number()
+                    .over(
+                        partition_by=SyncJob.project_id,
+                        order_by=SyncJob.completed_at.desc(),  # type: ignore[union-attr]
+                    )
+                    .label("rank"),
+                )
+                .where(*filters)
+                .subquery()
+            )
+            statement = select(SyncJob).join(
+                ranked, (SyncJob.id == ranked.c.id) & (ranked.c.rank == 1)
+            )
+        return {job.project_id: job for job in self.session.exec(statement).all()}
+
     def get_jobs_for_project(self, project_id: UUID, limit: int = 10) -> List[SyncJob]:
         """Get recent sync jobs for a project."""
         statement = (
             select(SyncJob)
             .where(SyncJob.project_id == project_id)
-            .order_by(SyncJob.created_at.desc())  # type: ignore[union-attr]
+            .order_by(SyncJob.created_at.desc(), SyncJob.id.desc())  # type: ignore[union-attr]
             .limit(limit)
         )
         return list(self.session.exec(statement).all())
@@ -66,10 +123,147 @@ class SyncJobRepository(BaseRepository[SyncJob]):
         statement = (
             select(SyncJob)
             .where(SyncJob.status == SyncJobStatus.QUEUED)
-            .order_by(SyncJob.created_at.asc())  # type: ignore[union-attr]
+            .order_by(SyncJob.created_at.asc(), SyncJob.id.asc())  # type: ignore[union-attr]
         )
         return list(self.session.exec(statement).all())
 
+    def claim_pending_jobs(self, limit: int) -> List[SyncJob]:
+        """
+        Atomically claim up to ``limit`` queued jobs, oldest first.
+
+        Rows are locked with FOR UPDATE SKIP LOCKED, so concurrent workers
+        each get a disjoint batch instead of racing on the same queued rows;
+        the claimed jobs are marked RUNNING and committed in one transaction.
+        The scan is served by the ix_syncjob_active partial index.
+        """
+        statement = (
+            select(SyncJob)
+            .where(SyncJob.status == SyncJobStatus.QUEUED)
+            .order_by(SyncJob.created_at.asc(), SyncJob.id.asc())  # type: ignore[union-attr]
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        jobs = list(self.session.exec(statement).all())
+        started_at = datetime.now(timezone.utc)
+        for job in jobs:
+            job.status = SyncJobStatus.RUNNING
+            job.started_at = started_at
+            job.claim_id = new_id()
+            job.heartbeat_at = started_at
+        self.session.commit()
+        return jobs
+
+    def claim_job(self, job_id: UUID) -> Optional[SyncJob]:
+        """
+        Atomically move one queued job to RUNNING under a new claim.
+
+        A conditional UPDATE ... RETURNING, so exactly one runner (in-process
+        task or standalone worker) gets the job. Returns None if the job is
+        no longer queued. Not committed.
+        """
+        now = datetime.now(timezone.utc)
+        statement = (
+            update(SyncJob)
+            .where(SyncJob.id == job_id, SyncJob.status == SyncJobStatus.QUEUED)  # type: ignore[arg-type]
+            .values(
+                status=SyncJobStatus.RUNNING,
+                started_at=now,
+                claim_id=new_id(),
+                heartbeat_at=now,
+            )
+            .returning(SyncJob)
+        )
+        return self.session.scalars(statement).first()
+
+    def heartbeat(self, job_id: UUID, claim_id: UUID) -> bool:
+        """
+        Refresh the lease on a running job.
+
+        Returns False if the claim was lost (the job was requeued or
+        finished), in which case the runner should stop. Not committed.
+        """
+        statement = (
+            update(SyncJob)
+            .where(
+                SyncJob.id == job_id,  # type: ignore[arg-type]
+                SyncJob.claim_id == claim_id,  # type: ignore[arg-type]
+                SyncJob.status == SyncJobStatus.RUNNING,  # type: ignore[arg-type]
+            )
+            .values(heartbeat_at=datetime.now(timezone.utc))
+        )
+        return self.session.execute(statement).rowcount == 1
+
+    def finish(self, job: SyncJob, **values: Any) -> bool:
+        """
+        Write a job's final state if its runner still holds the claim.
+
+        The UPDATE is conditional on the claim_id the runner was given, so a
+        runner whose job was requeued and claimed again cannot overwrite the
+        new run. The in-session job is updated too. Not committed.
+        """
+        statement = (
+            update(SyncJob)
+            .where(
+                SyncJob.id == job.id,  # type: ignore[arg-type]
+                SyncJob.claim_id == job.claim_id,  # type: ignore[arg-type]
+                SyncJob.status == SyncJobStatus.RUNNING,  # type: ignore[arg-type]
+            )
+            .values(**values)
+        )
+        return self.session.execute(statement).rowcount == 1
+
+    def requeue_stale_jobs(self, heartbeat_before: datetime) -> List[SyncJob]:
+        """
+        Put RUNNING jobs with no heartbeat since ``heartbeat_before`` back in
+        the queue.
+
+        Recovers jobs whose runner died mid-sync; their claim is dropped, so
+        a late write from that runner is ignored. One UPDATE served by the
+        ix_syncjob_active partial index. Not committed.
+        """
+        statement = (
+            update(SyncJob)
+            .where(
+                SyncJob.status == SyncJobStatus.RUNNING,  # type: ignore[arg-type]
+                func.coalesce(SyncJob.heartbeat_at, SyncJob.started_at)
+                < heartbeat_before,
+            )
+            .values(
+                status=SyncJobStatus.QUEUED,
+                started_at=None,
+                claim_id=None,
+                heartbeat_at=None,
+            )
+            .returning(SyncJob)
+        )
+        return list(self.session.scalars(statement).all())
+
+    def fail_if_stale(self, job_id: UUID, heartbeat_before: datetime) -> bool:
+        """
+        Fail an active job whose runner has gone silent since ``heartbeat_before``.
+
+        A QUEUED job counts from created_at, a RUNNING one from its last
+        heartbeat. The staleness check is part of the UPDATE, so a runner that
+        heartbeats in between keeps its job; once failed, its claim is gone
+        and a late finish writes nothing. Not committed.
+        """
+        statement = (
+            update(SyncJob)
+            .where(
+                SyncJob.id == job_id,  # type: ignore[arg-type]
+                SyncJob.status.in_([SyncJobStatus.QUEUED, SyncJobStatus.RUNNING]),  # type: ignore[union-attr]
+                func.coalesce(SyncJob.heartbeat_at, SyncJob.created_at)
+                < heartbeat_before,
+            )
+            .values(
+                status=SyncJobStatus.FAILED,
+                error="Abandoned: no progress from its runner",
+                completed_at=datetime.now(timezone.utc),
+                claim_id=None,
+            )
+        )
+        return self.session.execute(statement).rowcount == 1
+
     def get_active_job(
         self, project_id: UUID, job_type: SyncJobType
     ) -> Optional[SyncJob]:
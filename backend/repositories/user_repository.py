@@ -1,7 +1,9 @@
 """User repository."""
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
+from uuid import UUID
 
+from sqlalchemy import exists, func, lambda_stmt, tuple_
 from sqlmodel import Session, col, or_, select
 
 from models import AuthProvider, User, UserRole
@@ -16,8 +18,24 @@ class UserRepository(BaseRepository[User]):
 
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email address."""
-        statement = select(User).where(User.email == email)
-        return self.session.exec(statement).first()
+        # lambda_stmt: hit on every login/invite, so skip rebuilding it
+        # Case-insensitive; served by the ix_user_email_lower expression index
+        normalized = email.strip().lower()
+        statement = lambda_stmt(
+            lambda: select(User).where(func.lower(User.email) == normalized).limit(1)
+        )
+        return self.session.scalar(statement)
+
+    def get_by_emails(self, emails: List[str]) -> List[User]:
+        """Get all users whose email is in the list (case-insensitive).
+
+        One lower(email) IN (...) query, served by ix_user_email_lower.
+        """
+        if not emails:
+            return []
+        normalized = [email.strip().lower() for email in emails]
+        statement = select(User).where(func.lower(User.email).in_(normalized))
+        return list(self.session.exec(statement).all())
 
     def get_by_role(self, role: UserRole) -> list[User]:
         """Get all users with a specific role."""
@@ -29,14 +47,21 @@ class UserRepository(BaseRepository[User]):
         search: Optional[str] = None,
         role: Optional[UserRole] = None,
         limit: int = 50,
+        after_name: Optional[str] = None,
+        after_id: Optional[UUID] = None,
     ) -> List[User]:
         """
         Search users by name or email with optional role filtering.
 
+        Results are ordered by (name, id); pass the name and id of the last
+        user of a page as after_name/after_id to get the next page (keyset).
+
         Args:
             search: Optional search string for name or email (case-insensitive)
             role: Optional role filter
             limit: Maximum number of results to return (default 50)
+            after_name: Name of the last user on the previous page
+            after_id: Id of the last user on the previous page
 
         Returns:
             List of matching users (limited)
@@ -55,8 +80,14 @@ class UserRepository(BaseRepository[User]):
         if role:
             statement = statement.where(User.role == role)
 
-        # Order by name for consistent results
-        statement = statement.order_by(User.name)
+        if after_name is not None and after_id is not None:
+            statement = statement.where(
+                tuple_(User.name, User.id) > tuple_(after_name, after_id)
+            )
+
+        # Order by name (id breaks ties) for consistent, resumable results;
+        # served by the (name, id) index
+        statement = statement.order_by(User.name, User.id)
 
         # Apply limit to prevent large payloads
         statement = statement.limit(limit)
@@ -76,17 +107,28 @@ class UserRepository(BaseRepository[User]):
         )
         return self.create(user)
 
-    def create_pending_user(self, email: str, name: str, role: UserRole) -> User:
-        """Create a pending (placeholder) user for invitation."""
-        user = User(
-            email=email,
-            name=name,
-            role=role,
-            auth_provider=AuthProvider.EMAIL,  # Will be updated on registration
-            is_pending=True,
-        )
-        return self.create(user)
+    def insert_missing(self, users: Sequence[User]) -> int:
+        """Insert users, skipping any whose email is already taken.
+
+        One multi-row INSERT ... ON CONFLICT DO NOTHING, so a concurrent
+        invite or registration for the same email cannot raise an integrity
+        error. The users are not added to the session and nothing is
+        committed. Returns the number of rows inserted.
+        """
+        if not users:
+            return 0
+        rows = [
+            # Core INSERT: the ORM before_insert hook does not run, so
+            # normalize the email here
+            {**user.model_dump(), "email": user.email.strip().lower()}
+            for user in users
+        ]
+        statement = self._dialect_insert(User).values(rows).on_conflict_do_nothing()
+        return self.session.connection().execute(statement).rowcount
 
     def email_exists(self, email: str) -> bool:
         """Check if email already exists."""
-        return self.get_by_email(email) is not None
+        statement = select(
+            exists().where(func.lower(User.email) == email.strip().lower())
+        )
+        return bool(self.session.scalar(statement))
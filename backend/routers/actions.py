@@ -1,11 +1,14 @@
 """Actions router."""
 
 import uuid
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 
-from fastapi import APIRouter, Query, Response, status
+from fastapi import APIRouter, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 from dependencies import ActionServiceDep, CogniterUser, CurrentUser
+from exceptions import ValidationError
+from models import ActionItem, ActionStatus
 from schemas import (
     ActionItemCreate,
     ActionItemRead,
@@ -13,7 +16,16 @@ from schemas import (
     CommentRead,
     PaginatedActionsResponse,
 )
-from serializers.api_models import to_action_item_read, to_comment_read
+from serializers.api_models import (
+    ACTION_ITEM_LIST,
+    COMMENT_LIST,
+    conditional_json_response,
+    json_list_response,
+    json_response,
+    to_action_item_read,
+    to_comment_read,
+)
+from serializers.cursors import decode_id_cursor, encode_id_cursor
 
 router = APIRouter(
     prefix="/actions",
@@ -22,66 +34,99 @@ router = APIRouter(
 
 
 @router.get("/", response_model=Union[List[ActionItemRead], PaginatedActionsResponse])
-async def read_actions(
-    response: Response,
+def read_actions(
     project_id: uuid.UUID,
     current_user: CurrentUser,
     action_service: ActionServiceDep,
     limit: Optional[int] = Query(None, ge=1, le=100, description="Max items per page"),
-    offset: Optional[int] = Query(None, ge=0, description="Number of items to skip"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
     search: Optional[str] = Query(None, description="Search in title or Jira ID"),
-    status_filter: Optional[List[str]] = Query(
+    # Parsed to ActionStatus members up front; an unknown value is a 422
+    status_filter: Optional[List[ActionStatus]] = Query(
         None, alias="status", description="Filter by status"
     ),
+    with_total: Optional[bool] = Query(
+        None,
+        description="Include the total match count (default: first page only)",
+    ),
+    # Removed in favour of cursor; still declared so old clients get a 400
+    # instead of page 1 over and over
+    offset: Optional[int] = Query(None, include_in_schema=False),
 ):
     """
     Get actions for a project.
 
-    If limit/offset are provided, returns paginated response with total count.
+    If limit is provided, returns a keyset-paginated response with total count
+    and a next_cursor to pass back for the following page.
     Otherwise returns all actions (legacy behavior) with X-Total-Count header.
 
     - **limit**: Maximum number of results (1-100)
-    - **offset**: Number of results to skip
+    - **cursor**: next_cursor from the previous page (omit for the first page)
     - **search**: Optional search term for title or Jira ID
     - **status**: Optional status filter (can be repeated)
+    - **with_total**: Whether to count all matches; by default only the first
+      page (no cursor) is counted, since later pages only need next_cursor
     """
     # ResourceNotFoundError -> 404, AuthorizationError -> 403 via global handlers
+    # (a malformed cursor -> ValidationError -> 400)
+    if offset is not None:
+        raise ValidationError(
+            "offset is no longer supported; pass the previous page's next_cursor"
+            " as cursor"
+        )
 
     # If pagination params provided, use paginated method
     if limit is not None:
-        effective_offset = offset if offset is not None else 0
-        rows, total = action_service.get_project_actions_paginated(
+        actions, total, next_cursor = action_service.get_project_actions_paginated(
             project_id=project_id,
             user=current_user,
             limit=limit,
-            offset=effective_offset,
+            cursor_id=decode_id_cursor(cursor) if cursor else None,
             search=search,
             statuses=status_filter,
+            with_total=cursor is None if with_total is None else with_total,
         )
-        items = [
-            to_action_item_read(action, comment_count) for action, comment_count in rows
-        ]
-        return PaginatedActionsResponse(
+        items = [to_action_item_read(action) for action in actions]
+        page = PaginatedActionsResponse(
             items=items,
             total=total,
             limit=limit,
-            offset=effective_offset,
+            next_cursor=encode_id_cursor(next_cursor) if next_cursor else None,
         )
-
-    # Legacy behavior: return all actions as list
-    rows = action_service.get_project_actions_with_comment_counts(
-        project_id, current_user
+        return json_response(page)
+
+    # Legacy behavior: return all actions as list, streamed batch by batch.
+    # The batches read from the request session's cursor while the body is
+    # sent, which needs FastAPI >= 0.118 (yield dependencies such as the
+    # session are closed after the response, not before it streams).
+    total, batches = action_service.iter_project_actions(project_id, current_user)
+    return StreamingResponse(
+        _json_array_chunks(batches),
+        media_type="application/json",
+        # Add total count header for clients that want it
+        headers={"X-Total-Count": str(total)},
     )
-    items = [
-        to_action_item_read(action, comment_count) for action, comment_count in rows
-    ]
-    # Add total count header for clients that want it
-    response.headers["X-Total-Count"] = str(len(items))
-    return items
+
+
+def _json_array_chunks(batches: Iterator[List[ActionItem]]) -> Iterator[bytes]:
+    """Encode action batches as one JSON array, a chunk per batch."""
+    yield b"["
+    first = True
+    for batch in batches:
+        # One encoder call per batch; strip its brackets to splice into the array
+        chunk = ACTION_ITEM_LIST.dump_json(
+            [to_action_item_read(action) for action in batch]
+        )[1:-1]
+        if chunk:
+            yield chunk if first else b"," + chunk
+            first = False
+    yield b"]"
 
 
 @router.post("/", response_model=ActionItemRead, status_code=status.HTTP_201_CREATED)
-async def create_action(
+def create_action(
     action: ActionItemCreate,
     current_user: CurrentUser,
     action_service: ActionServiceDep,
@@ -89,23 +134,30 @@ async def create_action(
     """Create a new action item."""
     # ResourceNotFoundError -> 404, AuthorizationError -> 403 via global handlers
     created = action_service.create_action(action, current_user)
-    return to_action_item_read(created, comment_count=0)
+    return json_response(
+        to_action_item_read(created),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get("/{action_id}", response_model=ActionItemRead)
-async def get_action(
-    action_id: uuid.UUID, current_user: CurrentUser, action_service: ActionServiceDep
+def get_action(
+    request: Request,
+    action_id: uuid.UUID,
+    current_user: CurrentUser,
+    action_service: ActionServiceDep,
 ):
-    """Get a specific action item by ID."""
+    """Get a specific action item by ID.
+
+    Sends an ETag; a poll with a matching If-None-Match gets 304 Not Modified.
+    """
     # ResourceNotFoundError -> 404, AuthorizationError -> 403 via global handlers
-    action, comment_count = action_service.get_action_with_comment_count(
-        action_id, current_user
-    )
-    return to_action_item_read(action, comment_count)
+    action = action_service.get_action_for_user(action_id, current_user)
+    return conditional_json_response(request, to_action_item_read(action))
 
 
 @router.delete("/{action_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_action(
+def delete_action(
     action_id: uuid.UUID,
     current_user: CogniterUser,  # Only Cogniters can delete
     action_service: ActionServiceDep,
@@ -121,7 +173,7 @@ async def delete_action(
 
 
 @router.get("/{action_id}/comments", response_model=List[CommentRead])
-async def get_action_comments(
+def get_action_comments(
     action_id: uuid.UUID, current_user: CurrentUser, action_service: ActionServiceDep
 ):
     """
@@ -130,8 +182,10 @@ async def get_action_comments(
     Both Cogniters and assigned Clients can view comments.
     """
     # ResourceNotFoundError -> 404, AuthorizationError -> 403 via global handlers
-    rows = action_service.get_comments(action_id, current_user)
-    return [to_comment_read(comment, author) for comment, author in rows]
+    comments = action_service.get_comments(action_id, current_user)
+    return json_list_response(
+        COMMENT_LIST, [to_comment_read(comment, comment.user) for comment in comments]
+    )
 
 
 @router.post(
@@ -139,7 +193,7 @@ async def get_action_comments(
     response_model=CommentRead,
     status_code=status.HTTP_201_CREATED,
 )
-async def add_action_comment(
+def add_action_comment(
     action_id: uuid.UUID,
     data: CommentCreate,
     current_user: CurrentUser,
@@ -153,4 +207,6 @@ async def add_action_comment(
     # ResourceNotFoundError -> 404, AuthorizationError -> 403,
     # ValidationError -> 400 via global handlers
     comment, author = action_service.add_comment(action_id, data.content, current_user)
-    return to_comment_read(comment, author)
+    return json_response(
+        to_comment_read(comment, author), status_code=status.HTTP_201_CREATED
+    )
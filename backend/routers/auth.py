@@ -3,10 +3,15 @@
 from typing import List
 
 import structlog
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 from dependencies import AuthServiceDep, CurrentUser, SuperuserPayload, UserServiceDep
 from schemas import GoogleLoginRequest, SuperuserLoginRequest, Token, UserRead
+from serializers.api_models import (
+    conditional_json_response,
+    json_response,
+    to_user_read,
+)
 
 logger = structlog.get_logger()
 
@@ -17,9 +22,7 @@ router = APIRouter(
 
 
 @router.post("/login", response_model=Token)
-async def login_with_firebase(
-    request: GoogleLoginRequest, auth_service: AuthServiceDep
-):
+def login_with_firebase(request: GoogleLoginRequest, auth_service: AuthServiceDep):
     """
     Login with Firebase ID token.
     Supports Google OAuth and Email/Password authentication.
@@ -27,12 +30,14 @@ async def login_with_firebase(
     Returns JWT access token.
     """
     user, access_token = auth_service.authenticate_with_firebase(request.token)
-    logger.info("User logged in successfully", user_id=str(user.id), email=user.email)
-    return {"access_token": access_token, "token_type": "bearer"}
+    logger.info("User logged in successfully", user_id=user.id, email=user.email)
+    return json_response(
+        Token.model_construct(access_token=access_token, token_type="bearer")
+    )
 
 
 @router.post("/superuser-login", response_model=Token)
-async def login_superuser(request: SuperuserLoginRequest, auth_service: AuthServiceDep):
+def login_superuser(request: SuperuserLoginRequest, auth_service: AuthServiceDep):
     """
     Login as superuser with email/password (bypasses Firebase).
     Only works if SUPERUSER_EMAIL and SUPERUSER_PASSWORD are configured.
@@ -40,22 +45,25 @@ async def login_superuser(request: SuperuserLoginRequest, auth_service: AuthServ
     user, access_token = auth_service.authenticate_superuser(
         request.email, request.password
     )
-    logger.info("Superuser logged in", user_id=str(user.id))
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-        "is_superuser": True,
-    }
+    logger.info("Superuser logged in", user_id=user.id)
+    return json_response(
+        Token.model_construct(
+            access_token=access_token, token_type="bearer", is_superuser=True
+        )
+    )
 
 
 @router.get("/me", response_model=UserRead)
-async def get_current_user_info(current_user: CurrentUser):
-    """Get current authenticated user information."""
-    return current_user
+async def get_current_user_info(request: Request, current_user: CurrentUser):
+    """Get current authenticated user information.
+
+    Sends an ETag; a poll with a matching If-None-Match gets 304 Not Modified.
+    """
+    return conditional_json_response(request, to_user_read(current_user))
 
 
 @router.get("/impersonation-presets", response_model=List[UserRead])
-async def get_impersonation_presets(
+def get_impersonation_presets(
     _: SuperuserPayload,
     user_service: UserServiceDep,
 ):
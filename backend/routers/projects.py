@@ -1,21 +1,37 @@
-"""Projects router."""
+"""Projects router.
+
+Handlers are plain ``def``: their service calls do blocking DB work, so
+FastAPI runs them in its threadpool rather than on the event loop.
+"""
 
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 
-from dependencies import CogniterUser, CurrentUser, ProjectServiceDep, UserServiceDep
-from exceptions import AuthorizationError
-from permissions import can_view_financials, is_internal_user
+from dependencies import CogniterUser, CurrentUser, ProjectServiceDep
+from permissions import can_view_financials
 from schemas import (
     InviteUserRequest,
     InviteUserResponse,
+    InviteUsersBatchRequest,
+    InviteUsersBatchResponse,
     ProjectCreate,
     ProjectRead,
+    ProjectSummary,
     ProjectUpdate,
     UserRead,
 )
+from serializers.api_models import (
+    PROJECT_LIST,
+    PROJECT_SUMMARY_LIST,
+    USER_LIST,
+    conditional_json_response,
+    json_list_response,
+    to_project_read,
+    to_project_summary,
+    to_user_read_from_row,
+)
 
 router = APIRouter(
     prefix="/projects",
@@ -23,33 +39,40 @@ router = APIRouter(
 )
 
 
-def _to_project_read(project, user) -> ProjectRead:
-    """
-    Serialize a project for the requesting user, enforcing field-level permissions.
-
-    Frontend UI gating is not a security boundary; enforce financial visibility here.
-    """
-    model = ProjectRead.model_validate(project)
-    if not can_view_financials(user):
-        model.total_budget = None
-        model.spent_budget = None
-        model.remaining_budget = None
-    return model
-
-
 @router.get("/", response_model=List[ProjectRead])
-async def list_projects(current_user: CurrentUser, project_service: ProjectServiceDep):
+def list_projects(current_user: CurrentUser, project_service: ProjectServiceDep):
     """
     List all projects accessible to the current user.
     - Cogniters: see all projects
     - Clients: see only assigned projects
     """
     projects = project_service.get_user_projects(current_user)
-    return [_to_project_read(p, current_user) for p in projects]
+    # Field-level permission decided once; frontend UI gating is not a
+    # security boundary, so budgets are nulled here
+    show_financials = can_view_financials(current_user)
+    return json_list_response(
+        PROJECT_LIST, [to_project_read(p, show_financials) for p in projects]
+    )
+
+
+@router.get("/summary", response_model=List[ProjectSummary])
+def list_project_summaries(
+    current_user: CurrentUser, project_service: ProjectServiceDep
+):
+    """
+    List accessible projects with only id, name, health and publish state.
+
+    Same visibility rules as GET /projects, for callers that do not need the
+    full project payload.
+    """
+    rows = project_service.get_user_project_summaries(current_user)
+    return json_list_response(
+        PROJECT_SUMMARY_LIST, [to_project_summary(row) for row in rows]
+    )
 
 
 @router.post("/", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
-async def create_project(
+def create_project(
     project_data: ProjectCreate,
     current_user: CogniterUser,  # Only Cogniters can create
     project_service: ProjectServiceDep,
@@ -64,30 +87,30 @@ async def create_project(
 
 
 @router.get("/{project_id}", response_model=ProjectRead)
-async def get_project(
-    project_id: UUID, current_user: CurrentUser, project_service: ProjectServiceDep
+def get_project(
+    request: Request,
+    project_id: UUID,
+    current_user: CurrentUser,
+    project_service: ProjectServiceDep,
 ):
     """
     Get a specific project by ID.
     User must have access to the project.
-    """
-    # ResourceNotFoundError -> 404 via global handler
-    project = project_service.get_project_by_id(project_id)
 
-    # Access rules:
-    # - Cogniters: all projects
-    # - Clients: must be assigned AND project must be published
-    if not is_internal_user(current_user):
-        if not project.is_published:
-            raise AuthorizationError("This project is not published")
-        if not project_service.user_has_access_to_project(project_id, current_user):
-            raise AuthorizationError("You don't have access to this project")
+    Sends an ETag; a poll with a matching If-None-Match gets 304 Not Modified.
+    """
+    # Cogniters: all projects; clients: assigned AND published
+    project = project_service.get_project_for_user(project_id, current_user)
 
-    return _to_project_read(project, current_user)
+    # The ETag hashes the (possibly redacted) body, so users with and without
+    # financial access never share a tag
+    return conditional_json_response(
+        request, to_project_read(project, can_view_financials(current_user))
+    )
 
 
 @router.patch("/{project_id}", response_model=ProjectRead)
-async def update_project(
+def update_project(
     project_id: UUID,
     project_data: ProjectUpdate,
     current_user: CogniterUser,  # Only Cogniters can update
@@ -103,7 +126,7 @@ async def update_project(
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_project(
+def delete_project(
     project_id: UUID,
     current_user: CogniterUser,  # Only Cogniters can delete
     project_service: ProjectServiceDep,
@@ -117,7 +140,7 @@ async def delete_project(
 
 
 @router.post("/{project_id}/publish", response_model=ProjectRead)
-async def publish_project(
+def publish_project(
     project_id: UUID, current_user: CogniterUser, project_service: ProjectServiceDep
 ):
     """
@@ -130,7 +153,7 @@ async def publish_project(
 
 
 @router.post("/{project_id}/unpublish", response_model=ProjectRead)
-async def unpublish_project(
+def unpublish_project(
     project_id: UUID, current_user: CogniterUser, project_service: ProjectServiceDep
 ):
     """
@@ -143,7 +166,7 @@ async def unpublish_project(
 
 
 @router.get("/{project_id}/users", response_model=List[UserRead])
-async def get_project_users(
+def get_project_users(
     project_id: UUID,
     current_user: CogniterUser,  # Only Cogniters can view project users
     project_service: ProjectServiceDep,
@@ -153,11 +176,12 @@ async def get_project_users(
     Only Cogniters can access this endpoint.
     """
     # ResourceNotFoundError -> 404 via global handler
-    return project_service.get_project_users(project_id)
+    rows = project_service.get_project_users(project_id)
+    return json_list_response(USER_LIST, [to_user_read_from_row(row) for row in rows])
 
 
 @router.post("/{project_id}/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def assign_user_to_project(
+def assign_user_to_project(
     project_id: UUID,
     user_id: UUID,
     current_user: CogniterUser,
@@ -172,7 +196,7 @@ async def assign_user_to_project(
 
 
 @router.delete("/{project_id}/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_user_from_project(
+def remove_user_from_project(
     project_id: UUID,
     user_id: UUID,
     current_user: CogniterUser,
@@ -187,12 +211,11 @@ async def remove_user_from_project(
 
 
 @router.post("/{project_id}/invite", response_model=InviteUserResponse)
-async def invite_user_to_project(
+def invite_user_to_project(
     project_id: UUID,
     invite_data: InviteUserRequest,
     current_user: CogniterUser,
     project_service: ProjectServiceDep,
-    user_service: UserServiceDep,
 ):
     """
     Invite a user to a project by email.
@@ -201,32 +224,41 @@ async def invite_user_to_project(
 
     Only Cogniters can invite users.
     """
-    # Verify project exists (ResourceNotFoundError -> 404 via global handler)
-    project_service.get_project_by_id(project_id)
+    # ResourceNotFoundError -> 404 via global handler
+    email = invite_data.email  # Already trimmed and lowercased by the schema
+    user, was_created = project_service.assign_by_email(project_id, email, current_user)
+    if was_created:
+        message = (
+            f"Invitation created for {email}. They will have access once they register."
+        )
+    else:
+        message = f"{user.name} has been assigned to the project."
+    return InviteUserResponse(
+        user=UserRead.model_validate(user), was_created=was_created, message=message
+    )
 
-    email = invite_data.email.lower().strip()
 
-    # Check if user exists
-    existing_user = user_service.get_user_by_email(email)
+@router.post("/{project_id}/invite/batch", response_model=InviteUsersBatchResponse)
+def invite_users_to_project(
+    project_id: UUID,
+    invite_data: InviteUsersBatchRequest,
+    current_user: CogniterUser,
+    project_service: ProjectServiceDep,
+):
+    """
+    Invite several users to a project by email.
+    Known emails are assigned directly; unknown emails get placeholder users.
 
-    if existing_user:
-        # User exists - just assign them
-        # DuplicateResourceError -> 409 via global handler (user already assigned)
-        project_service.assign_user_to_project(
-            project_id, existing_user.id, current_user
-        )
-        return InviteUserResponse(
-            user=UserRead.model_validate(existing_user),
-            was_created=False,
-            message=f"{existing_user.name} has been assigned to the project.",
-        )
-    else:
-        # Create placeholder user and assign
-        # DuplicateResourceError -> 409 via global handler
-        new_user = user_service.create_pending_user(email)
-        project_service.assign_user_to_project(project_id, new_user.id, current_user)
-        return InviteUserResponse(
-            user=UserRead.model_validate(new_user),
-            was_created=True,
-            message=f"Invitation created for {email}. They will have access once they register.",
-        )
+    Only Cogniters can invite users.
+    """
+    # ResourceNotFoundError -> 404 via global handler
+    users, created = project_service.assign_by_emails(
+        project_id, invite_data.emails, current_user
+    )
+    return InviteUsersBatchResponse(
+        users=[UserRead.model_validate(user) for user in users],
+        created=[user.email for user in created],
+        message=(
+            f"Assigned {len(users)} user(s); created {len(created)} invitation(s)."
+        ),
+    )
@@ -1,9 +1,13 @@
-"""Risks router."""
+"""Risks router.
+
+Handlers are plain ``def`` so FastAPI runs their blocking service calls in
+its threadpool.
+"""
 
 import uuid
 from typing import List
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 
 from dependencies import CogniterUser, CurrentUser, RiskServiceDep
 from schemas import (
@@ -14,7 +18,15 @@ from schemas import (
     RiskReopen,
     RiskResolve,
 )
-from serializers.api_models import to_comment_read
+from serializers.api_models import (
+    COMMENT_LIST,
+    RISK_LIST,
+    conditional_json_response,
+    json_list_response,
+    json_response,
+    to_comment_read,
+    to_risk_read,
+)
 
 router = APIRouter(
     prefix="/risks",
@@ -23,34 +35,43 @@ router = APIRouter(
 
 
 @router.get("/", response_model=List[RiskRead])
-async def read_risks(
+def read_risks(
     project_id: uuid.UUID, current_user: CurrentUser, risk_service: RiskServiceDep
 ):
     """Get all risks for a project."""
     # ResourceNotFoundError -> 404, AuthorizationError -> 403 via global handlers
-    return risk_service.get_project_risks(project_id, current_user)
+    risks = risk_service.get_project_risks(project_id, current_user)
+    return json_list_response(RISK_LIST, [to_risk_read(risk) for risk in risks])
 
 
 @router.post("/", response_model=RiskRead, status_code=status.HTTP_201_CREATED)
-async def create_risk(
+def create_risk(
     risk: RiskCreate, current_user: CurrentUser, risk_service: RiskServiceDep
 ):
     """Create a new risk."""
     # ResourceNotFoundError -> 404, AuthorizationError -> 403 via global handlers
-    return risk_service.create_risk(risk, current_user)
+    created = risk_service.create_risk(risk, current_user)
+    return json_response(to_risk_read(created), status.HTTP_201_CREATED)
 
 
 @router.get("/{risk_id}", response_model=RiskRead)
-async def get_risk(
-    risk_id: uuid.UUID, current_user: CurrentUser, risk_service: RiskServiceDep
+def get_risk(
+    request: Request,
+    risk_id: uuid.UUID,
+    current_user: CurrentUser,
+    risk_service: RiskServiceDep,
 ):
-    """Get a specific risk by ID."""
+    """Get a specific risk by ID.
+
+    Sends an ETag; a poll with a matching If-None-Match gets 304 Not Modified.
+    """
     # ResourceNotFoundError -> 404, AuthorizationError -> 403 via global handlers
-    return risk_service.get_risk_for_user(risk_id, current_user)
+    risk = risk_service.get_risk_for_user(risk_id, current_user)
+    return conditional_json_response(request, to_risk_read(risk))
 
 
 @router.post("/{risk_id}/resolve", response_model=RiskRead)
-async def resolve_risk(
+def resolve_risk(
     risk_id: uuid.UUID,
     data: RiskResolve,
     current_user: CogniterUser,  # Only Cogniters can resolve
@@ -74,7 +95,7 @@ async def resolve_risk(
 
 
 @router.post("/{risk_id}/reopen", response_model=RiskRead)
-async def reopen_risk(
+def reopen_risk(
     risk_id: uuid.UUID,
     data: RiskReopen,
     current_user: CogniterUser,  # Only Cogniters can reopen
@@ -94,7 +115,7 @@ async def reopen_risk(
 
 
 @router.get("/{risk_id}/comments", response_model=List[CommentRead])
-async def get_risk_comments(
+def get_risk_comments(
     risk_id: uuid.UUID, current_user: CurrentUser, risk_service: RiskServiceDep
 ):
     """
@@ -103,8 +124,10 @@ async def get_risk_comments(
     Both Cogniters and assigned Clients can view comments.
     """
     # ResourceNotFoundError -> 404, AuthorizationError -> 403 via global handlers
-    rows = risk_service.get_comments(risk_id, current_user)
-    return [to_comment_read(comment, author) for comment, author in rows]
+    comments = risk_service.get_comments(risk_id, current_user)
+    return json_list_response(
+        COMMENT_LIST, [to_comment_read(comment, comment.user) for comment in comments]
+    )
 
 
 @router.post(
@@ -112,7 +135,7 @@ async def get_risk_comments(
     response_model=CommentRead,
     status_code=status.HTTP_201_CREATED,
 )
-async def add_risk_comment(
+def add_risk_comment(
     risk_id: uuid.UUID,
     data: CommentCreate,
     current_user: CurrentUser,
@@ -130,7 +153,7 @@ async def add_risk_comment(
 
 
 @router.delete("/{risk_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_risk(
+def delete_risk(
     risk_id: uuid.UUID,
     current_user: CogniterUser,  # Only Cogniters can delete
     risk_service: RiskServiceDep,
@@ -1,11 +1,15 @@
 """Sync router for triggering data synchronization."""
 
+import asyncio
 import uuid
+from datetime import datetime, timedelta, timezone
 
 import structlog
-from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session
 
-from config import get_settings
+from config import Settings, get_settings
 from database import get_session_context
 from dependencies import (
     CogniterUser,
@@ -16,7 +20,7 @@ from dependencies import (
     SyncJobServiceDep,
 )
 from exceptions import IntegrationError, ResourceNotFoundError
-from models import Project, SyncJob, SyncJobType
+from models import Project, SyncJob, SyncJobType, User
 from permissions import is_internal_user
 from schemas.sync import (
     SyncJobEnqueued,
@@ -24,7 +28,13 @@ from schemas.sync import (
     SyncResult,
     SyncStatus,
 )
-from services.sync_job_service import SyncJobService
+from services.project_service import ProjectService
+from services.sync_job_runner import execute_sync_job
+from services.sync_job_service import (
+    TERMINAL_STATUSES,
+    SyncJobService,
+    job_status_waiters,
+)
 from services.sync_service import SyncService
 
 logger = structlog.get_logger()
@@ -40,85 +50,23 @@ router = APIRouter(
 # ============================================================================
 
 
-async def run_sync_job(job_id: uuid.UUID, job_type: SyncJobType):
+async def run_sync_job(job_id: uuid.UUID):
     """
     Execute a sync job in the background with a fresh database session.
 
     This function creates its own database session to avoid holding onto
-    the request-scoped session which may be closed.
+    the request-scoped session which may be closed. The job is claimed
+    atomically, so it never runs twice alongside the standalone worker.
     """
-    settings = get_settings()
-
     # Use context manager for session to ensure proper cleanup
     with get_session_context() as session:
-        sync_job_service = SyncJobService(session)
-        job = sync_job_service.get_by_id(job_id)
+        job = SyncJobService(session).claim_job(job_id)
 
         if not job:
-            logger.error("Sync job not found", job_id=str(job_id))
+            logger.info("Sync job already claimed", job_id=str(job_id))
             return
 
-        # Mark job as running
-        sync_job_service.mark_running(job)
-
-        items_synced = 0
-        error_message = None
-
-        try:
-            # Get the project
-            project = session.get(Project, job.project_id)
-            if not project:
-                raise ResourceNotFoundError(f"Project {job.project_id} not found")
-
-            # Create sync service with fresh session
-            sync_service = SyncService(session, settings)
-
-            try:
-                if job_type == SyncJobType.JIRA:
-                    result = await sync_service.sync_jira_data(project)
-                    items_synced = result.actions_count
-                    if result.error:
-                        error_message = result.error
-
-                elif job_type == SyncJobType.PRECURSIVE:
-                    result = await sync_service.sync_precursive_data(project)
-                    items_synced = result.risks_count
-                    if result.error:
-                        error_message = result.error
-
-                elif job_type == SyncJobType.FULL:
-                    result = await sync_service.sync_project(job.project_id)
-                    items_synced = (
-                        result.jira.actions_count + result.precursive.risks_count
-                    )
-                    if result.jira.error or result.precursive.error:
-                        errors = []
-                        if result.jira.error:
-                            errors.append(f"Jira: {result.jira.error}")
-                        if result.precursive.error:
-                            errors.append(f"Precursive: {result.precursive.error}")
-                        error_message = "; ".join(errors)
-            finally:
-                await sync_service.close()
-
-        except Exception as e:
-            logger.error(
-                "Sync job failed", job_id=str(job_id), error=str(e), exc_info=True
-            )
-            error_message = str(e)
-
-        # Mark job as complete
-        if error_message:
-            sync_job_service.mark_failed(job, error_message, items_synced)
-        else:
-            sync_job_service.mark_succeeded(job, items_synced)
-
-        logger.info(
-            "Sync job completed",
-            job_id=str(job_id),
-            status=job.status,
-            items_synced=job.items_synced,
-        )
+        await execute_sync_job(session, job, get_settings())
 
 
 def enqueue_sync_job(
@@ -127,6 +75,7 @@ def enqueue_sync_job(
     job_type: SyncJobType,
     user_id: uuid.UUID,
     background_tasks: BackgroundTasks,
+    settings: Settings,
 ) -> tuple[SyncJob, bool]:
     """
     Create and enqueue a sync job, or return existing running job.
@@ -134,17 +83,29 @@ def enqueue_sync_job(
     Implements job deduplication - if a job of the same type is already
     running for this project, returns that job instead of creating a new one.
 
+    New jobs run in this process unless the standalone worker
+    (``python -m sync_worker``) is enabled, in which case they stay queued
+    in the database for it to claim. In-process, nothing else recovers a job
+    orphaned by a restart, so an active job silent for
+    SYNC_JOB_STALE_AFTER_MINUTES is failed and replaced here.
+
     Returns:
         Tuple of (job, deduplicated) where deduplicated is True if returning
         an existing queued/running job.
     """
+    stale_before = None
+    if not settings.sync_worker_enabled:
+        stale_before = datetime.now(timezone.utc) - timedelta(
+            minutes=settings.sync_job_stale_after_minutes
+        )
     job, deduplicated = sync_job_service.enqueue_or_get_existing(
-        project_id, job_type, user_id
+        project_id, job_type, user_id, stale_before=stale_before
     )
 
     if not deduplicated:
-        # Schedule background execution for new jobs
-        background_tasks.add_task(run_sync_job, job.id, job_type)
+        if not settings.sync_worker_enabled:
+            # Schedule in-process background execution for new jobs
+            background_tasks.add_task(run_sync_job, job.id)
 
         logger.info(
             "Sync job enqueued",
@@ -161,20 +122,20 @@ def enqueue_sync_job(
 # ============================================================================
 
 
-@router.get("/jobs/{job_id}", response_model=SyncJobRead)
-async def get_job_status(
-    job_id: uuid.UUID,
-    session: SessionDep,
-    current_user: CurrentUser,
-    project_service: ProjectServiceDep,
-    sync_job_service: SyncJobServiceDep,
-):
-    """
-    Get the status of a sync job.
+# Server-side re-read interval while long-polling. Status changes made by this
+# process wake the request immediately; changes made elsewhere (another API
+# process, or the standalone sync worker) are only seen on the next re-read.
+LONG_POLL_RECHECK_SECONDS = 2.0
 
-    Poll this endpoint to check if a sync job has completed.
-    User must have access to the project the job belongs to.
-    """
+
+def _get_accessible_job(
+    job_id: uuid.UUID,
+    session: Session,
+    current_user: User,
+    project_service: ProjectService,
+    sync_job_service: SyncJobService,
+) -> SyncJob:
+    """Load a sync job, enforcing access to the project it belongs to."""
     job = sync_job_service.get_by_id(job_id)
 
     if not job:
@@ -201,6 +162,71 @@ async def get_job_status(
     return job
 
 
+async def _wait_for_status_change(
+    job: SyncJob, sync_job_service: SyncJobService, wait: float
+) -> SyncJob:
+    """Hold until the job leaves its current status or ``wait`` seconds pass."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    observed = job.status
+
+    while job.status == observed and job.status not in TERMINAL_STATUSES:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        # Don't pin a pooled connection while the request sits idle
+        sync_job_service.release_connection()
+        await job_status_waiters.wait(job.id, min(remaining, LONG_POLL_RECHECK_SECONDS))
+        refreshed = await run_in_threadpool(sync_job_service.get_by_id, job.id)
+        if not refreshed:
+            break
+        job = refreshed
+
+    return job
+
+
+@router.get("/jobs/{job_id}", response_model=SyncJobRead)
+async def get_job_status(
+    job_id: uuid.UUID,
+    session: SessionDep,
+    current_user: CurrentUser,
+    project_service: ProjectServiceDep,
+    sync_job_service: SyncJobServiceDep,
+    wait: int = Query(
+        0,
+        ge=0,
+        le=50,
+        description="Seconds to hold the request until the job's status changes",
+    ),
+):
+    """
+    Get the status of a sync job.
+
+    Poll this endpoint to check if a sync job has completed. With ``wait``,
+    the request is held until the job moves out of its current status (or
+    finishes), returning early on change instead of polling repeatedly.
+    User must have access to the project the job belongs to.
+
+    Wake-ups are in-process: a change made by the job's runner in this API
+    process returns at once, while a change made by another process
+    (including the standalone sync worker, SYNC_WORKER_ENABLED=true) is
+    noticed within LONG_POLL_RECHECK_SECONDS (2s).
+    """
+    job = await run_in_threadpool(
+        _get_accessible_job,
+        job_id,
+        session,
+        current_user,
+        project_service,
+        sync_job_service,
+    )
+
+    if wait:
+        job = await _wait_for_status_change(job, sync_job_service, wait)
+
+    return job
+
+
 @router.post("/{project_id}", response_model=SyncResult)
 async def trigger_sync(
     project_id: uuid.UUID,
@@ -245,7 +271,7 @@ async def trigger_sync(
     response_model=SyncJobEnqueued,
     status_code=status.HTTP_202_ACCEPTED,
 )
-async def sync_jira_only(
+def sync_jira_only(
     project_id: uuid.UUID,
     session: SessionDep,
     settings: SettingsDep,
@@ -283,6 +309,7 @@ async def sync_jira_only(
         job_type=SyncJobType.JIRA,
         user_id=current_user.id,
         background_tasks=background_tasks,
+        settings=settings,
     )
 
     return SyncJobEnqueued(
@@ -301,7 +328,7 @@ async def sync_jira_only(
     response_model=SyncJobEnqueued,
     status_code=status.HTTP_202_ACCEPTED,
 )
-async def sync_precursive_only(
+def sync_precursive_only(
     project_id: uuid.UUID,
     session: SessionDep,
     settings: SettingsDep,
@@ -339,6 +366,7 @@ async def sync_precursive_only(
         job_type=SyncJobType.PRECURSIVE,
         user_id=current_user.id,
         background_tasks=background_tasks,
+        settings=settings,
     )
 
     return SyncJobEnqueued(
@@ -353,7 +381,7 @@ async def sync_precursive_only(
 
 
 @router.get("/{project_id}/status", response_model=SyncStatus)
-async def get_sync_status(
+def get_sync_status(
     project_id: uuid.UUID,
     session: SessionDep,
     settings: SettingsDep,
@@ -2,10 +2,12 @@
 
 import os
 from pathlib import Path
+from typing import Optional
 from uuid import uuid4
 
 import structlog
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 
 from dependencies import CogniterUser
 
@@ -20,7 +22,27 @@ router = APIRouter(
 UPLOAD_DIR = Path("uploads")
 LOGO_DIR = UPLOAD_DIR / "logos"
 ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
+IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
 MAX_FILE_SIZE = 2 * 1024 * 1024  # 2MB
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def sniff_image_type(header: bytes) -> Optional[str]:
+    """Identify an allowed image type from its leading magic bytes."""
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if header.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
 
 
 def ensure_upload_dirs():
@@ -37,8 +59,8 @@ async def upload_logo(
     Upload a project logo image.
 
     - Only Cogniters can upload logos
-    - Accepts: JPEG, PNG, GIF, WebP
-    - Max size: 2MB
+    - Accepts: JPEG, PNG, GIF, WebP (checked against the file's contents)
+    - Max size: 2MB (enforced while streaming to disk)
     - Returns the URL path to access the uploaded file
     """
     ensure_upload_dirs()
@@ -50,51 +72,66 @@ async def upload_logo(
             detail=f"Invalid file type. Allowed types: {', '.join(ALLOWED_IMAGE_TYPES)}",
         )
 
-    # Read file content
-    content = await file.read()
-
-    # Validate file size
-    if len(content) > MAX_FILE_SIZE:
+    # The declared type is only a first filter; trust the file's magic bytes
+    chunk = await file.read(UPLOAD_CHUNK_SIZE)
+    image_type = sniff_image_type(chunk)
+    if image_type is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Maximum size: {MAX_FILE_SIZE // (1024 * 1024)}MB",
+            detail=f"Invalid file type. Allowed types: {', '.join(ALLOWED_IMAGE_TYPES)}",
         )
 
-    # Generate unique filename
-    original_extension = Path(file.filename).suffix.lower() if file.filename else ".png"
-    # Ensure extension is valid
-    if original_extension not in {".jpg", ".jpeg", ".png", ".gif", ".webp"}:
-        original_extension = ".png"
-
-    filename = f"{uuid4()}{original_extension}"
+    # Generate unique filename from the detected type
+    filename = f"{uuid4()}{IMAGE_EXTENSIONS[image_type]}"
     filepath = LOGO_DIR / filename
 
-    # Save file
+    # Stream to disk chunk by chunk, enforcing the size limit as we go;
+    # blocking file I/O runs in the threadpool
+    size = 0
+    saved = False
     try:
-        with open(filepath, "wb") as f:
-            f.write(content)
-
-        logger.info(
-            "Logo uploaded successfully",
-            filename=filename,
-            size=len(content),
-            content_type=file.content_type,
-            user_id=str(current_user.id),
-        )
-
-        # Return the URL path (relative to static mount)
-        return {"url": f"/uploads/logos/{filename}"}
-
+        f = await run_in_threadpool(open, filepath, "wb")
+        try:
+            while chunk:
+                size += len(chunk)
+                if size > MAX_FILE_SIZE:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"File too large. Maximum size: {MAX_FILE_SIZE // (1024 * 1024)}MB",
+                    )
+                await run_in_threadpool(f.write, chunk)
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        finally:
+            await run_in_threadpool(f.close)
+        saved = True
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Failed to save uploaded file", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to save uploaded file",
         )
+    finally:
+        if not saved:
+            # Don't leave partial or rejected files behind
+            await run_in_threadpool(filepath.unlink, missing_ok=True)
+
+    logger.info(
+        "Logo uploaded successfully",
+        filename=filename,
+        size=size,
+        content_type=image_type,
+        user_id=str(current_user.id),
+    )
+
+    # Return the URL path (relative to static mount)
+    return {"url": f"/uploads/logos/{filename}"}
 
 
 @router.delete("/logo/{filename}")
-async def delete_logo(
+def delete_logo(
     filename: str,
     current_user: CogniterUser,
 ) -> dict:
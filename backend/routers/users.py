@@ -3,13 +3,15 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 
 from dependencies import CogniterUser, UserServiceDep
 from exceptions import AuthorizationError
 from models import UserRole
 from schemas import UserRead
 from schemas.user import UserRoleUpdate
+from serializers.api_models import USER_LIST, json_list_response, to_user_read
+from serializers.cursors import decode_name_id_cursor, encode_name_id_cursor
 
 router = APIRouter(
     prefix="/users",
@@ -18,29 +20,48 @@ router = APIRouter(
 
 
 @router.get("/", response_model=List[UserRead])
-async def list_users(
+def list_users(
     current_user: CogniterUser,  # Only Cogniters can list users
     user_service: UserServiceDep,
     search: Optional[str] = None,
     role: Optional[UserRole] = None,
     limit: int = 50,
+    cursor: Optional[str] = Query(
+        None, description="X-Next-Cursor header from the previous page"
+    ),
 ):
     """
-    List users with optional filtering.
+    List users with optional filtering, ordered by name.
 
     - **search**: Optional search string for name or email (case-insensitive)
     - **role**: Optional filter by role (Cogniter, Client + Financials, or Client)
     - **limit**: Maximum number of results to return (default 50, max 200)
+    - **cursor**: X-Next-Cursor response header of the previous page (omit for
+      the first page); the header is only sent when more users may follow
 
     Only Cogniters can access this endpoint.
     """
     # Cap limit to prevent abuse
     effective_limit = min(limit, 200) if limit > 0 else 50
-    return user_service.search_users(search=search, role=role, limit=effective_limit)
+    # A malformed cursor -> ValidationError -> 400
+    after_name, after_id = decode_name_id_cursor(cursor) if cursor else (None, None)
+    users = user_service.search_users(
+        search=search,
+        role=role,
+        limit=effective_limit,
+        after_name=after_name,
+        after_id=after_id,
+    )
+    response = json_list_response(USER_LIST, [to_user_read(user) for user in users])
+    if len(users) == effective_limit:
+        # The body stays a plain list; the continuation rides in a header
+        last = users[-1]
+        response.headers["X-Next-Cursor"] = encode_name_id_cursor(last.name, last.id)
+    return response
 
 
 @router.patch("/{user_id}/role", response_model=UserRead)
-async def update_user_role(
+def update_user_role(
     user_id: UUID,
     role_data: UserRoleUpdate,
     current_user: CogniterUser,  # Only Cogniters can update roles
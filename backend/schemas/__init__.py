@@ -14,7 +14,13 @@ from pydantic import BaseModel, ConfigDict
 
 from models import ActionStatus, Priority, RiskImpact, RiskProbability, RiskStatus
 from schemas.auth import GoogleLoginRequest, SuperuserLoginRequest, Token
-from schemas.project import ProjectBase, ProjectCreate, ProjectRead, ProjectUpdate
+from schemas.project import (
+    ProjectBase,
+    ProjectCreate,
+    ProjectRead,
+    ProjectSummary,
+    ProjectUpdate,
+)
 from schemas.sync import (
     JiraSyncResult,
     PrecursiveSyncResult,
@@ -27,6 +33,8 @@ from schemas.sync import (
 from schemas.user import (
     InviteUserRequest,
     InviteUserResponse,
+    InviteUsersBatchRequest,
+    InviteUsersBatchResponse,
     UserCreate,
     UserRead,
     UserRoleUpdate,
@@ -82,9 +90,10 @@ class PaginatedActionsResponse(BaseModel):
     """Paginated response for action items."""
 
     items: list[ActionItemRead]
-    total: int
+    total: Optional[int]
     limit: int
-    offset: int
+    # Opaque token; pass back as ?cursor= to get the next page
+    next_cursor: Optional[str]
 
 
 # Risk Schemas
@@ -208,10 +217,13 @@ __all__ = [
     "UserRoleUpdate",
     "InviteUserRequest",
     "InviteUserResponse",
+    "InviteUsersBatchRequest",
+    "InviteUsersBatchResponse",
     # Project
     "ProjectBase",
     "ProjectCreate",
     "ProjectRead",
+    "ProjectSummary",
     "ProjectUpdate",
     # Action Items
     "ActionItemBase",
@@ -75,6 +75,22 @@ class ProjectRead(BaseModel):
     precursive_status_summary: Optional[str]
 
 
+class ProjectSummary(BaseModel):
+    """Lightweight project listing (pickers, navigation).
+
+    Built from a column-pruned query: no financial or sync fields are loaded,
+    so no permission gating is needed.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    name: str
+    health_status: HealthStatus
+    is_published: bool
+    client_name: Optional[str]
+
+
 class ProjectUpdate(BaseModel):
     """Schema for updating a project. All fields optional for PATCH semantics."""
 
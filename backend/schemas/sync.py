@@ -10,6 +10,8 @@ from models import SyncJobStatus, SyncJobType
 class JiraSyncResult(BaseModel):
     success: bool
     actions_count: int = 0
+    actions_created: int = 0
+    actions_updated: int = 0
     message: Optional[str] = None
     error: Optional[str] = None
 
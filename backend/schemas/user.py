@@ -1,12 +1,24 @@
 """User schemas."""
 
 import uuid
-from typing import Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from models import UserRole
 
+# Trimmed and lowercased while parsing, with a cheap shape check so obviously
+# malformed input is rejected (422) before any database lookup
+NormalizedEmail = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        to_lower=True,
+        max_length=320,
+        pattern=r"^[^@\s]+@[^@\s]+$",
+    ),
+]
+
 
 class UserBase(BaseModel):
     """Base user schema."""
@@ -40,7 +52,7 @@ class UserRead(BaseModel):
 class InviteUserRequest(BaseModel):
     """Schema for inviting a user by email."""
 
-    email: str
+    email: NormalizedEmail
 
 
 class InviteUserResponse(BaseModel):
@@ -51,6 +63,20 @@ class InviteUserResponse(BaseModel):
     message: str
 
 
+class InviteUsersBatchRequest(BaseModel):
+    """Schema for inviting several users by email in one request."""
+
+    emails: List[NormalizedEmail] = Field(min_length=1, max_length=100)
+
+
+class InviteUsersBatchResponse(BaseModel):
+    """Response after inviting/assigning a batch of users."""
+
+    users: List[UserRead]  # Every invited user, in request order (deduplicated)
+    created: List[str]  # Emails a new placeholder user was created for
+    message: str
+
+
 class UserUpdate(BaseModel):
     """Schema for updating user data."""
 
@@ -2,43 +2,147 @@
 
 Routers should own response shaping. Services should return SQLModel entities and
 raw aggregates (counts) rather than Pydantic DTOs.
+
+These helpers only ever receive rows loaded from the database, so they build
+schemas with ``model_construct`` (no validation pass). Never use this for
+request input - Create/Update schemas must go through validation.
 """
 
-from models import ActionItem, Comment, User
-from schemas import ActionItemRead, CommentRead
-
-
-def to_action_item_read(action: ActionItem, comment_count: int = 0) -> ActionItemRead:
-    """Convert ActionItem SQLModel to ActionItemRead schema (injecting comment_count)."""
-    # Build a dict from the model and add the enriched field
-    data = {
-        "id": action.id,
-        "project_id": action.project_id,
-        "title": action.title,
-        "status": action.status,
-        "priority": action.priority,
-        "comment_count": comment_count,
-        "assignee": action.assignee,
-        "due_date": action.due_date,
-        "jira_id": action.jira_id,
-        "jira_key": action.jira_key,
-        "issue_type": action.issue_type,
-        "last_synced_at": action.last_synced_at,
-    }
-    return ActionItemRead.model_validate(data)
+import hashlib
+from typing import List, Sequence
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row
+
+from models import ActionItem, Comment, Project, Risk, User
+from models.project import PROJECT_FINANCIAL_FIELDS
+from schemas import (
+    ActionItemRead,
+    CommentRead,
+    ProjectRead,
+    ProjectSummary,
+    RiskRead,
+    UserRead,
+)
+
+# Read-schema fields copied straight off the ORM row (harvested once)
+_ACTION_ITEM_FIELDS = tuple(ActionItemRead.model_fields)
+_COMMENT_FIELDS = tuple(
+    name
+    for name in CommentRead.model_fields
+    if name not in ("author_name", "author_email")
+)
+_RISK_FIELDS = tuple(RiskRead.model_fields)
+_USER_FIELDS = tuple(UserRead.model_fields)
+
+# Financial fields are nulled for users who may not view financials
+_PROJECT_FIELDS = tuple(ProjectRead.model_fields)
+_PROJECT_PUBLIC_FIELDS = tuple(
+    name for name in _PROJECT_FIELDS if name not in PROJECT_FINANCIAL_FIELDS
+)
+_PROJECT_REDACTED = dict.fromkeys(PROJECT_FINANCIAL_FIELDS)
+
+# List encoders built once at import; each dumps a whole list in a single
+# pydantic-core call instead of one model_dump_json per row
+ACTION_ITEM_LIST = TypeAdapter(List[ActionItemRead])
+COMMENT_LIST = TypeAdapter(List[CommentRead])
+PROJECT_LIST = TypeAdapter(List[ProjectRead])
+PROJECT_SUMMARY_LIST = TypeAdapter(List[ProjectSummary])
+RISK_LIST = TypeAdapter(List[RiskRead])
+USER_LIST = TypeAdapter(List[UserRead])
+
+
+def to_action_item_read(action: ActionItem) -> ActionItemRead:
+    """Convert ActionItem SQLModel to ActionItemRead schema."""
+    data = {name: getattr(action, name) for name in _ACTION_ITEM_FIELDS}
+    return ActionItemRead.model_construct(**data)
 
 
 def to_comment_read(comment: Comment, author: User) -> CommentRead:
     """Convert Comment SQLModel to CommentRead schema (injecting author identity)."""
-    # Build a dict from the model and add the enriched fields
-    data = {
-        "id": comment.id,
-        "user_id": comment.user_id,
-        "content": comment.content,
-        "created_at": comment.created_at,
-        "action_item_id": comment.action_item_id,
-        "risk_id": comment.risk_id,
-        "author_name": author.name,
-        "author_email": author.email,
-    }
-    return CommentRead.model_validate(data)
+    data = {name: getattr(comment, name) for name in _COMMENT_FIELDS}
+    return CommentRead.model_construct(
+        author_name=author.name, author_email=author.email, **data
+    )
+
+
+def to_project_read(project: Project, show_financials: bool) -> ProjectRead:
+    """Convert Project SQLModel to ProjectRead, nulling budgets when hidden.
+
+    Decide ``show_financials`` (``can_view_financials``) once per request;
+    redacted fields are never read off the row.
+    """
+    if show_financials:
+        return ProjectRead.model_construct(
+            **{name: getattr(project, name) for name in _PROJECT_FIELDS}
+        )
+    return ProjectRead.model_construct(
+        **{name: getattr(project, name) for name in _PROJECT_PUBLIC_FIELDS},
+        **_PROJECT_REDACTED,
+    )
+
+
+def to_project_summary(row: Row) -> ProjectSummary:
+    """Convert a ProjectRepository.list_summary row to ProjectSummary."""
+    return ProjectSummary.model_construct(**row._mapping)
+
+
+def to_risk_read(risk: Risk) -> RiskRead:
+    """Convert Risk SQLModel to RiskRead schema."""
+    return RiskRead.model_construct(
+        **{name: getattr(risk, name) for name in _RISK_FIELDS}
+    )
+
+
+def to_user_read(user: User) -> UserRead:
+    """Convert User SQLModel to UserRead schema."""
+    return UserRead.model_construct(
+        **{name: getattr(user, name) for name in _USER_FIELDS}
+    )
+
+
+def to_user_read_from_row(row: Row) -> UserRead:
+    """Convert a ProjectRepository.get_project_users row to UserRead."""
+    return UserRead.model_construct(**row._mapping)
+
+
+def json_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a trusted read schema straight to a response.
+
+    Returning a Response makes FastAPI skip its response_model validation and
+    jsonable_encoder pass; keep response_model on the route for OpenAPI.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+# Clients keep the body but revalidate on every use, so a read right after a
+# write never sees the old version; an unchanged resource costs only a 304
+_CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+
+def conditional_json_response(request: Request, model: BaseModel) -> Response:
+    """json_response with a content ETag; 304 when If-None-Match matches.
+
+    The ETag hashes the serialized body, so any change to the payload
+    (including injected fields like comment_count) yields a new tag.
+    """
+    body = model.model_dump_json().encode()
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": _CONDITIONAL_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def json_list_response(adapter: TypeAdapter, models: Sequence[BaseModel]) -> Response:
+    """Like json_response, for a JSON array encoded by one of the list adapters."""
+    return Response(content=adapter.dump_json(models), media_type="application/json")
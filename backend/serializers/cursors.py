@@ -0,0 +1,61 @@
+"""Opaque keyset-pagination cursor tokens.
+
+A cursor carries the sort key of the last row of a page, so the next request
+resumes with a WHERE predicate and the server keeps no pagination state.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+
+from exceptions import ValidationError
+
+# Everything a tampered or truncated token can raise while being decoded
+_MALFORMED_CURSOR_ERRORS = (
+    binascii.Error,
+    ValueError,
+    KeyError,
+    TypeError,
+    AttributeError,
+)
+
+
+def _encode_key(*values: str) -> str:
+    payload = json.dumps({"k": list(values)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_key(token: str) -> list:
+    padded = token + "=" * (-len(token) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))["k"]
+
+
+def encode_id_cursor(last_id: uuid.UUID) -> str:
+    """Encode the id of a page's last row as a URL-safe token."""
+    return _encode_key(str(last_id))
+
+
+def decode_id_cursor(token: str) -> uuid.UUID:
+    """Decode a token from encode_id_cursor; ValidationError if it is malformed."""
+    try:
+        (last_id,) = _decode_key(token)
+        return uuid.UUID(last_id)
+    except _MALFORMED_CURSOR_ERRORS as e:
+        raise ValidationError("Invalid pagination cursor") from e
+
+
+def encode_name_id_cursor(name: str, last_id: uuid.UUID) -> str:
+    """Encode the (name, id) sort key of a page's last row as a URL-safe token."""
+    return _encode_key(name, str(last_id))
+
+
+def decode_name_id_cursor(token: str) -> tuple[str, uuid.UUID]:
+    """Decode a token from encode_name_id_cursor; ValidationError if it is malformed."""
+    try:
+        name, last_id = _decode_key(token)
+        if not isinstance(name, str):
+            raise TypeError("cursor name must be a string")
+        return name, uuid.UUID(last_id)
+    except _MALFORMED_CURSOR_ERRORS as e:
+        raise ValidationError("Invalid pagination cursor") from e
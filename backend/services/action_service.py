@@ -1,17 +1,17 @@
 """Action service for business logic."""
 
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from sqlmodel import Session
 
 from exceptions import AuthorizationError, ResourceNotFoundError, ValidationError
-from models import ActionItem, Comment, Project, User
-from permissions import can_delete_action, is_internal_user
+from models import ActionItem, ActionStatus, Comment, User
+from permissions import can_delete_action
 from repositories.action_repository import ActionRepository
 from repositories.comment_repository import CommentRepository
-from repositories.project_repository import ProjectRepository
 from schemas import ActionItemCreate
+from services.project_service import ProjectService
 
 
 class ActionService:
@@ -20,25 +20,9 @@ class ActionService:
     def __init__(self, session: Session):
         self.session = session
         self.repository = ActionRepository(session)
-        self.project_repository = ProjectRepository(session)
+        self.project_service = ProjectService(session)
         self.comment_repository = CommentRepository(session)
 
-    def _check_project_access(self, project: Project, user: User) -> None:
-        """Verify user has access to the project. Raises AuthorizationError if not.
-
-        Note: Project must be pre-fetched by caller to avoid duplicate queries.
-        """
-        if is_internal_user(user):
-            return  # Cogniters have access to all projects
-
-        if not project.is_published:
-            raise AuthorizationError("This project is not published")
-
-        # project.id is guaranteed to be set after fetching from DB
-        assert project.id is not None
-        if not self.project_repository.user_has_access(project.id, user.id):
-            raise AuthorizationError("You don't have access to this project")
-
     def get_action_by_id(self, action_id: UUID) -> ActionItem:
         """Get an action item by ID (no access check)."""
         action = self.repository.get_by_id(action_id)
@@ -53,121 +37,75 @@ class ActionService:
         It verifies the user has access to the action's project before returning.
         """
         action = self.get_action_by_id(action_id)
-
-        # Fetch project for access check
-        project = self.project_repository.get_by_id(action.project_id)
-        if not project:
-            raise ResourceNotFoundError(
-                f"Project with ID {action.project_id} not found"
-            )
-
-        # Verify access to project
-        self._check_project_access(project, user)
-
+        self._check_action_access(action, user)
         return action
 
-    def get_action_with_comment_count(
-        self, action_id: UUID, user: User
-    ) -> Tuple[ActionItem, int]:
-        """Get an action item by ID with access check and comment count.
-
-        Returns a tuple of (action, comment_count) for use in serialization.
-        """
-        action = self.get_action_for_user(action_id, user)
-        counts = self.comment_repository.count_for_actions([action.id])
-        return action, counts.get(action.id, 0)
+    def _check_action_access(self, action: ActionItem, user: User) -> None:
+        """Verify user has access to the action's project."""
+        self.project_service.get_project_for_user(action.project_id, user)
 
     def get_project_actions(self, project_id: UUID, user: User) -> List[ActionItem]:
         """Get all action items for a project."""
-        # Verify project exists
-        project = self.project_repository.get_by_id(project_id)
-        if not project:
-            raise ResourceNotFoundError(f"Project with ID {project_id} not found")
-
-        # Verify access (pass already-fetched project)
-        self._check_project_access(project, user)
+        self.project_service.get_project_for_user(project_id, user)
 
         return self.repository.get_by_project(project_id)
 
-    def get_project_actions_with_comment_counts(
+    def iter_project_actions(
         self, project_id: UUID, user: User
-    ) -> List[Tuple[ActionItem, int]]:
-        """Get all action items for a project with their comment counts."""
-        actions = self.get_project_actions(project_id, user)
-        if not actions:
-            return []
+    ) -> Tuple[int, Iterator[List[ActionItem]]]:
+        """Stream all action items for a project in batches.
+
+        Existence and access are checked before returning, so errors surface
+        as normal responses; the rows are then produced batch by batch.
 
-        action_ids = [a.id for a in actions]
-        counts = self.comment_repository.count_for_actions(action_ids)
-        return [(action, counts.get(action.id, 0)) for action in actions]
+        Returns:
+            Tuple of (total action count, iterator of action batches)
+        """
+        self.project_service.get_project_for_user(project_id, user)
+
+        total = self.repository.count_by_project(project_id)
+        return total, self.repository.iter_batches_by_project(project_id)
 
     def get_project_actions_paginated(
         self,
         project_id: UUID,
         user: User,
         limit: int = 25,
-        offset: int = 0,
+        cursor_id: Optional[UUID] = None,
         search: Optional[str] = None,
-        statuses: Optional[List[str]] = None,
-    ) -> Tuple[List[Tuple[ActionItem, int]], int]:
+        statuses: Optional[List[ActionStatus]] = None,
+        with_total: bool = True,
+    ) -> Tuple[List[ActionItem], Optional[int], Optional[UUID]]:
         """
-        Get paginated action items for a project with their comment counts.
+        Get paginated action items for a project.
 
         Args:
             project_id: The project UUID
             user: The requesting user
             limit: Maximum number of results (default 25)
-            offset: Number of results to skip (default 0)
+            cursor_id: Id of the last action on the previous page, if any
             search: Optional search term for title or jira_id
-            statuses: Optional list of status strings to filter by
+            statuses: Optional list of statuses to filter by
+            with_total: Whether to count all matching actions
 
         Returns:
-            Tuple of (list of (action, comment_count) tuples, total count)
+            Tuple of (list of actions, total count or None when not
+            requested, cursor for the next page or None)
         """
-        from models import ActionStatus
-
-        # Verify project exists and user has access
-        project = self.project_repository.get_by_id(project_id)
-        if not project:
-            raise ResourceNotFoundError(f"Project with ID {project_id} not found")
-        self._check_project_access(project, user)
-
-        # Convert status strings to enum values
-        status_enums = None
-        if statuses:
-            try:
-                status_enums = [ActionStatus(s) for s in statuses]
-            except ValueError:
-                pass  # Invalid status values are ignored
-
-        # Get paginated actions
-        actions, total = self.repository.page_by_project(
+        self.project_service.get_project_for_user(project_id, user)
+
+        return self.repository.page_by_project(
             project_id=project_id,
             limit=limit,
-            offset=offset,
+            cursor_id=cursor_id,
             search=search,
-            statuses=status_enums,
+            statuses=statuses,
+            with_total=with_total,
         )
 
-        if not actions:
-            return [], total
-
-        # Get comment counts only for this page
-        action_ids = [a.id for a in actions]
-        counts = self.comment_repository.count_for_actions(action_ids)
-        items_with_counts = [(action, counts.get(action.id, 0)) for action in actions]
-
-        return items_with_counts, total
-
     def create_action(self, data: ActionItemCreate, user: User) -> ActionItem:
         """Create a new action item."""
-        # Verify project exists
-        project = self.project_repository.get_by_id(data.project_id)
-        if not project:
-            raise ResourceNotFoundError(f"Project with ID {data.project_id} not found")
-
-        # Verify access (pass already-fetched project)
-        self._check_project_access(project, user)
+        self.project_service.get_project_for_user(data.project_id, user)
 
         action = ActionItem.model_validate(data)
         return self.repository.create(action)
@@ -184,15 +122,7 @@ class ActionService:
         """Update an action item."""
         action = self.get_action_by_id(action_id)
 
-        # Fetch project for access check
-        project = self.project_repository.get_by_id(action.project_id)
-        if not project:
-            raise ResourceNotFoundError(
-                f"Project with ID {action.project_id} not found"
-            )
-
-        # Verify access to project
-        self._check_project_access(project, user)
+        self.project_service.get_project_for_user(action.project_id, user)
 
         # Update fields if provided
         if title is not None:
@@ -228,7 +158,7 @@ class ActionService:
     # Comment Methods
     # =========================================================================
 
-    def get_comments(self, action_id: UUID, user: User) -> List[Tuple[Comment, User]]:
+    def get_comments(self, action_id: UUID, user: User) -> List[Comment]:
         """
         Get all comments for an action item.
 
@@ -236,15 +166,7 @@ class ActionService:
         """
         action = self.get_action_by_id(action_id)
 
-        # Fetch project for access check
-        project = self.project_repository.get_by_id(action.project_id)
-        if not project:
-            raise ResourceNotFoundError(
-                f"Project with ID {action.project_id} not found"
-            )
-
-        # Verify access to project
-        self._check_project_access(project, user)
+        self.project_service.get_project_for_user(action.project_id, user)
 
         # Get comments with authors
         return self.comment_repository.list_for_action(action_id)
@@ -259,20 +181,17 @@ class ActionService:
         """
         action = self.get_action_by_id(action_id)
 
-        # Fetch project for access check
-        project = self.project_repository.get_by_id(action.project_id)
-        if not project:
-            raise ResourceNotFoundError(
-                f"Project with ID {action.project_id} not found"
-            )
-
-        # Verify access to project
-        self._check_project_access(project, user)
+        self.project_service.get_project_for_user(action.project_id, user)
 
         # Validate content
         if not content or not content.strip():
             raise ValidationError("Comment content is required")
 
+        # Bump the denormalized count in SQL (comment_count + 1, so concurrent
+        # comments cannot lose an update); it commits together with the comment
+        action.comment_count = ActionItem.comment_count + 1  # type: ignore[assignment]
+        self.session.add(action)
+
         # Create and persist the comment
         comment = Comment(
             action_item_id=action_id,
@@ -1,7 +1,12 @@
 """Authentication service for business logic."""
 
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 import firebase_admin
 from firebase_admin import auth as firebase_auth
@@ -73,6 +78,56 @@ def initialize_firebase(settings: Settings):
     _firebase_initialized = True
 
 
+class _VerifiedTokenCache:
+    """Short-lived cache of verified Firebase ID token claims.
+
+    Keyed by a blake2b digest of the token so raw tokens are never held.
+    Entries live for ``ttl`` seconds, never past the token's own ``exp``,
+    and the oldest entry is evicted once ``maxsize`` is reached.
+    """
+
+    def __init__(self, maxsize: int = 8192, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return claims
+
+    def put(self, token: str, claims: dict) -> None:
+        ttl = self.ttl
+        if "exp" in claims:
+            ttl = min(ttl, claims["exp"] - time.time())
+        if ttl <= 0:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# Firebase's public signing keys are already cached by the Admin SDK (its HTTP
+# session honours Cache-Control: max-age); this skips the RSA verification
+# when the same ID token is presented again within a minute
+_verified_tokens = _VerifiedTokenCache()
+
+
 class AuthService:
     """Service layer for authentication-related business logic."""
 
@@ -170,9 +225,13 @@ class AuthService:
 
     def _verify_firebase_token(self, token: str) -> dict:
         """Verify Firebase ID token."""
+        cached = _verified_tokens.get(token)
+        if cached is not None:
+            return cached
         try:
             # Verify the ID token
             decoded_token = firebase_auth.verify_id_token(token)
+            _verified_tokens.put(token, decoded_token)
             return decoded_token
         except firebase_auth.InvalidIdTokenError as e:
             raise AuthenticationError(f"Invalid Firebase token: {str(e)}")
@@ -1,6 +1,6 @@
 """Project service for business logic."""
 
-from typing import List
+from typing import Any, List, Sequence, Tuple
 from uuid import UUID
 
 from sqlmodel import Session
@@ -12,10 +12,13 @@ from permissions import (
     can_edit_project,
     can_manage_team,
     can_publish_project,
+    can_view_financials,
     is_internal_user,
 )
 from repositories.project_repository import ProjectRepository
+from repositories.user_repository import UserRepository
 from schemas.project import ProjectCreate, ProjectUpdate
+from services.user_service import UserService
 
 
 class ProjectService:
@@ -23,6 +26,8 @@ class ProjectService:
 
     def __init__(self, session: Session):
         self.repository = ProjectRepository(session)
+        self.user_repository = UserRepository(session)
+        self.user_service = UserService(session)
         self.session = session
 
     def get_project_by_id(self, project_id: UUID) -> Project:
@@ -32,6 +37,26 @@ class ProjectService:
             raise ResourceNotFoundError(f"Project with ID {project_id} not found")
         return project
 
+    def get_project_for_user(self, project_id: UUID, user: User) -> Project:
+        """Get a project by ID, verifying the user may access it.
+
+        Cogniters can access all projects; clients must be assigned and the
+        project must be published. For clients the project and their
+        membership are fetched in one query.
+        """
+        if is_internal_user(user):
+            return self.get_project_by_id(project_id)
+
+        row = self.repository.get_with_access(project_id, user.id)
+        if row is None:
+            raise ResourceNotFoundError(f"Project with ID {project_id} not found")
+        project, is_member = row
+        if not project.is_published:
+            raise AuthorizationError("This project is not published")
+        if not is_member:
+            raise AuthorizationError("You don't have access to this project")
+        return project
+
     def get_all_projects(self) -> List[Project]:
         """Get all projects."""
         return self.repository.get_all()
@@ -41,13 +66,24 @@ class ProjectService:
         return self.repository.get_published_projects()
 
     def get_user_projects(self, user: User) -> List[Project]:
-        """Get projects accessible to a user."""
+        """Get projects accessible to a user.
+
+        Budget columns are not loaded for users who may not view financials.
+        """
         if is_internal_user(user):
             # Cogniters see all projects
             return self.repository.get_all()
         else:
             # Clients only see assigned projects
-            return self.repository.get_user_projects(user.id)
+            return self.repository.get_user_projects(
+                user.id, include_financials=can_view_financials(user)
+            )
+
+    def get_user_project_summaries(self, user: User) -> Sequence[Any]:
+        """Get lightweight summary rows for the projects accessible to a user."""
+        if is_internal_user(user):
+            return self.repository.list_summary()
+        return self.repository.list_summary(user_id=user.id)
 
     def create_project(self, project_data: ProjectCreate, creator: User) -> Project:
         """Create a new project."""
@@ -105,6 +141,83 @@ class ProjectService:
 
         self.repository.add_user_to_project(project_id, user_id)
 
+    def assign_by_email(
+        self, project_id: UUID, email: str, assigner: User
+    ) -> Tuple[User, bool]:
+        """Assign a user to a project by email, inviting them if unknown.
+
+        The project check and user lookup share one query, and a new pending
+        user is written in the same transaction as the assignment. If a
+        concurrent request creates the same email first, its user is assigned.
+        Returns tuple of (user, was_created).
+        """
+        if not can_manage_team(assigner):
+            raise AuthorizationError("Only Cogniters can assign users to projects")
+
+        project_exists, user = self.repository.find_user_for_invite(project_id, email)
+        if not project_exists:
+            raise ResourceNotFoundError(f"Project with ID {project_id} not found")
+
+        was_created = False
+        if user is None:
+            pending = self.user_service.build_pending_user(email)
+            if self.user_repository.insert_missing([pending]):
+                user, was_created = pending, True
+            else:
+                # Lost the race for this email; assign whoever won it
+                user = self.user_repository.get_by_email(email)
+                assert user is not None
+
+        # Commits the pending user (if any) together with the assignment
+        self.repository.add_user_to_project(project_id, user.id)
+        return user, was_created
+
+    def assign_by_emails(
+        self, project_id: UUID, emails: List[str], assigner: User
+    ) -> Tuple[List[User], List[User]]:
+        """Assign users to a project by email, inviting any that are unknown.
+
+        A fixed number of statements regardless of batch size: one lookup for
+        existing users, one insert for the new pending users and one insert
+        for the assignments, committed together. Emails created concurrently
+        by another request are assigned rather than re-created.
+        Returns tuple of (users in request order, newly created users).
+        """
+        if not can_manage_team(assigner):
+            raise AuthorizationError("Only Cogniters can assign users to projects")
+
+        self.get_project_by_id(project_id)
+
+        # Normalize and dedupe, keeping request order. Users are keyed by the
+        # same lower-cased form the case-insensitive lookup matches on, so
+        # legacy mixed-case rows are found too
+        emails = list(dict.fromkeys(email.strip().lower() for email in emails))
+        by_email = {
+            user.email.lower(): user
+            for user in self.user_repository.get_by_emails(emails)
+        }
+        created = [
+            self.user_service.build_pending_user(email)
+            for email in emails
+            if email not in by_email
+        ]
+        if created and self.user_repository.insert_missing(created) < len(created):
+            # Some emails were taken concurrently; keep only the rows we wrote
+            winners = {
+                user.email.lower(): user
+                for user in self.user_repository.get_by_emails(
+                    [user.email for user in created]
+                )
+            }
+            created = [user for user in created if winners[user.email].id == user.id]
+            by_email.update(winners)
+        by_email.update((user.email, user) for user in created)
+
+        users = [by_email[email] for email in emails]
+        # Commits the pending users (if any) together with the assignments
+        self.repository.add_users_to_project(project_id, [user.id for user in users])
+        return users, created
+
     def remove_user_from_project(
         self, project_id: UUID, user_id: UUID, remover: User
     ) -> None:
@@ -124,8 +237,8 @@ class ProjectService:
         # Clients need to be assigned
         return self.repository.user_has_access(project_id, user.id)
 
-    def get_project_users(self, project_id: UUID) -> List[User]:
-        """Get all users assigned to a project."""
+    def get_project_users(self, project_id: UUID) -> Sequence[Any]:
+        """Get listing rows for all users assigned to a project."""
         # Verify project exists
         self.get_project_by_id(project_id)
         return self.repository.get_project_users(project_id)
@@ -7,7 +7,7 @@ from uuid import UUID
 from sqlmodel import Session
 
 from exceptions import AuthorizationError, ResourceNotFoundError, ValidationError
-from models import Comment, Project, Risk, RiskStatus, User
+from models import Comment, Risk, RiskStatus, User
 from permissions import (
     can_delete_risk,
     can_reopen_risk,
@@ -16,9 +16,9 @@ from permissions import (
     is_internal_user,
 )
 from repositories.comment_repository import CommentRepository
-from repositories.project_repository import ProjectRepository
 from repositories.risk_repository import RiskRepository
 from schemas import RiskCreate, RiskUpdate
+from services.project_service import ProjectService
 
 
 class RiskService:
@@ -27,25 +27,9 @@ class RiskService:
     def __init__(self, session: Session):
         self.session = session
         self.repository = RiskRepository(session)
-        self.project_repository = ProjectRepository(session)
+        self.project_service = ProjectService(session)
         self.comment_repository = CommentRepository(session)
 
-    def _check_project_access(self, project: Project, user: User) -> None:
-        """Verify user has access to the project. Raises AuthorizationError if not.
-
-        Note: Project must be pre-fetched by caller to avoid duplicate queries.
-        """
-        if is_internal_user(user):
-            return  # Cogniters have access to all projects
-
-        if not project.is_published:
-            raise AuthorizationError("This project is not published")
-
-        # project.id is guaranteed to be set after fetching from DB
-        assert project.id is not None
-        if not self.project_repository.user_has_access(project.id, user.id):
-            raise AuthorizationError("You don't have access to this project")
-
     def get_risk_by_id(self, risk_id: UUID) -> Risk:
         """Get a risk by ID (no access check)."""
         risk = self.repository.get_by_id(risk_id)
@@ -58,55 +42,38 @@ class RiskService:
 
         This is the public method routers should use when fetching a single risk.
         It verifies the user has access to the risk's project before returning.
+        Cogniters have access to all projects; for clients the risk, its
+        project's published flag and their membership come from one query.
         """
-        risk = self.get_risk_by_id(risk_id)
-
-        # Fetch project for access check
-        project = self.project_repository.get_by_id(risk.project_id)
-        if not project:
-            raise ResourceNotFoundError(f"Project with ID {risk.project_id} not found")
-
-        # Verify access to project
-        self._check_project_access(project, user)
+        if is_internal_user(user):
+            return self.get_risk_by_id(risk_id)
 
+        row = self.repository.get_with_access(risk_id, user.id)
+        if row is None:
+            raise ResourceNotFoundError(f"Risk with ID {risk_id} not found")
+        risk, is_published, is_member = row
+        if not is_published:
+            raise AuthorizationError("This project is not published")
+        if not is_member:
+            raise AuthorizationError("You don't have access to this project")
         return risk
 
     def get_project_risks(self, project_id: UUID, user: User) -> List[Risk]:
         """Get all risks for a project."""
-        # Verify project exists
-        project = self.project_repository.get_by_id(project_id)
-        if not project:
-            raise ResourceNotFoundError(f"Project with ID {project_id} not found")
-
-        # Verify access (pass already-fetched project)
-        self._check_project_access(project, user)
+        self.project_service.get_project_for_user(project_id, user)
 
         return self.repository.get_by_project(project_id)
 
     def create_risk(self, data: RiskCreate, user: User) -> Risk:
         """Create a new risk."""
-        # Verify project exists
-        project = self.project_repository.get_by_id(data.project_id)
-        if not project:
-            raise ResourceNotFoundError(f"Project with ID {data.project_id} not found")
-
-        # Verify access (pass already-fetched project)
-        self._check_project_access(project, user)
+        self.project_service.get_project_for_user(data.project_id, user)
 
         risk = Risk.model_validate(data)
         return self.repository.create(risk)
 
     def update_risk(self, risk_id: UUID, data: RiskUpdate, user: User) -> Risk:
         """Update a risk's details (not status)."""
-        risk = self.get_risk_by_id(risk_id)
-
-        # Fetch project for access check
-        project = self.project_repository.get_by_id(risk.project_id)
-        if not project:
-            raise ResourceNotFoundError(f"Project with ID {risk.project_id} not found")
-
-        # Verify access
-        self._check_project_access(project, user)
+        risk = self.get_risk_for_user(risk_id, user)
 
         # Only Cogniters can update risks
         if not can_update_risk(user):
@@ -132,15 +99,7 @@ class RiskService:
         - Sets resolved_at and resolved_by automatically
         - Clears any previous reopen fields
         """
-        risk = self.get_risk_by_id(risk_id)
-
-        # Fetch project for access check
-        project = self.project_repository.get_by_id(risk.project_id)
-        if not project:
-            raise ResourceNotFoundError(f"Project with ID {risk.project_id} not found")
-
-        # Verify access to project
-        self._check_project_access(project, user)
+        risk = self.get_risk_for_user(risk_id, user)
 
         # Only Cogniters can resolve risks
         if not can_resolve_risk(user):
@@ -177,15 +136,7 @@ class RiskService:
         - Sets reopened_at and reopened_by automatically
         - Changes status back to OPEN
         """
-        risk = self.get_risk_by_id(risk_id)
-
-        # Fetch project for access check
-        project = self.project_repository.get_by_id(risk.project_id)
-        if not project:
-            raise ResourceNotFoundError(f"Project with ID {risk.project_id} not found")
-
-        # Verify access to project
-        self._check_project_access(project, user)
+        risk = self.get_risk_for_user(risk_id, user)
 
         # Only Cogniters can reopen risks
         if not can_reopen_risk(user):
@@ -221,15 +172,7 @@ class RiskService:
 
         Both Cogniters and assigned Clients can comment on risks.
         """
-        risk = self.get_risk_by_id(risk_id)
-
-        # Fetch project for access check
-        project = self.project_repository.get_by_id(risk.project_id)
-        if not project:
-            raise ResourceNotFoundError(f"Project with ID {risk.project_id} not found")
-
-        # Verify access to project
-        self._check_project_access(project, user)
+        self.get_risk_for_user(risk_id, user)
 
         # Validate content
         if not content or not content.strip():
@@ -240,17 +183,9 @@ class RiskService:
 
         return comment, user
 
-    def get_comments(self, risk_id: UUID, user: User) -> List[Tuple[Comment, User]]:
+    def get_comments(self, risk_id: UUID, user: User) -> List[Comment]:
         """Get all comments for a risk."""
-        risk = self.get_risk_by_id(risk_id)
-
-        # Fetch project for access check
-        project = self.project_repository.get_by_id(risk.project_id)
-        if not project:
-            raise ResourceNotFoundError(f"Project with ID {risk.project_id} not found")
-
-        # Verify access to project
-        self._check_project_access(project, user)
+        self.get_risk_for_user(risk_id, user)
 
         # Get comments with authors
         return self.comment_repository.list_for_risk(risk_id)
@@ -0,0 +1,130 @@
+"""Execution of claimed sync jobs, shared by the API process and the worker."""
+
+import asyncio
+import contextlib
+from uuid import UUID
+
+import anyio.to_thread
+import structlog
+from sqlmodel import Session
+
+from config import Settings
+from database import get_session_context
+from exceptions import ResourceNotFoundError
+from models import Project, SyncJob, SyncJobType
+from services.sync_job_service import SyncJobService
+from services.sync_service import SyncService
+
+logger = structlog.get_logger()
+
+# How often a runner refreshes its job's lease; keep well below
+# SYNC_JOB_STALE_AFTER_MINUTES so a live job is never requeued
+HEARTBEAT_INTERVAL_SECONDS = 30
+
+
+def _refresh_lease(job_id: UUID, claim_id: UUID) -> bool:
+    # Own session: the job's session is mid-transaction in the sync itself
+    with get_session_context() as session:
+        return SyncJobService(session).heartbeat(job_id, claim_id)
+
+
+async def _heartbeat(job_id: UUID, claim_id: UUID) -> None:
+    """Keep a running job's lease fresh until cancelled or the claim is lost."""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+        try:
+            alive = await anyio.to_thread.run_sync(_refresh_lease, job_id, claim_id)
+        except Exception as e:
+            logger.warning(
+                "Sync job heartbeat failed", job_id=str(job_id), error=str(e)
+            )
+            continue
+        if not alive:
+            logger.warning("Sync job claim lost", job_id=str(job_id))
+            return
+
+
+async def execute_sync_job(session: Session, job: SyncJob, settings: Settings) -> None:
+    """
+    Run a claimed (RUNNING) sync job and record its outcome.
+
+    Failures are caught and stored on the job; this never raises for
+    integration errors. The job's lease is heartbeated while it runs, and the
+    outcome is only written if this runner still holds the claim.
+    """
+    sync_job_service = SyncJobService(session)
+    job_id = job.id
+    assert job.claim_id is not None
+    heartbeat = asyncio.create_task(_heartbeat(job_id, job.claim_id))
+
+    # Counters are accumulated here and persisted once with the final status
+    items_synced = 0
+    items_created = 0
+    items_updated = 0
+    error_message = None
+
+    try:
+        # Get the project
+        project = session.get(Project, job.project_id)
+        if not project:
+            raise ResourceNotFoundError(f"Project {job.project_id} not found")
+
+        # Create sync service with the runner's session
+        sync_service = SyncService(session, settings)
+
+        try:
+            if job.job_type == SyncJobType.JIRA:
+                result = await sync_service.sync_jira_data(project)
+                items_synced = result.actions_count
+                items_created = result.actions_created
+                items_updated = result.actions_updated
+                if result.error:
+                    error_message = result.error
+
+            elif job.job_type == SyncJobType.PRECURSIVE:
+                result = await sync_service.sync_precursive_data(project)
+                items_synced = result.risks_count
+                if result.error:
+                    error_message = result.error
+
+            elif job.job_type == SyncJobType.FULL:
+                result = await sync_service.sync_project(job.project_id)
+                items_synced = result.jira.actions_count + result.precursive.risks_count
+                items_created = result.jira.actions_created
+                items_updated = result.jira.actions_updated
+                if result.jira.error or result.precursive.error:
+                    errors = []
+                    if result.jira.error:
+                        errors.append(f"Jira: {result.jira.error}")
+                    if result.precursive.error:
+                        errors.append(f"Precursive: {result.precursive.error}")
+                    error_message = "; ".join(errors)
+        finally:
+            await sync_service.close()
+
+    except Exception as e:
+        logger.error("Sync job failed", job_id=str(job_id), error=str(e), exc_info=True)
+        error_message = str(e)
+    finally:
+        heartbeat.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await heartbeat
+
+    # Mark job as complete (a no-op if the claim was lost meanwhile)
+    if error_message:
+        finished = sync_job_service.mark_failed(
+            job, error_message, items_synced, items_created, items_updated
+        )
+    else:
+        finished = sync_job_service.mark_succeeded(
+            job, items_synced, items_created, items_updated
+        )
+    if not finished:
+        return
+
+    logger.info(
+        "Sync job completed",
+        job_id=str(job_id),
+        status=job.status,
+        items_synced=job.items_synced,
+    )
@@ -1,17 +1,70 @@
 """Sync Job service for managing sync job lifecycle."""
 
+import asyncio
+import threading
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 import structlog
 from sqlmodel import Session
 
+from exceptions import DuplicateResourceError
 from models import SyncJob, SyncJobStatus, SyncJobType
 from repositories.sync_job_repository import SyncJobRepository
 
 logger = structlog.get_logger()
 
+TERMINAL_STATUSES = frozenset({SyncJobStatus.SUCCEEDED, SyncJobStatus.FAILED})
+
+
+class _JobStatusWaiters:
+    """In-process wake-ups for requests long-polling a sync job.
+
+    ``notify`` is called after every committed status change and may run on
+    any thread; waiters are woken on their own event loop. Only jobs run by
+    this process are signalled, so callers must still re-read the job after
+    a timeout.
+    """
+
+    def __init__(self):
+        self._waiters: Dict[
+            UUID, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    async def wait(self, job_id: UUID, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a status change; True if notified."""
+        entry = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters.setdefault(job_id, []).append(entry)
+        try:
+            await asyncio.wait_for(entry[1].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                entries = self._waiters.get(job_id)
+                if entries and entry in entries:
+                    entries.remove(entry)
+                    if not entries:
+                        del self._waiters[job_id]
+
+    def notify(self, job_id: UUID) -> None:
+        """Wake every request currently waiting on ``job_id``."""
+        with self._lock:
+            entries = self._waiters.pop(job_id, [])
+        for loop, event in entries:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's loop has already shut down
+                pass
+
+
+job_status_waiters = _JobStatusWaiters()
+
 
 class SyncJobService:
     """Service for managing sync job persistence and lifecycle."""
@@ -53,69 +106,117 @@ class SyncJobService:
         """Get the most recent successful job for incremental sync."""
         return self.repository.get_last_successful_job(project_id, job_type)
 
+    def last_successful_per_project(self, job_type: SyncJobType) -> Dict[UUID, SyncJob]:
+        """Get the most recent successful job of a type, keyed by project id."""
+        return self.repository.last_successful_per_project(job_type)
+
     def get_jobs_for_project(self, project_id: UUID, limit: int = 10) -> List[SyncJob]:
         """Get recent sync jobs for a project."""
         return self.repository.get_jobs_for_project(project_id, limit)
 
-    def create_job(
-        self,
-        project_id: UUID,
-        job_type: SyncJobType,
-        user_id: UUID,
-    ) -> SyncJob:
-        """
-        Create a new sync job in queued state.
+    def release_connection(self) -> None:
+        """End the session's transaction so its pooled connection is returned.
 
-        Returns the created job with ID populated.
+        Loaded jobs stay readable (detached); the next query checks a
+        connection out again.
         """
-        job = SyncJob(
-            project_id=project_id,
-            job_type=job_type,
-            status=SyncJobStatus.QUEUED,
-            requested_by_user_id=user_id,
-        )
-        self.session.add(job)
-        self.session.commit()
-        self.session.refresh(job)
+        self.session.close()
 
-        logger.info(
-            "Sync job created",
-            job_id=str(job.id),
-            project_id=str(project_id),
-            job_type=job_type,
-        )
+    def claim_pending_jobs(self, limit: int = 1) -> List[SyncJob]:
+        """Claim up to ``limit`` queued jobs for this worker (marked running)."""
+        jobs = self.repository.claim_pending_jobs(limit)
+        for job in jobs:
+            job_status_waiters.notify(job.id)
+        return jobs
 
+    def claim_job(self, job_id: UUID) -> Optional[SyncJob]:
+        """Claim one queued job for this runner; None if it was taken already."""
+        job = self.repository.claim_job(job_id)
+        self.session.commit()
+        if job:
+            job_status_waiters.notify(job.id)
         return job
 
-    def mark_running(self, job: SyncJob) -> None:
-        """Mark a job as running with started_at timestamp."""
-        job.status = SyncJobStatus.RUNNING
-        job.started_at = datetime.now(timezone.utc)
-        self.session.add(job)
+    def requeue_stale_jobs(self, heartbeat_before: datetime) -> List[SyncJob]:
+        """Return jobs abandoned by a dead runner to the queue."""
+        jobs = self.repository.requeue_stale_jobs(heartbeat_before)
         self.session.commit()
+        for job in jobs:
+            logger.warning("Requeued stale sync job", job_id=str(job.id))
+            job_status_waiters.notify(job.id)
+        return jobs
 
-    def mark_succeeded(self, job: SyncJob, items_synced: int = 0) -> None:
-        """Mark a job as succeeded with completion timestamp."""
-        job.status = SyncJobStatus.SUCCEEDED
-        job.items_synced = items_synced
-        job.completed_at = datetime.now(timezone.utc)
-        self.session.add(job)
+    def heartbeat(self, job_id: UUID, claim_id: UUID) -> bool:
+        """Refresh a running job's lease; False if its claim was lost."""
+        alive = self.repository.heartbeat(job_id, claim_id)
         self.session.commit()
+        return alive
+
+    def mark_succeeded(
+        self,
+        job: SyncJob,
+        items_synced: int = 0,
+        items_created: int = 0,
+        items_updated: int = 0,
+    ) -> bool:
+        """Mark a job as succeeded with completion timestamp.
+
+        Counters are accumulated by the sync run and written here in the same
+        single UPDATE as the status transition, never per processed item.
+        Returns False (writing nothing) if the runner no longer holds the
+        job's claim.
+        """
+        return self._finish(
+            job,
+            status=SyncJobStatus.SUCCEEDED,
+            items_synced=items_synced,
+            items_created=items_created,
+            items_updated=items_updated,
+            completed_at=datetime.now(timezone.utc),
+        )
+
+    def mark_failed(
+        self,
+        job: SyncJob,
+        error: str,
+        items_synced: int = 0,
+        items_created: int = 0,
+        items_updated: int = 0,
+    ) -> bool:
+        """Mark a job as failed with error message and completion timestamp.
+
+        Returns False (writing nothing) if the runner no longer holds the
+        job's claim.
+        """
+        return self._finish(
+            job,
+            status=SyncJobStatus.FAILED,
+            error=error,
+            items_synced=items_synced,
+            items_created=items_created,
+            items_updated=items_updated,
+            completed_at=datetime.now(timezone.utc),
+        )
 
-    def mark_failed(self, job: SyncJob, error: str, items_synced: int = 0) -> None:
-        """Mark a job as failed with error message and completion timestamp."""
-        job.status = SyncJobStatus.FAILED
-        job.error = error
-        job.items_synced = items_synced
-        job.completed_at = datetime.now(timezone.utc)
-        self.session.add(job)
+    def _finish(self, job: SyncJob, **values: Any) -> bool:
+        finished = self.repository.finish(job, **values)
         self.session.commit()
+        if finished:
+            job_status_waiters.notify(job.id)
+        else:
+            logger.warning(
+                "Sync job claim lost; discarding result",
+                job_id=str(job.id),
+                status=values["status"],
+            )
+        return finished
 
     def enqueue_or_get_existing(
         self,
         project_id: UUID,
         job_type: SyncJobType,
         user_id: UUID,
+        stale_before: Optional[datetime] = None,
     ) -> tuple[SyncJob, bool]:
         """
         Create and enqueue a sync job, or return existing running job.
@@ -123,20 +224,55 @@ class SyncJobService:
         Implements job deduplication - if a job of the same type is already
         running for this project, returns that job instead of creating a new one.
 
+        With ``stale_before``, an existing job with no heartbeat (or, if still
+        queued, created) since then is taken to be orphaned, e.g. by an API
+        restart mid-sync: it is failed and a new job is created in its place.
+        Without it, stale jobs are left for the sync worker to requeue.
+
         Returns:
             Tuple of (job, deduplicated) where deduplicated is True if returning
             an existing queued/running job.
         """
-        # Check for existing running job (deduplication)
-        existing_job = self.get_running_job(project_id, job_type)
-        if existing_job:
-            logger.info(
-                "Returning existing running job",
-                job_id=str(existing_job.id),
-                job_type=job_type,
+        # The unique partial index decides the race: the INSERT either wins
+        # or conflicts with the active job, which is then read back. If that
+        # job finishes in between, the INSERT is simply retried.
+        for _ in range(3):
+            job = self.repository.create_if_no_active(
+                SyncJob(
+                    project_id=project_id,
+                    job_type=job_type,
+                    status=SyncJobStatus.QUEUED,
+                    requested_by_user_id=user_id,
+                )
             )
-            return existing_job, True
+            if job:
+                self.session.commit()
+                logger.info(
+                    "Sync job created",
+                    job_id=str(job.id),
+                    project_id=str(project_id),
+                    job_type=job_type,
+                )
+                return job, False
 
-        # Create new job
-        job = self.create_job(project_id, job_type, user_id)
-        return job, False
+            existing_job = self.get_running_job(project_id, job_type)
+            if (
+                existing_job
+                and stale_before is not None
+                and self.repository.fail_if_stale(existing_job.id, stale_before)
+            ):
+                self.session.commit()
+                logger.warning("Failed orphaned sync job", job_id=str(existing_job.id))
+                job_status_waiters.notify(existing_job.id)
+                continue
+            if existing_job:
+                logger.info(
+                    "Returning existing running job",
+                    job_id=str(existing_job.id),
+                    job_type=job_type,
+                )
+                return existing_job, True
+
+        raise DuplicateResourceError(
+            "A sync job of this type is being started; please retry"
+        )
@@ -23,6 +23,8 @@ from models import (
     SyncJob,
     SyncJobType,
 )
+from models.ids import new_id
+from repositories.action_repository import ActionRepository
 from schemas.sync import (
     JiraSyncResult,
     PrecursiveSyncResult,
@@ -292,7 +294,8 @@ class SyncService:
                 a.jira_key: a for a in existing_actions if a.jira_key
             }
 
-            # Update DB
+            # Update DB (new actions are collected and inserted in one batch)
+            new_action_rows: list[dict] = []
             for issue in issues:
                 try:
                     # O(1) lookup instead of per-issue database query
@@ -320,6 +323,7 @@ class SyncService:
                                     issue_key=issue.key,
                                 )
                         self.session.add(existing)
+                        res.actions_updated += 1
                     else:
                         # Parse due_date with error handling to match update behavior
                         due_date = None
@@ -334,17 +338,19 @@ class SyncService:
                                 )
                                 # Continue without due_date instead of skipping the action
 
-                        new_action = ActionItem(
-                            project_id=project.id,
-                            jira_id=issue.id,  # Internal Jira issue ID
-                            jira_key=issue.key,  # Public issue key like "PROJ-123" (indexed)
-                            title=issue.summary or "Untitled",
-                            status=self._map_jira_status(issue.status),
-                            assignee=issue.assignee,
-                            priority=self._map_jira_priority(issue.priority),
-                            due_date=due_date,
+                        new_action_rows.append(
+                            {
+                                "id": new_id(),
+                                "project_id": project.id,
+                                "jira_id": issue.id,  # Internal Jira issue ID
+                                "jira_key": issue.key,  # Public issue key like "PROJ-123" (indexed)
+                                "title": issue.summary or "Untitled",
+                                "status": self._map_jira_status(issue.status),
+                                "assignee": issue.assignee,
+                                "priority": self._map_jira_priority(issue.priority),
+                                "due_date": due_date,
+                            }
                         )
-                        self.session.add(new_action)
                 except Exception as e:
                     logger.error(
                         "Error processing Jira issue", issue_key=issue.key, error=str(e)
@@ -352,6 +358,9 @@ class SyncService:
                     # Continue with next issue instead of failing entire sync
                     continue
 
+            ActionRepository(self.session).bulk_insert(new_action_rows)
+            res.actions_created = len(new_action_rows)
+
             # Fetch Sprint Goals
             if project.jira_board_id:
                 try:
@@ -81,6 +81,8 @@ class UserService:
         search: Optional[str] = None,
         role: Optional[UserRole] = None,
         limit: int = 50,
+        after_name: Optional[str] = None,
+        after_id: Optional[UUID] = None,
     ) -> List[User]:
         """
         Search users by name or email with optional role filtering.
@@ -89,11 +91,19 @@ class UserService:
             search: Optional search string for name or email
             role: Optional role filter
             limit: Maximum number of results to return (default 50)
+            after_name: Name of the last user on the previous page
+            after_id: Id of the last user on the previous page
 
         Returns:
             List of matching users (limited)
         """
-        return self.repository.search(search=search, role=role, limit=limit)
+        return self.repository.search(
+            search=search,
+            role=role,
+            limit=limit,
+            after_name=after_name,
+            after_id=after_id,
+        )
 
     def create_pending_user(self, email: str) -> User:
         """
@@ -112,16 +122,17 @@ class UserService:
         if existing:
             raise DuplicateResourceError(f"User with email {email} already exists")
 
-        # Determine role based on email domain
-        role = self._determine_role(email)
+        return self.repository.create(self.build_pending_user(email))
 
-        # Create placeholder user with email as name (will be updated on registration)
-        user = self.repository.create_pending_user(
+    def build_pending_user(self, email: str) -> User:
+        """Build (but do not save) a pending placeholder user for an invite."""
+        return User(
             email=email,
             name=email.split("@")[0],  # Use email prefix as temporary name
-            role=role,
+            role=self._determine_role(email),
+            auth_provider=AuthProvider.EMAIL,  # Will be updated on registration
+            is_pending=True,
         )
-        return user
 
     def activate_pending_user(
         self, email: str, name: str, auth_provider: AuthProvider
@@ -0,0 +1,66 @@
+"""
+Standalone sync job worker.
+
+Claims queued sync jobs from the database and runs them outside the API
+process, so a sync survives API restarts and never competes with request
+handling. Run one or more alongside the API (with SYNC_WORKER_ENABLED=true
+set for the API too):
+
+    uv run python -m sync_worker
+
+Workers claim jobs with FOR UPDATE SKIP LOCKED, so any number can run
+concurrently; each runs one job at a time. Runners heartbeat their job
+while it runs; a job with no heartbeat for SYNC_JOB_STALE_AFTER_MINUTES
+(its runner died) is requeued, and the dead runner's claim is fenced off.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import structlog
+
+from config import Settings, get_settings
+from database import get_session_context
+from logging_config import configure_logging
+from services.sync_job_runner import execute_sync_job
+from services.sync_job_service import SyncJobService
+
+logger = structlog.get_logger()
+
+
+async def run_once(settings: Settings) -> bool:
+    """Requeue orphaned jobs, then claim and run one job. True if one ran."""
+    heartbeat_before = datetime.now(timezone.utc) - timedelta(
+        minutes=settings.sync_job_stale_after_minutes
+    )
+    with get_session_context() as session:
+        sync_job_service = SyncJobService(session)
+        sync_job_service.requeue_stale_jobs(heartbeat_before)
+        jobs = sync_job_service.claim_pending_jobs(limit=1)
+        for job in jobs:
+            logger.info("Sync job claimed", job_id=str(job.id), job_type=job.job_type)
+            await execute_sync_job(session, job, settings)
+    return bool(jobs)
+
+
+async def run_worker(settings: Settings) -> None:
+    """Process jobs until cancelled, sleeping between polls while idle."""
+    logger.info("Sync worker started", poll_seconds=settings.sync_worker_poll_seconds)
+    while True:
+        try:
+            ran = await run_once(settings)
+        except Exception as e:
+            # Keep the worker alive across transient database errors
+            logger.error("Sync worker poll failed", error=str(e), exc_info=True)
+            ran = False
+        if not ran:
+            await asyncio.sleep(settings.sync_worker_poll_seconds)
+
+
+if __name__ == "__main__":
+    settings = get_settings()
+    configure_logging(settings)
+    try:
+        asyncio.run(run_worker(settings))
+    except KeyboardInterrupt:
+        logger.info("Sync worker stopped")
@@ -6,6 +6,8 @@ from uuid import uuid4
 import pytest
 from fastapi.testclient import TestClient
 from jose import jwt
+from sqlalchemy import event
+from sqlalchemy.orm import raiseload
 from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
@@ -39,6 +41,48 @@ def session_fixture(engine):
         yield session
 
 
+@pytest.fixture(name="request_session")
+def request_session_fixture(engine):
+    """Create a session with the settings of the request-scoped get_session."""
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def query_log(engine):
+    """Record every SQL statement executed on the test engine.
+
+    Assert on ``len(query_log)`` to pin the number of round-trips a code path makes.
+    """
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def no_lazy_loads(session):
+    """Make unplanned lazy relationship loads raise instead of querying.
+
+    Applies ``raiseload("*")`` to every top-level ORM SELECT on the session;
+    relationships must be loaded explicitly (selectinload/joinedload).
+    """
+
+    def _add_raiseload(orm_execute_state):
+        if orm_execute_state.is_select and not orm_execute_state.is_relationship_load:
+            orm_execute_state.statement = orm_execute_state.statement.options(
+                raiseload("*")
+            )
+
+    event.listen(session, "do_orm_execute", _add_raiseload)
+    yield session
+    event.remove(session, "do_orm_execute", _add_raiseload)
+
+
 # =============================================================================
 # Settings Fixtures
 # =============================================================================
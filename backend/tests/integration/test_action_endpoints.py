@@ -116,6 +116,39 @@ class TestGetActionById:
 
         assert response.status_code == 404
 
+    def test_matching_etag_returns_304(self, authenticated_client, sample_action):
+        first = authenticated_client.get(f"/actions/{sample_action.id}")
+        etag = first.headers["ETag"]
+
+        repeat = authenticated_client.get(
+            f"/actions/{sample_action.id}", headers={"If-None-Match": etag}
+        )
+
+        assert repeat.status_code == 304
+        assert repeat.content == b""
+        assert repeat.headers["ETag"] == etag
+
+    def test_cached_response_must_be_revalidated(
+        self, authenticated_client, sample_action
+    ):
+        response = authenticated_client.get(f"/actions/{sample_action.id}")
+
+        # no-cache (and no max-age): a browser must send If-None-Match first
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+    def test_new_comment_changes_etag(self, authenticated_client, sample_action):
+        etag = authenticated_client.get(f"/actions/{sample_action.id}").headers["ETag"]
+        authenticated_client.post(
+            f"/actions/{sample_action.id}/comments", json={"content": "Update"}
+        )
+
+        response = authenticated_client.get(
+            f"/actions/{sample_action.id}", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["comment_count"] == 1
+
 
 # =============================================================================
 # Action Comment Tests
@@ -319,3 +352,89 @@ class TestActionListCommentCount:
         actions = response.json()
         action = next(a for a in actions if a["id"] == str(sample_action.id))
         assert action["comment_count"] == 2
+
+    def test_action_list_is_streamed_as_json_array(
+        self, authenticated_client, sample_action
+    ):
+        """The unpaginated list is a plain JSON array with a total header."""
+        response = authenticated_client.get(
+            f"/actions/?project_id={sample_action.project_id}"
+        )
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["X-Total-Count"] == "1"
+        assert [a["id"] for a in response.json()] == [str(sample_action.id)]
+
+    def test_empty_action_list_is_empty_array(
+        self, authenticated_client, second_project
+    ):
+        response = authenticated_client.get(f"/actions/?project_id={second_project.id}")
+
+        assert response.status_code == 200
+        assert response.json() == []
+        assert response.headers["X-Total-Count"] == "0"
+
+    def test_unknown_project_fails_before_streaming(self, authenticated_client):
+        response = authenticated_client.get(f"/actions/?project_id={uuid4()}")
+
+        assert response.status_code == 404
+
+    def test_paginated_action_list_shape(self, authenticated_client, sample_action):
+        """limit switches to the paginated envelope, serialized as plain JSON."""
+        response = authenticated_client.get(
+            f"/actions/?project_id={sample_action.project_id}&limit=1"
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert body["total"] == 1
+        assert body["limit"] == 1
+        assert body["next_cursor"]  # opaque token
+        assert body["items"][0]["id"] == str(sample_action.id)
+        assert body["items"][0]["comment_count"] == 0
+
+    def test_cursor_pages_skip_total_by_default(
+        self, authenticated_client, sample_action
+    ):
+        base = f"/actions/?project_id={sample_action.project_id}&limit=1"
+        cursor = authenticated_client.get(base).json()["next_cursor"]
+
+        later = authenticated_client.get(f"{base}&cursor={cursor}").json()
+
+        assert later["total"] is None
+        assert later["items"] == []
+        assert later["next_cursor"] is None
+
+    def test_malformed_cursor_is_rejected(self, authenticated_client, sample_action):
+        response = authenticated_client.get(
+            f"/actions/?project_id={sample_action.project_id}&limit=1&cursor=nope"
+        )
+
+        assert response.status_code == 400
+
+    def test_offset_is_rejected(self, authenticated_client, sample_action):
+        response = authenticated_client.get(
+            f"/actions/?project_id={sample_action.project_id}&limit=25&offset=25"
+        )
+
+        assert response.status_code == 400
+        assert "cursor" in response.json()["detail"]
+
+    def test_status_filter_matches_enum_values(
+        self, authenticated_client, sample_action
+    ):
+        base = f"/actions/?project_id={sample_action.project_id}&limit=10"
+
+        todo = authenticated_client.get(f"{base}&status=To Do").json()
+        done = authenticated_client.get(f"{base}&status=Complete").json()
+
+        assert [item["id"] for item in todo["items"]] == [str(sample_action.id)]
+        assert done["items"] == []
+
+    def test_unknown_status_is_rejected(self, authenticated_client, sample_action):
+        response = authenticated_client.get(
+            f"/actions/?project_id={sample_action.project_id}&limit=10&status=Nope"
+        )
+
+        assert response.status_code == 422
@@ -0,0 +1,187 @@
+"""Tests for ActionRepository bulk writes and pagination."""
+
+from sqlalchemy.dialects import postgresql
+
+from models import ActionStatus, Priority
+from models.ids import new_id
+from repositories.action_repository import ActionRepository
+
+
+def _action_rows(project, n, **overrides):
+    """n bulk_insert rows for project: "Issue i" / TEST-i, plus overrides."""
+    return [
+        {
+            "id": new_id(),
+            "project_id": project.id,
+            "title": f"Issue {i}",
+            "status": ActionStatus.TO_DO,
+            "priority": Priority.MEDIUM,
+            "jira_key": f"TEST-{i}",
+            "jira_id": f"1000{i}",
+            **overrides,
+        }
+        for i in range(n)
+    ]
+
+
+def test_bulk_insert_writes_all_rows_in_one_statement(
+    session, sample_project, query_log
+):
+    project_id = sample_project.id
+    rows = _action_rows(sample_project, 25)
+    query_log.clear()
+
+    ActionRepository(session).bulk_insert(rows)
+    statements = len(query_log)
+    session.commit()
+
+    assert statements == 1
+    actions = ActionRepository(session).get_by_project(project_id)
+    assert sorted(a.jira_key for a in actions) == sorted(r["jira_key"] for r in rows)
+
+
+def test_bulk_insert_ignores_empty_batch(session, sample_project, query_log):
+    query_log.clear()
+
+    ActionRepository(session).bulk_insert([])
+
+    assert query_log == []
+
+
+def test_page_by_project_walks_pages_with_cursor(session, sample_project):
+    project_id = sample_project.id
+    repo = ActionRepository(session)
+    repo.bulk_insert(_action_rows(sample_project, 5))
+    session.commit()
+
+    first, total, cursor = repo.page_by_project(project_id, limit=2)
+    second, _, cursor2 = repo.page_by_project(project_id, limit=2, cursor_id=cursor)
+    last, _, cursor3 = repo.page_by_project(project_id, limit=2, cursor_id=cursor2)
+
+    assert total == 5
+    assert cursor == first[-1].id
+    assert cursor3 is None
+    ids = [a.id for a in first + second + last]
+    assert ids == sorted(ids, reverse=True)
+    assert len(set(ids)) == 5
+
+
+def test_page_by_project_counts_all_matches_on_any_page(
+    session, sample_project, query_log
+):
+    project_id = sample_project.id
+    repo = ActionRepository(session)
+    repo.bulk_insert(_action_rows(sample_project, 3))
+    session.commit()
+    first, _, cursor = repo.page_by_project(project_id, limit=2)
+    query_log.clear()
+
+    items, total, _ = repo.page_by_project(project_id, limit=2, cursor_id=cursor)
+    # A cursor past the last row still reports the full total
+    empty, past_end_total, _ = repo.page_by_project(
+        project_id, limit=2, cursor_id=items[-1].id
+    )
+
+    assert len(query_log) == 4  # Page query plus a separate count, twice
+    assert not any("OVER" in sql for sql in query_log)
+    assert total == 3
+    assert len(items) == 1
+    assert empty == []
+    assert past_end_total == 3
+
+
+def test_page_by_project_skips_total_when_not_requested(session, sample_project):
+    repo = ActionRepository(session)
+    rows = _action_rows(sample_project, 1)
+    repo.bulk_insert(rows)
+    session.commit()
+
+    items, total, cursor = repo.page_by_project(
+        sample_project.id, limit=10, with_total=False
+    )
+
+    assert [a.id for a in items] == [rows[0]["id"]]
+    assert total is None
+    assert cursor is None
+
+
+def test_page_by_project_search_matches_substrings_outside_postgres(
+    session, sample_project
+):
+    repo = ActionRepository(session)
+    rows = _action_rows(sample_project, 2)
+    rows[0].update(title="Fix Login bug", jira_id="101")
+    rows[1].update(title="Write docs", jira_id="202")
+    repo.bulk_insert(rows)
+    session.commit()
+
+    def titles(search):
+        return [
+            a.title for a in repo.page_by_project(sample_project.id, search=search)[0]
+        ]
+
+    assert titles("log") == ["Fix Login bug"]
+    assert titles("20") == ["Write docs"]
+
+
+def test_search_filter_uses_full_text_on_postgres():
+    predicate = ActionRepository.search_filter("login bug", "postgresql")
+    sql = str(
+        predicate.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    assert sql == (
+        "to_tsvector('simple', (coalesce(actionitem.title, '') || ' ') || "
+        "coalesce(actionitem.jira_id, '')) @@ plainto_tsquery('simple', 'login bug')"
+    )
+
+
+def test_iter_batches_by_project_yields_bounded_batches(session, sample_project):
+    project_id = sample_project.id
+    repo = ActionRepository(session)
+    repo.bulk_insert(_action_rows(sample_project, 5))
+    session.commit()
+
+    batches = list(repo.iter_batches_by_project(project_id, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert repo.count_by_project(project_id) == 5
+
+
+def test_cached_lookups_bind_each_call_argument(session, sample_project):
+    repo = ActionRepository(session)
+    repo.bulk_insert(_action_rows(sample_project, 2))
+    session.commit()
+
+    # Same cached statement, different bound values on each call
+    assert repo.get_by_jira_key("TEST-0").title == "Issue 0"
+    assert repo.get_by_jira_key("TEST-1").title == "Issue 1"
+    assert repo.get_by_jira_id("10001").title == "Issue 1"
+    assert repo.get_by_jira_key("TEST-9") is None
+
+
+def test_find_applies_optional_filters(session, sample_project):
+    repo = ActionRepository(session)
+    rows = _action_rows(sample_project, 3)
+    for row, (title, status, assignee) in zip(
+        rows,
+        [
+            ("a", ActionStatus.TO_DO, "Ann"),
+            ("b", ActionStatus.COMPLETE, "Ann"),
+            ("c", ActionStatus.TO_DO, "Bob"),
+        ],
+    ):
+        row.update(title=title, status=status, assignee=assignee)
+    repo.bulk_insert(rows)
+    session.commit()
+
+    def titles(**filters):
+        return sorted(a.title for a in repo.find(sample_project.id, **filters))
+
+    assert titles() == ["a", "b", "c"]
+    assert titles(status=ActionStatus.TO_DO) == ["a", "c"]
+    assert titles(assignee="Ann") == ["a", "b"]
+    assert titles(status=ActionStatus.TO_DO, assignee="Bob") == ["c"]
+    assert titles(assignee="Bob") == ["c"]  # cached variant, new value
@@ -0,0 +1,80 @@
+"""Query-count tests for CommentRepository reads."""
+
+from models import ActionItem, Comment, Risk, RiskImpact, RiskProbability
+from repositories.comment_repository import CommentRepository
+
+
+def test_list_for_action_loads_authors_in_one_batch(
+    session, sample_project, cogniter_user, client_user, query_log, no_lazy_loads
+):
+    action = ActionItem(project_id=sample_project.id, title="Action")
+    session.add(action)
+    session.flush()
+    for i, author in enumerate([cogniter_user, client_user, cogniter_user]):
+        session.add(
+            Comment(user_id=author.id, action_item_id=action.id, content=f"c{i}")
+        )
+    session.commit()
+    action_id = action.id
+    session.expire_all()
+    query_log.clear()
+
+    comments = CommentRepository(session).list_for_action(action_id)
+    authors = {comment.content: comment.user.name for comment in comments}
+
+    # One SELECT for the comments, one IN query for the distinct authors
+    assert len(query_log) == 2
+    assert authors == {
+        "c0": cogniter_user.name,
+        "c1": client_user.name,
+        "c2": cogniter_user.name,
+    }
+
+
+def test_list_for_risk_loads_authors_in_one_batch(
+    session, sample_project, cogniter_user, client_user, query_log, no_lazy_loads
+):
+    risk = Risk(
+        project_id=sample_project.id,
+        title="Risk",
+        description="Risk",
+        probability=RiskProbability.LOW,
+        impact=RiskImpact.LOW,
+    )
+    session.add(risk)
+    session.flush()
+    for i, author in enumerate([client_user, cogniter_user, client_user]):
+        session.add(Comment(user_id=author.id, risk_id=risk.id, content=f"c{i}"))
+    session.commit()
+    risk_id = risk.id
+    session.expire_all()
+    query_log.clear()
+
+    comments = CommentRepository(session).list_for_risk(risk_id)
+    authors = {comment.content: comment.user.name for comment in comments}
+
+    # One SELECT for the comments, one IN query for the distinct authors
+    assert len(query_log) == 2
+    assert authors == {
+        "c0": client_user.name,
+        "c1": cogniter_user.name,
+        "c2": client_user.name,
+    }
+
+
+def test_create_returns_server_defaults_without_refresh(
+    request_session, sample_project, cogniter_user, query_log
+):
+    action = ActionItem(project_id=sample_project.id, title="Action")
+    request_session.add(action)
+    request_session.commit()
+    query_log.clear()
+
+    comment = CommentRepository(request_session).create(
+        Comment(user_id=cogniter_user.id, action_item_id=action.id, content="c")
+    )
+
+    # INSERT ... RETURNING created_at only; no follow-up SELECT
+    assert len(query_log) == 1
+    assert query_log[0].lstrip().upper().startswith("INSERT")
+    assert comment.created_at is not None
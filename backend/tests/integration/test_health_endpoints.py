@@ -0,0 +1,24 @@
+"""Integration tests for the health endpoints."""
+
+
+def test_health_does_not_expose_pool_stats(client):
+    response = client.get("/health")
+
+    assert "pool" not in response.json()["services"]["database"]
+
+
+def test_pool_status_requires_authentication(client):
+    assert client.get("/health/pool").status_code == 401
+
+
+def test_pool_status_requires_cogniter(client, client_user, create_token):
+    client.headers["Authorization"] = f"Bearer {create_token(client_user)}"
+
+    assert client.get("/health/pool").status_code == 403
+
+
+def test_pool_status_for_cogniter(authenticated_client):
+    response = authenticated_client.get("/health/pool")
+
+    assert response.status_code == 200
+    assert isinstance(response.json(), dict)
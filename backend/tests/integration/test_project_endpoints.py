@@ -23,6 +23,45 @@ class TestListProjects:
         assert isinstance(data, list)
 
 
+class TestListProjectSummaries:
+    """Tests for GET /projects/summary endpoint."""
+
+    def test_cogniter_gets_summary_fields_only(
+        self, authenticated_client, sample_project, second_project
+    ):
+        response = authenticated_client.get("/projects/summary")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [p["name"] for p in data] == ["Second Project", "Test Project"]
+        assert set(data[0]) == {
+            "id",
+            "name",
+            "health_status",
+            "is_published",
+            "client_name",
+        }
+
+    def test_client_sees_only_assigned_published_projects(
+        self,
+        client,
+        session,
+        client_user,
+        second_project,
+        project_with_client_assigned,
+        create_token,
+    ):
+        client.headers["Authorization"] = f"Bearer {create_token(client_user)}"
+        assert client.get("/projects/summary").json() == []
+
+        project_with_client_assigned.is_published = True
+        session.add(project_with_client_assigned)
+        session.commit()
+
+        data = client.get("/projects/summary").json()
+        assert [p["id"] for p in data] == [str(project_with_client_assigned.id)]
+
+
 class TestCreateProject:
     """Tests for POST /projects endpoint."""
 
@@ -79,6 +118,33 @@ class TestGetProject:
 
         assert response.status_code == 404
 
+    def test_matching_etag_returns_304(self, authenticated_client, sample_project):
+        url = f"/projects/{sample_project.id}"
+        etag = authenticated_client.get(url).headers["ETag"]
+
+        repeat = authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert repeat.status_code == 304
+        assert repeat.headers["ETag"] == etag
+
+    def test_update_changes_etag(self, authenticated_client, sample_project):
+        url = f"/projects/{sample_project.id}"
+        etag = authenticated_client.get(url).headers["ETag"]
+        authenticated_client.patch(url, json={"name": "Renamed"})
+
+        response = authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "Renamed"
+
+    def test_cached_response_must_be_revalidated(
+        self, authenticated_client, sample_project
+    ):
+        response = authenticated_client.get(f"/projects/{sample_project.id}")
+
+        # no-cache (and no max-age): the refetch after an edit reaches the server
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
 
 class TestClientAccessControl:
     """Tests for Client access control on projects - TDD: P0 Security Fix."""
@@ -255,3 +321,109 @@ class TestFinancialFieldLevelAccess:
         assert data["total_budget"] == 1000
         assert data["spent_budget"] == 250
         assert data["remaining_budget"] == 750
+
+
+class TestInviteUser:
+    """Tests for POST /projects/{id}/invite endpoint."""
+
+    def test_mixed_case_email_assigns_existing_user(
+        self, authenticated_client, sample_project, client_user
+    ):
+        response = authenticated_client.post(
+            f"/projects/{sample_project.id}/invite",
+            json={"email": "  Client@ACME.com "},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["was_created"] is False
+        assert data["user"]["id"] == str(client_user.id)
+
+    def test_malformed_email_is_rejected_before_lookup(
+        self, authenticated_client, sample_project
+    ):
+        response = authenticated_client.post(
+            f"/projects/{sample_project.id}/invite", json={"email": "not-an-email"}
+        )
+
+        assert response.status_code == 422
+
+    def test_unknown_email_creates_pending_user_and_assigns(
+        self, authenticated_client, sample_project
+    ):
+        response = authenticated_client.post(
+            f"/projects/{sample_project.id}/invite",
+            json={"email": "new.person@external.com"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["was_created"] is True
+        assert data["user"]["is_pending"] is True
+        users = authenticated_client.get(f"/projects/{sample_project.id}/users").json()
+        assert "new.person@external.com" in [u["email"] for u in users]
+
+    def test_unknown_project_returns_404(self, authenticated_client):
+        response = authenticated_client.post(
+            f"/projects/{uuid4()}/invite", json={"email": "someone@example.com"}
+        )
+
+        assert response.status_code == 404
+
+
+class TestInviteUsersBatch:
+    """Tests for POST /projects/{id}/invite/batch endpoint."""
+
+    def test_assigns_existing_and_invites_unknown_emails(
+        self, authenticated_client, sample_project, client_user, query_log
+    ):
+        query_log.clear()
+        response = authenticated_client.post(
+            f"/projects/{sample_project.id}/invite/batch",
+            json={
+                "emails": [
+                    "Client@ACME.com",
+                    "a.new@external.com",
+                    "b.new@external.com",
+                    "a.new@external.com",
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [u["email"] for u in data["users"]] == [
+            "client@acme.com",
+            "a.new@external.com",
+            "b.new@external.com",
+        ]
+        assert data["users"][0]["id"] == str(client_user.id)
+        assert data["created"] == ["a.new@external.com", "b.new@external.com"]
+        # Inserts are batched: one for the new users, one for the assignments
+        assert len([q for q in query_log if q.startswith("INSERT")]) == 2
+
+        users = authenticated_client.get(f"/projects/{sample_project.id}/users").json()
+        assert len(users) == 3
+
+    def test_reinviting_is_a_no_op(self, authenticated_client, sample_project):
+        url = f"/projects/{sample_project.id}/invite/batch"
+        authenticated_client.post(url, json={"emails": ["x@external.com"]})
+
+        response = authenticated_client.post(url, json={"emails": ["x@external.com"]})
+
+        assert response.status_code == 200
+        assert response.json()["created"] == []
+
+    def test_empty_list_is_rejected(self, authenticated_client, sample_project):
+        response = authenticated_client.post(
+            f"/projects/{sample_project.id}/invite/batch", json={"emails": []}
+        )
+
+        assert response.status_code == 422
+
+    def test_unknown_project_returns_404(self, authenticated_client):
+        response = authenticated_client.post(
+            f"/projects/{uuid4()}/invite/batch", json={"emails": ["s@example.com"]}
+        )
+
+        assert response.status_code == 404
@@ -0,0 +1,143 @@
+"""Query-count and existence-check tests for ProjectRepository."""
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import select
+
+from models import (
+    ActionItem,
+    Comment,
+    Project,
+    Risk,
+    RiskImpact,
+    RiskProbability,
+)
+from models.ids import new_id
+from repositories.project_repository import ProjectRepository
+
+
+@pytest.fixture
+def project_graph_id(session, sample_project, cogniter_user):
+    """Id of sample_project with 3 actions and 2 risks, each carrying 2 comments."""
+    project_id = sample_project.id
+    for i in range(3):
+        action = ActionItem(project_id=project_id, title=f"Action {i}")
+        session.add(action)
+        session.flush()
+        for j in range(2):
+            session.add(
+                Comment(
+                    user_id=cogniter_user.id,
+                    action_item_id=action.id,
+                    content=f"c{j}",
+                )
+            )
+    for i in range(2):
+        risk = Risk(
+            project_id=project_id,
+            description=f"Risk {i}",
+            probability=RiskProbability.LOW,
+            impact=RiskImpact.LOW,
+        )
+        session.add(risk)
+        session.flush()
+        for j in range(2):
+            session.add(
+                Comment(user_id=cogniter_user.id, risk_id=risk.id, content=f"c{j}")
+            )
+    session.commit()
+    session.expire_all()
+    return project_id
+
+
+def test_no_lazy_loads_rejects_unplanned_relationship_access(
+    project_graph_id, no_lazy_loads
+):
+    project = no_lazy_loads.exec(
+        select(Project).where(Project.id == project_graph_id)
+    ).one()
+
+    with pytest.raises(InvalidRequestError):
+        _ = project.actions
+
+
+def test_existence_checks_do_not_load_rows(
+    session, project_with_client_assigned, client_user, cogniter_user
+):
+    project_id = project_with_client_assigned.id
+    client_id, cogniter_id = client_user.id, cogniter_user.id
+    url = project_with_client_assigned.precursive_url
+    session.expunge_all()
+    repo = ProjectRepository(session)
+
+    assert repo.user_has_access(project_id, client_id) is True
+    assert repo.user_has_access(project_id, cogniter_id) is False
+    assert repo.precursive_url_exists(url) is True
+    assert repo.precursive_url_exists("https://example.com/none") is False
+    assert repo.exists(project_id) is True
+    # Nothing was hydrated into the identity map by the checks
+    assert not any(isinstance(obj, Project) for obj in session.identity_map.values())
+
+
+def test_repeated_get_by_id_is_served_from_the_identity_map(
+    session, sample_project, query_log
+):
+    project_id = sample_project.id
+    repo = ProjectRepository(session)
+    first = repo.get_by_id(project_id)
+    query_log.clear()
+
+    # A second repository on the same session shares the identity map too
+    again = ProjectRepository(session).get_by_id(project_id)
+
+    assert again is first
+    assert query_log == []
+
+
+def test_add_user_to_project_is_idempotent(session, sample_project, client_user):
+    repo = ProjectRepository(session)
+    project_id, user_id = sample_project.id, client_user.id
+
+    assert repo.add_user_to_project(project_id, user_id) is True
+    assert repo.add_user_to_project(project_id, user_id) is False
+    assert repo.user_has_access(project_id, user_id) is True
+
+    assert repo.remove_user_from_project(project_id, user_id) is True
+    assert repo.remove_user_from_project(project_id, user_id) is False
+    assert repo.user_has_access(project_id, user_id) is False
+
+
+def test_get_user_projects_can_skip_budget_columns(
+    session, project_with_client_assigned, client_user, query_log
+):
+    project_id, user_id = project_with_client_assigned.id, client_user.id
+    project_with_client_assigned.is_published = True
+    session.add(project_with_client_assigned)
+    session.commit()
+    session.expunge_all()
+    query_log.clear()
+
+    projects = ProjectRepository(session).get_user_projects(
+        user_id, include_financials=False
+    )
+
+    assert [p.id for p in projects] == [project_id]
+    assert "total_budget" not in query_log[0]
+    assert "currency" in query_log[0]
+
+
+def test_get_with_access_returns_project_and_membership_in_one_query(
+    session, sample_project, client_user, query_log
+):
+    repo = ProjectRepository(session)
+    project_id, user_id = sample_project.id, client_user.id
+
+    query_log.clear()
+    project, is_member = repo.get_with_access(project_id, user_id)
+    assert project.id == project_id
+    assert is_member is False
+    assert len(query_log) == 1
+
+    repo.add_user_to_project(project_id, user_id)
+    assert repo.get_with_access(project_id, user_id)[1] is True
+    assert repo.get_with_access(new_id(), user_id) is None
@@ -101,6 +101,27 @@ class TestGetRiskById:
         data = response.json()
         assert data["id"] == str(sample_risk.id)
 
+    def test_client_access_check_is_a_single_query(
+        self,
+        client,
+        client_user,
+        sample_risk,
+        create_token,
+        project_with_client_and_risk,
+        query_log,
+    ):
+        """Risk, project and membership are fetched together for clients."""
+        client.headers["Authorization"] = f"Bearer {create_token(client_user)}"
+        url = f"/risks/{sample_risk.id}"
+        query_log.clear()
+
+        response = client.get(url)
+
+        assert response.status_code == 200
+        risk_queries = [q for q in query_log if "FROM risk" in q]
+        assert len(risk_queries) == 1
+        assert "JOIN project" in risk_queries[0]
+
     def test_client_denied_when_project_not_published(
         self, client, client_user, sample_risk, create_token, session, sample_project
     ):
@@ -142,6 +163,53 @@ class TestGetRiskById:
 
         assert response.status_code == 404
 
+    def test_matching_etag_returns_304(self, authenticated_client, sample_risk):
+        url = f"/risks/{sample_risk.id}"
+        etag = authenticated_client.get(url).headers["ETag"]
+
+        repeat = authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert repeat.status_code == 304
+        assert repeat.headers["ETag"] == etag
+
+    def test_resolve_changes_etag(self, authenticated_client, sample_risk):
+        url = f"/risks/{sample_risk.id}"
+        first = authenticated_client.get(url)
+        authenticated_client.post(
+            f"{url}/resolve",
+            json={"status": "Closed", "decision_record": "Mitigated"},
+        )
+
+        response = authenticated_client.get(
+            url, headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+        # no-cache (and no max-age): the refetch after a resolve reaches the server
+        assert first.headers["Cache-Control"] == "private, no-cache"
+        assert response.status_code == 200
+        assert response.json()["status"] == "Closed"
+
+
+class TestCreateRisk:
+    """Tests for POST /risks/ endpoint."""
+
+    def test_cogniter_can_create_risk(self, authenticated_client, sample_project):
+        payload = {
+            "project_id": str(sample_project.id),
+            "title": "Vendor delay",
+            "description": "Parts may arrive late",
+            "probability": "High",
+            "impact": "Medium",
+        }
+
+        response = authenticated_client.post("/risks/", json=payload)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["title"] == "Vendor delay"
+        assert data["status"] == "Open"
+        assert authenticated_client.get(f"/risks/{data['id']}").status_code == 200
+
 
 # =============================================================================
 # Risk Resolution Tests
@@ -0,0 +1,25 @@
+"""Query-count tests for RiskRepository writes."""
+
+from models import Risk, RiskImpact, RiskProbability
+from repositories.risk_repository import RiskRepository
+
+
+def test_create_is_a_single_insert_without_refresh(
+    request_session, sample_project, query_log
+):
+    query_log.clear()
+
+    risk = RiskRepository(request_session).create(
+        Risk(
+            project_id=sample_project.id,
+            title="Vendor delay",
+            description="Parts may arrive late",
+            probability=RiskProbability.HIGH,
+            impact=RiskImpact.MEDIUM,
+        )
+    )
+
+    # Every column is set client-side: nothing to RETURN or read back
+    assert len(query_log) == 1
+    assert query_log[0].lstrip().upper().startswith("INSERT")
+    assert risk.id is not None
@@ -0,0 +1,27 @@
+"""Tests for the serializers that read column rows from repository queries."""
+
+from repositories.project_repository import ProjectRepository
+from schemas import ProjectSummary, UserRead
+from serializers.api_models import to_project_summary, to_user_read_from_row
+
+
+def test_to_project_summary_matches_validated_schema(session, sample_project):
+    (row,) = ProjectRepository(session).list_summary()
+
+    constructed = to_project_summary(row)
+    validated = ProjectSummary.model_validate(row)
+
+    assert constructed.model_dump_json() == validated.model_dump_json()
+
+
+def test_to_user_read_from_row_matches_validated_schema(
+    session, project_with_client_assigned, client_user
+):
+    (row,) = ProjectRepository(session).get_project_users(
+        project_with_client_assigned.id
+    )
+
+    constructed = to_user_read_from_row(row)
+    validated = UserRead.model_validate(client_user)
+
+    assert constructed.model_dump_json() == validated.model_dump_json()
@@ -0,0 +1,197 @@
+"""Integration tests for Sync job status endpoints."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import BackgroundTasks
+from sqlmodel import Session
+
+import routers.sync
+from models import SyncJob, SyncJobStatus, SyncJobType
+from services.sync_job_service import SyncJobService
+
+
+@pytest.fixture
+def queued_job(session, sample_project, cogniter_user) -> SyncJob:
+    """Create a queued Jira sync job."""
+    job = SyncJob(
+        project_id=sample_project.id,
+        job_type=SyncJobType.JIRA,
+        requested_by_user_id=cogniter_user.id,
+    )
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    return job
+
+
+class TestGetJobStatus:
+    """Tests for GET /sync/jobs/{job_id}."""
+
+    def test_returns_current_status_without_wait(
+        self, authenticated_client, queued_job
+    ):
+        response = authenticated_client.get(f"/sync/jobs/{queued_job.id}")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "queued"
+
+    def test_wait_returns_immediately_for_finished_job(
+        self, authenticated_client, session, queued_job
+    ):
+        queued_job.status = SyncJobStatus.SUCCEEDED
+        session.add(queued_job)
+        session.commit()
+        url = f"/sync/jobs/{queued_job.id}?wait=50"
+
+        started = time.monotonic()
+        response = authenticated_client.get(url)
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "succeeded"
+        assert time.monotonic() - started < 1
+
+    def test_wait_returns_unchanged_status_on_timeout(
+        self, authenticated_client, queued_job, monkeypatch
+    ):
+        monkeypatch.setattr(routers.sync, "LONG_POLL_RECHECK_SECONDS", 0.1)
+
+        response = authenticated_client.get(f"/sync/jobs/{queued_job.id}?wait=1")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "queued"
+
+    def test_wait_wakes_on_status_change(
+        self, authenticated_client, session, engine, queued_job, monkeypatch
+    ):
+        # Only the in-process notification can end the wait early
+        monkeypatch.setattr(routers.sync, "LONG_POLL_RECHECK_SECONDS", 30)
+        job_id = queued_job.id
+        SyncJobService(session).claim_job(job_id)
+
+        def finish_job():
+            time.sleep(0.2)
+            with Session(engine) as other:
+                service = SyncJobService(other)
+                service.mark_succeeded(service.get_by_id(job_id), items_synced=3)
+
+        worker = threading.Thread(target=finish_job)
+        started = time.monotonic()
+        worker.start()
+        response = authenticated_client.get(f"/sync/jobs/{job_id}?wait=30")
+        worker.join()
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "succeeded"
+        assert response.json()["items_synced"] == 3
+        assert time.monotonic() - started < 5
+
+    def test_wait_is_capped(self, authenticated_client, queued_job):
+        response = authenticated_client.get(f"/sync/jobs/{queued_job.id}?wait=51")
+
+        assert response.status_code == 422
+
+    def test_client_without_access_is_rejected(
+        self, client, client_user, create_token, queued_job
+    ):
+        client.headers["Authorization"] = f"Bearer {create_token(client_user)}"
+
+        response = client.get(f"/sync/jobs/{queued_job.id}?wait=5")
+
+        assert response.status_code == 403
+
+
+class TestEnqueueSyncJob:
+    """Tests for enqueue_sync_job deduplication and orphan recovery."""
+
+    @pytest.fixture
+    def orphaned_job(self, session, sample_project, cogniter_user) -> SyncJob:
+        """A RUNNING job whose runner died with the previous API process."""
+        long_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+        job = SyncJob(
+            project_id=sample_project.id,
+            job_type=SyncJobType.JIRA,
+            status=SyncJobStatus.RUNNING,
+            requested_by_user_id=cogniter_user.id,
+            started_at=long_ago,
+            heartbeat_at=long_ago,
+        )
+        session.add(job)
+        session.commit()
+        return job
+
+    def enqueue(self, session, sample_project, cogniter_user, settings):
+        tasks = BackgroundTasks()
+        job, deduplicated = routers.sync.enqueue_sync_job(
+            sync_job_service=SyncJobService(session),
+            project_id=sample_project.id,
+            job_type=SyncJobType.JIRA,
+            user_id=cogniter_user.id,
+            background_tasks=tasks,
+            settings=settings,
+        )
+        return job, deduplicated, tasks
+
+    def test_in_process_mode_replaces_orphaned_job(
+        self, session, sample_project, cogniter_user, test_settings, orphaned_job
+    ):
+        job, deduplicated, tasks = self.enqueue(
+            session, sample_project, cogniter_user, test_settings
+        )
+
+        assert deduplicated is False
+        assert job.id != orphaned_job.id
+        assert job.status == SyncJobStatus.QUEUED
+        assert len(tasks.tasks) == 1
+        session.refresh(orphaned_job)
+        assert orphaned_job.status == SyncJobStatus.FAILED
+
+    def test_in_process_mode_replaces_job_queued_before_a_restart(
+        self, session, sample_project, cogniter_user, test_settings
+    ):
+        # Its BackgroundTask was lost with the old process, so it never ran
+        never_ran = SyncJob(
+            project_id=sample_project.id,
+            job_type=SyncJobType.JIRA,
+            requested_by_user_id=cogniter_user.id,
+            created_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        session.add(never_ran)
+        session.commit()
+
+        job, deduplicated, _ = self.enqueue(
+            session, sample_project, cogniter_user, test_settings
+        )
+
+        assert deduplicated is False
+        assert job.id != never_ran.id
+        session.refresh(never_ran)
+        assert never_ran.status == SyncJobStatus.FAILED
+
+    def test_in_process_mode_keeps_heartbeating_job(
+        self, session, sample_project, cogniter_user, test_settings, orphaned_job
+    ):
+        orphaned_job.heartbeat_at = datetime.now(timezone.utc)
+        session.commit()
+
+        job, deduplicated, tasks = self.enqueue(
+            session, sample_project, cogniter_user, test_settings
+        )
+
+        assert deduplicated is True
+        assert job.id == orphaned_job.id
+        assert tasks.tasks == []
+
+    def test_worker_mode_leaves_stale_job_to_the_worker(
+        self, session, sample_project, cogniter_user, test_settings, orphaned_job
+    ):
+        settings = test_settings.model_copy(update={"sync_worker_enabled": True})
+
+        job, deduplicated, _ = self.enqueue(
+            session, sample_project, cogniter_user, settings
+        )
+
+        assert deduplicated is True
+        assert job.id == orphaned_job.id
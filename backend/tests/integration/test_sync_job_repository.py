@@ -0,0 +1,214 @@
+"""Tests for SyncJobRepository queue operations."""
+
+from datetime import datetime, timedelta, timezone
+
+from models import SyncJob, SyncJobStatus, SyncJobType
+from repositories.sync_job_repository import SyncJobRepository
+
+
+def test_claim_pending_jobs_hands_out_each_job_once(session, sample_project):
+    # At most one active job per project and type
+    jobs = [
+        SyncJob(project_id=sample_project.id, job_type=job_type)
+        for job_type in SyncJobType
+    ]
+    session.add_all(jobs)
+    session.commit()
+    repo = SyncJobRepository(session)
+
+    first = repo.claim_pending_jobs(2)
+    second = repo.claim_pending_jobs(2)
+
+    assert len(first) == 2
+    assert len(second) == 1
+    claimed = first + second
+    assert {job.id for job in claimed} == {job.id for job in jobs}
+    assert all(job.status == SyncJobStatus.RUNNING for job in claimed)
+    assert all(job.started_at is not None for job in claimed)
+    assert repo.claim_pending_jobs(2) == []
+
+
+def test_last_successful_per_project_returns_newest_per_project(
+    session, sample_project, second_project
+):
+    now = datetime.now(timezone.utc)
+    jobs = {
+        "old": SyncJob(
+            project_id=sample_project.id,
+            job_type=SyncJobType.JIRA,
+            status=SyncJobStatus.SUCCEEDED,
+            completed_at=now - timedelta(days=1),
+        ),
+        "new": SyncJob(
+            project_id=sample_project.id,
+            job_type=SyncJobType.JIRA,
+            status=SyncJobStatus.SUCCEEDED,
+            completed_at=now,
+        ),
+        "failed": SyncJob(
+            project_id=sample_project.id,
+            job_type=SyncJobType.JIRA,
+            status=SyncJobStatus.FAILED,
+            completed_at=now + timedelta(hours=1),
+        ),
+        "other": SyncJob(
+            project_id=second_project.id,
+            job_type=SyncJobType.JIRA,
+            status=SyncJobStatus.SUCCEEDED,
+            completed_at=now,
+        ),
+        "precursive": SyncJob(
+            project_id=second_project.id,
+            job_type=SyncJobType.PRECURSIVE,
+            status=SyncJobStatus.SUCCEEDED,
+            completed_at=now + timedelta(hours=1),
+        ),
+    }
+    session.add_all(jobs.values())
+    session.commit()
+
+    latest = SyncJobRepository(session).last_successful_per_project(SyncJobType.JIRA)
+
+    assert {pid: job.id for pid, job in latest.items()} == {
+        sample_project.id: jobs["new"].id,
+        second_project.id: jobs["other"].id,
+    }
+
+
+def test_create_if_no_active_inserts_at_most_one_active_job(
+    request_session, sample_project, query_log
+):
+    repo = SyncJobRepository(request_session)
+    query_log.clear()
+
+    created = repo.create_if_no_active(
+        SyncJob(project_id=sample_project.id, job_type=SyncJobType.JIRA)
+    )
+    duplicate = repo.create_if_no_active(
+        SyncJob(project_id=sample_project.id, job_type=SyncJobType.JIRA)
+    )
+    other_type = repo.create_if_no_active(
+        SyncJob(project_id=sample_project.id, job_type=SyncJobType.PRECURSIVE)
+    )
+    request_session.commit()
+
+    assert created is not None
+    assert created.created_at is not None
+    assert duplicate is None
+    assert other_type is not None
+    inserts = [sql for sql in query_log if sql.lstrip().startswith("INSERT")]
+    assert len(query_log) == 3
+    assert len(inserts) == 3
+
+
+def test_create_if_no_active_allows_new_job_once_active_one_finishes(
+    session, sample_project
+):
+    repo = SyncJobRepository(session)
+    first = repo.create_if_no_active(
+        SyncJob(project_id=sample_project.id, job_type=SyncJobType.JIRA)
+    )
+    first.status = SyncJobStatus.SUCCEEDED
+    session.commit()
+
+    second = repo.create_if_no_active(
+        SyncJob(project_id=sample_project.id, job_type=SyncJobType.JIRA)
+    )
+    session.commit()
+
+    assert second is not None
+    assert second.id != first.id
+
+
+def test_claim_job_hands_a_queued_job_to_one_runner(session, sample_project):
+    job = SyncJob(project_id=sample_project.id, job_type=SyncJobType.JIRA)
+    session.add(job)
+    session.commit()
+    repo = SyncJobRepository(session)
+
+    claimed = repo.claim_job(job.id)
+    again = repo.claim_job(job.id)
+    session.commit()
+
+    assert claimed is not None
+    assert claimed.status == SyncJobStatus.RUNNING
+    assert claimed.started_at is not None
+    assert again is None
+
+
+def test_requeue_stale_jobs_only_touches_jobs_without_recent_heartbeat(
+    session, sample_project
+):
+    now = datetime.now(timezone.utc)
+    dead = SyncJob(
+        project_id=sample_project.id,
+        job_type=SyncJobType.JIRA,
+        status=SyncJobStatus.RUNNING,
+        started_at=now - timedelta(hours=2),
+        heartbeat_at=now - timedelta(hours=2),
+    )
+    # Started long ago but still heartbeating: a healthy long sync
+    alive = SyncJob(
+        project_id=sample_project.id,
+        job_type=SyncJobType.PRECURSIVE,
+        status=SyncJobStatus.RUNNING,
+        started_at=now - timedelta(hours=2),
+        heartbeat_at=now,
+    )
+    session.add_all([dead, alive])
+    session.commit()
+    dead_id, alive_id = dead.id, alive.id
+
+    requeued = SyncJobRepository(session).requeue_stale_jobs(now - timedelta(minutes=5))
+    session.commit()
+
+    assert [job.id for job in requeued] == [dead_id]
+    assert session.get(SyncJob, dead_id).status == SyncJobStatus.QUEUED
+    assert session.get(SyncJob, dead_id).claim_id is None
+    assert session.get(SyncJob, alive_id).status == SyncJobStatus.RUNNING
+
+
+def test_finish_is_fenced_by_the_claim(session, sample_project):
+    job = SyncJob(project_id=sample_project.id, job_type=SyncJobType.JIRA)
+    session.add(job)
+    session.commit()
+    repo = SyncJobRepository(session)
+    first_run = repo.claim_job(job.id)
+    first_claim = first_run.claim_id
+    session.commit()
+
+    # The first runner stalls; its job is requeued and claimed again
+    repo.requeue_stale_jobs(datetime.now(timezone.utc) + timedelta(minutes=1))
+    second_claim = repo.claim_job(job.id).claim_id
+    session.commit()
+
+    assert second_claim != first_claim
+    assert repo.heartbeat(job.id, first_claim) is False
+    assert repo.heartbeat(job.id, second_claim) is True
+    stale_runner = SyncJob(id=job.id, claim_id=first_claim)
+    assert repo.finish(stale_runner, status=SyncJobStatus.FAILED) is False
+    current = session.get(SyncJob, job.id)
+    assert repo.finish(current, status=SyncJobStatus.SUCCEEDED) is True
+    session.commit()
+    assert session.get(SyncJob, job.id).status == SyncJobStatus.SUCCEEDED
+
+
+def test_fail_if_stale_spares_jobs_with_a_recent_heartbeat(session, sample_project):
+    now = datetime.now(timezone.utc)
+    running = SyncJob(
+        project_id=sample_project.id,
+        job_type=SyncJobType.JIRA,
+        status=SyncJobStatus.RUNNING,
+        started_at=now - timedelta(hours=2),
+        heartbeat_at=now,
+    )
+    session.add(running)
+    session.commit()
+    repo = SyncJobRepository(session)
+
+    assert repo.fail_if_stale(running.id, now - timedelta(minutes=5)) is False
+    assert repo.fail_if_stale(running.id, now + timedelta(minutes=1)) is True
+    session.commit()
+    session.refresh(running)
+    assert running.status == SyncJobStatus.FAILED
+    assert running.claim_id is None
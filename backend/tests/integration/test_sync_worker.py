@@ -0,0 +1,36 @@
+"""Tests for the standalone sync job worker."""
+
+import pytest
+
+import database
+from models import SyncJob, SyncJobStatus, SyncJobType
+from sync_worker import run_once
+
+
+@pytest.fixture
+def worker_engine(engine, monkeypatch):
+    """Point the worker's session factory at the test database."""
+    monkeypatch.setattr(database, "engine", engine)
+    return engine
+
+
+async def test_run_once_claims_and_finishes_a_queued_job(
+    worker_engine, session, sample_project, test_settings
+):
+    job = SyncJob(project_id=sample_project.id, job_type=SyncJobType.JIRA)
+    session.add(job)
+    session.commit()
+    job_id = job.id
+
+    assert await run_once(test_settings) is True
+    assert await run_once(test_settings) is False
+
+    session.expire_all()
+    finished = session.get(SyncJob, job_id)
+    # Jira is not configured in tests, so the run records a failure
+    assert finished.status == SyncJobStatus.FAILED
+    assert finished.completed_at is not None
+
+
+async def test_run_once_is_idle_without_queued_jobs(worker_engine, test_settings):
+    assert await run_once(test_settings) is False
@@ -0,0 +1,65 @@
+"""Integration tests for file upload endpoints."""
+
+import pytest
+
+import routers.uploads
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+@pytest.fixture
+def logo_dir(tmp_path, monkeypatch):
+    """Write uploaded logos to a temporary directory."""
+    monkeypatch.setattr(routers.uploads, "LOGO_DIR", tmp_path)
+    return tmp_path
+
+
+class TestUploadLogo:
+    """Tests for POST /uploads/logo."""
+
+    def test_streams_valid_image_to_disk(self, authenticated_client, logo_dir):
+        response = authenticated_client.post(
+            "/uploads/logo",
+            files={"file": ("logo.png", PNG_BYTES, "image/png")},
+        )
+
+        assert response.status_code == 200
+        filename = response.json()["url"].rsplit("/", 1)[-1]
+        assert filename.endswith(".png")
+        assert (logo_dir / filename).read_bytes() == PNG_BYTES
+
+    def test_extension_follows_detected_type(self, authenticated_client, logo_dir):
+        gif = b"GIF89a" + b"\x00" * 32
+
+        response = authenticated_client.post(
+            "/uploads/logo",
+            files={"file": ("logo.png", gif, "image/png")},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["url"].endswith(".gif")
+
+    def test_rejects_content_not_matching_an_image(
+        self, authenticated_client, logo_dir
+    ):
+        response = authenticated_client.post(
+            "/uploads/logo",
+            files={"file": ("logo.png", b"<svg onload=alert(1)>", "image/png")},
+        )
+
+        assert response.status_code == 400
+        assert list(logo_dir.iterdir()) == []
+
+    def test_rejects_oversized_file_without_leaving_it_on_disk(
+        self, authenticated_client, logo_dir
+    ):
+        oversized = PNG_BYTES + b"\x00" * routers.uploads.MAX_FILE_SIZE
+
+        response = authenticated_client.post(
+            "/uploads/logo",
+            files={"file": ("logo.png", oversized, "image/png")},
+        )
+
+        assert response.status_code == 400
+        assert "too large" in response.json()["detail"]
+        assert list(logo_dir.iterdir()) == []
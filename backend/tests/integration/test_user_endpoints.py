@@ -0,0 +1,50 @@
+"""Integration tests for User endpoints."""
+
+from uuid import uuid4
+
+from serializers.cursors import encode_id_cursor, encode_name_id_cursor
+
+
+class TestListUsers:
+    """Tests for GET /users/."""
+
+    def test_cursor_walks_every_user_once(
+        self, authenticated_client, client_user, pending_user
+    ):
+        everyone = authenticated_client.get("/users/").json()
+
+        walked, url = [], "/users/?limit=2"
+        while url:
+            response = authenticated_client.get(url)
+            walked += response.json()
+            cursor = response.headers.get("X-Next-Cursor")
+            url = f"/users/?limit=2&cursor={cursor}" if cursor else None
+
+        assert len(everyone) > 2
+        assert [u["id"] for u in walked] == [u["id"] for u in everyone]
+
+    def test_short_page_sends_no_cursor(self, authenticated_client):
+        response = authenticated_client.get("/users/?limit=50")
+
+        assert response.status_code == 200
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_cursor_encodes_last_user_sort_key(self, authenticated_client, client_user):
+        response = authenticated_client.get("/users/?limit=1")
+
+        assert response.headers["X-Next-Cursor"] == encode_name_id_cursor(
+            response.json()[0]["name"], response.json()[0]["id"]
+        )
+
+    def test_malformed_cursor_is_rejected(self, authenticated_client):
+        response = authenticated_client.get("/users/?cursor=nope")
+
+        assert response.status_code == 400
+
+    def test_partial_cursor_is_rejected(self, authenticated_client):
+        # A token carrying only the id, not the (name, id) pair
+        cursor = encode_id_cursor(uuid4())
+
+        response = authenticated_client.get(f"/users/?cursor={cursor}")
+
+        assert response.status_code == 400
@@ -0,0 +1,20 @@
+"""Tests for UserRepository."""
+
+from models import AuthProvider, User, UserRole
+from repositories.user_repository import UserRepository
+
+
+def test_email_is_stored_lowercase_and_looked_up_case_insensitively(session):
+    user = User(
+        email=" Mixed.Case@Example.com",
+        name="Mixed",
+        role=UserRole.CLIENT,
+        auth_provider=AuthProvider.EMAIL,
+    )
+    session.add(user)
+    session.commit()
+    repo = UserRepository(session)
+
+    assert user.email == "mixed.case@example.com"
+    assert repo.get_by_email("MIXED.case@example.COM") is user
+    assert repo.email_exists("Mixed.Case@Example.com")
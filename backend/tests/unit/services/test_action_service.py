@@ -73,15 +73,14 @@ class TestActionService:
         service = ActionService(mock_session)
 
         with patch.object(
-            service.project_repository, "get_by_id", return_value=sample_project
+            service.project_service.repository,
+            "get_with_access",
+            return_value=(sample_project, False),
         ):
-            with patch.object(
-                service.project_repository, "user_has_access", return_value=False
-            ):
-                with pytest.raises(AuthorizationError) as exc_info:
-                    service.get_project_actions(sample_project.id, client_user)
+            with pytest.raises(AuthorizationError) as exc_info:
+                service.get_project_actions(sample_project.id, client_user)
 
-                assert "don't have access" in str(exc_info.value)
+            assert "don't have access" in str(exc_info.value)
 
     def test_cogniter_can_access_any_project_actions(
         self, mock_session, cogniter_user, sample_action, sample_project
@@ -90,7 +89,7 @@ class TestActionService:
         service = ActionService(mock_session)
 
         with patch.object(
-            service.project_repository, "get_by_id", return_value=sample_project
+            service.project_service.repository, "get_by_id", return_value=sample_project
         ):
             with patch.object(
                 service.repository, "get_by_project", return_value=[sample_action]
@@ -106,16 +105,15 @@ class TestActionService:
         service = ActionService(mock_session)
 
         with patch.object(
-            service.project_repository, "get_by_id", return_value=sample_project
+            service.project_service.repository,
+            "get_with_access",
+            return_value=(sample_project, True),
         ):
             with patch.object(
-                service.project_repository, "user_has_access", return_value=True
+                service.repository, "get_by_project", return_value=[sample_action]
             ):
-                with patch.object(
-                    service.repository, "get_by_project", return_value=[sample_action]
-                ):
-                    result = service.get_project_actions(sample_project.id, client_user)
-                    assert result == [sample_action]
+                result = service.get_project_actions(sample_project.id, client_user)
+                assert result == [sample_action]
 
     def test_create_action_requires_project_access(
         self, mock_session, client_user, sample_project
@@ -127,13 +125,12 @@ class TestActionService:
         create_data.project_id = sample_project.id
 
         with patch.object(
-            service.project_repository, "get_by_id", return_value=sample_project
+            service.project_service.repository,
+            "get_with_access",
+            return_value=(sample_project, False),
         ):
-            with patch.object(
-                service.project_repository, "user_has_access", return_value=False
-            ):
-                with pytest.raises(AuthorizationError):
-                    service.create_action(create_data, client_user)
+            with pytest.raises(AuthorizationError):
+                service.create_action(create_data, client_user)
 
     def test_create_action_project_must_exist(self, mock_session, cogniter_user):
         """Creating an action requires project to exist."""
@@ -142,7 +139,9 @@ class TestActionService:
         create_data = MagicMock()
         create_data.project_id = uuid4()
 
-        with patch.object(service.project_repository, "get_by_id", return_value=None):
+        with patch.object(
+            service.project_service.repository, "get_by_id", return_value=None
+        ):
             with pytest.raises(ResourceNotFoundError):
                 service.create_action(create_data, cogniter_user)
 
@@ -207,16 +206,15 @@ class TestActionServiceComments:
 
         with patch.object(service.repository, "get_by_id", return_value=sample_action):
             with patch.object(
-                service.project_repository, "get_by_id", return_value=sample_project
+                service.project_service.repository,
+                "get_with_access",
+                return_value=(sample_project, True),
             ):
-                with patch.object(
-                    service.project_repository, "user_has_access", return_value=True
-                ):
-                    with patch.object(service.comment_repository, "create"):
-                        # Should not raise
-                        _ = service.add_comment(
-                            sample_action.id, "Test comment", client_user
-                        )
+                with patch.object(service.comment_repository, "create"):
+                    # Should not raise
+                    _ = service.add_comment(
+                        sample_action.id, "Test comment", client_user
+                    )
 
     def test_client_cannot_comment_on_unassigned_project(
         self, mock_session, client_user, sample_action, sample_project
@@ -227,15 +225,12 @@ class TestActionServiceComments:
 
         with patch.object(service.repository, "get_by_id", return_value=sample_action):
             with patch.object(
-                service.project_repository, "get_by_id", return_value=sample_project
+                service.project_service.repository,
+                "get_with_access",
+                return_value=(sample_project, False),
             ):
-                with patch.object(
-                    service.project_repository, "user_has_access", return_value=False
-                ):
-                    with pytest.raises(AuthorizationError):
-                        service.add_comment(
-                            sample_action.id, "Test comment", client_user
-                        )
+                with pytest.raises(AuthorizationError):
+                    service.add_comment(sample_action.id, "Test comment", client_user)
 
     def test_cogniter_can_comment_on_any_project(
         self, mock_session, cogniter_user, sample_action
@@ -279,13 +274,12 @@ class TestActionServiceComments:
 
         with patch.object(service.repository, "get_by_id", return_value=sample_action):
             with patch.object(
-                service.project_repository, "get_by_id", return_value=sample_project
+                service.project_service.repository,
+                "get_with_access",
+                return_value=(sample_project, False),
             ):
-                with patch.object(
-                    service.project_repository, "user_has_access", return_value=False
-                ):
-                    with pytest.raises(AuthorizationError):
-                        service.get_comments(sample_action.id, client_user)
+                with pytest.raises(AuthorizationError):
+                    service.get_comments(sample_action.id, client_user)
 
     def test_comment_returns_author_info(
         self, mock_session, cogniter_user, sample_action
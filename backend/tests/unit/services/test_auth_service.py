@@ -0,0 +1,33 @@
+"""Tests for the verified Firebase token cache in auth_service."""
+
+import time
+
+from services.auth_service import _VerifiedTokenCache
+
+
+def test_verified_token_cache_returns_claims_until_ttl():
+    cache = _VerifiedTokenCache(ttl=60)
+    claims = {"email": "ann@example.com", "exp": time.time() + 3600}
+
+    cache.put("token-a", claims)
+
+    assert cache.get("token-a") == claims
+    assert cache.get("token-b") is None
+
+
+def test_verified_token_cache_never_outlives_token_expiry():
+    cache = _VerifiedTokenCache(ttl=60)
+
+    cache.put("expired", {"exp": time.time() - 1})
+
+    assert cache.get("expired") is None
+
+
+def test_verified_token_cache_evicts_oldest_beyond_maxsize():
+    cache = _VerifiedTokenCache(maxsize=2, ttl=60)
+
+    for token in ("a", "b", "c"):
+        cache.put(token, {"sub": token})
+
+    assert cache.get("a") is None
+    assert cache.get("c") == {"sub": "c"}
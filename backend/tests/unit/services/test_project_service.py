@@ -1,8 +1,10 @@
 """Unit tests for ProjectService."""
 
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from sqlmodel import update
 
 from exceptions import AuthorizationError, DuplicateResourceError
 from models import AuthProvider, User, UserRole
@@ -178,6 +180,114 @@ class TestUserAssignment:
             )
 
 
+@pytest.fixture
+def legacy_mixed_case_user(session) -> User:
+    """A user stored before emails were lower-cased on write."""
+    user = User(
+        id=uuid4(),
+        email="legacy@acme.com",
+        name="Legacy User",
+        role=UserRole.CLIENT,
+        auth_provider=AuthProvider.GOOGLE,
+    )
+    session.add(user)
+    session.commit()
+    # Core UPDATE bypasses the normalizing mapper event
+    session.execute(
+        update(User).where(User.id == user.id).values(email="Legacy@Acme.com")
+    )
+    session.commit()
+    session.refresh(user)
+    return user
+
+
+@pytest.fixture
+def racing_service(session):
+    """ProjectService whose first user lookup misses, as if the users registered
+    just after it."""
+    service = ProjectService(session)
+    lookup = service.user_repository.get_by_emails
+    calls = []
+
+    def racing_lookup(emails):
+        calls.append(emails)
+        return [] if len(calls) == 1 else lookup(emails)
+
+    with patch.object(
+        service.user_repository, "get_by_emails", side_effect=racing_lookup
+    ):
+        yield service
+
+
+class TestInviteMixedCaseEmails:
+    """Invites matching users whose stored email is not lower-cased."""
+
+    def test_batch_invite_assigns_legacy_mixed_case_user(
+        self, session, cogniter_user, legacy_mixed_case_user, sample_project
+    ):
+        service = ProjectService(session)
+        user_id = legacy_mixed_case_user.id
+
+        users, created = service.assign_by_emails(
+            sample_project.id, ["LEGACY@acme.com"], cogniter_user
+        )
+
+        assert created == []
+        assert [u.id for u in users] == [user_id]
+
+
+class TestInviteRace:
+    """Invites racing with a concurrent request for the same email."""
+
+    def test_invite_assigns_user_created_after_lookup(
+        self, session, cogniter_user, client_user, sample_project
+    ):
+        """An email taken between lookup and insert is assigned, not re-created."""
+        service = ProjectService(session)
+        project_id, user_id = sample_project.id, client_user.id
+
+        # The lookup misses, as if client_user registered just afterwards
+        with patch.object(
+            service.repository, "find_user_for_invite", return_value=(True, None)
+        ):
+            user, was_created = service.assign_by_email(
+                project_id, "client@acme.com", cogniter_user
+            )
+
+        assert was_created is False
+        assert user.id == user_id
+        assert [u.id for u in service.get_project_users(project_id)] == [user_id]
+
+    def test_batch_invite_assigns_users_created_after_lookup(
+        self, racing_service, cogniter_user, client_user, sample_project
+    ):
+        project_id, user_id = sample_project.id, client_user.id
+
+        users, created = racing_service.assign_by_emails(
+            project_id, ["client@acme.com", "new@external.com"], cogniter_user
+        )
+
+        # The conflict forced a re-read
+        assert racing_service.user_repository.get_by_emails.call_count == 2
+        assert [u.email for u in created] == ["new@external.com"]
+        assert users[0].id == user_id
+        assert len(racing_service.get_project_users(project_id)) == 2
+
+    def test_batch_invite_race_with_legacy_mixed_case_user(
+        self, racing_service, cogniter_user, legacy_mixed_case_user, sample_project
+    ):
+        user_id = legacy_mixed_case_user.id
+
+        # The re-read returns the mixed-case row
+        users, created = racing_service.assign_by_emails(
+            sample_project.id, ["legacy@acme.com"], cogniter_user
+        )
+
+        assert racing_service.user_repository.get_by_emails.call_count == 2
+        assert created == []
+        assert [u.id for u in users] == [user_id]
+
+
 class TestAccessControl:
     """Tests for project access checking."""
 
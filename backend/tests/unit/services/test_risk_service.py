@@ -92,19 +92,20 @@ class TestResolveRisk:
         service = RiskService(mock_session)
 
         # Mock the repository methods
-        with patch.object(service.repository, "get_by_id", return_value=sample_risk):
-            with patch.object(
-                service.project_repository, "user_has_access", return_value=True
-            ):
-                with pytest.raises(AuthorizationError) as exc_info:
-                    service.resolve_risk(
-                        risk_id=sample_risk.id,
-                        status=RiskStatus.CLOSED,
-                        decision_record="Test resolution",
-                        user=client_user,
-                    )
-
-                assert "Only Cogniters can resolve risks" in str(exc_info.value)
+        with patch.object(
+            service.repository,
+            "get_with_access",
+            return_value=(sample_risk, True, True),
+        ):
+            with pytest.raises(AuthorizationError) as exc_info:
+                service.resolve_risk(
+                    risk_id=sample_risk.id,
+                    status=RiskStatus.CLOSED,
+                    decision_record="Test resolution",
+                    user=client_user,
+                )
+
+            assert "Only Cogniters can resolve risks" in str(exc_info.value)
 
     def test_cogniter_can_resolve(self, mock_session, cogniter_user, sample_risk):
         """Cogniter users should be able to resolve risks."""
@@ -112,7 +113,7 @@ class TestResolveRisk:
 
         with patch.object(service.repository, "get_by_id", return_value=sample_risk):
             with patch.object(
-                service.project_repository, "user_has_access", return_value=True
+                service.project_service.repository, "user_has_access", return_value=True
             ):
                 with patch.object(
                     service.repository, "update", return_value=sample_risk
@@ -135,7 +136,7 @@ class TestResolveRisk:
 
         with patch.object(service.repository, "get_by_id", return_value=sample_risk):
             with patch.object(
-                service.project_repository, "user_has_access", return_value=True
+                service.project_service.repository, "user_has_access", return_value=True
             ):
                 with pytest.raises(ValidationError) as exc_info:
                     service.resolve_risk(
@@ -155,7 +156,7 @@ class TestResolveRisk:
 
         with patch.object(service.repository, "get_by_id", return_value=sample_risk):
             with patch.object(
-                service.project_repository, "user_has_access", return_value=True
+                service.project_service.repository, "user_has_access", return_value=True
             ):
                 with pytest.raises(ValidationError):
                     service.resolve_risk(
@@ -171,7 +172,7 @@ class TestResolveRisk:
 
         with patch.object(service.repository, "get_by_id", return_value=sample_risk):
             with patch.object(
-                service.project_repository, "user_has_access", return_value=True
+                service.project_service.repository, "user_has_access", return_value=True
             ):
                 with pytest.raises(ValidationError) as exc_info:
                     service.resolve_risk(
@@ -191,7 +192,7 @@ class TestResolveRisk:
 
         with patch.object(service.repository, "get_by_id", return_value=sample_risk):
             with patch.object(
-                service.project_repository, "user_has_access", return_value=True
+                service.project_service.repository, "user_has_access", return_value=True
             ):
                 with patch.object(
                     service.repository, "update", return_value=sample_risk
@@ -219,7 +220,7 @@ class TestResolveRisk:
 
         with patch.object(service.repository, "get_by_id", return_value=sample_risk):
             with patch.object(
-                service.project_repository, "user_has_access", return_value=True
+                service.project_service.repository, "user_has_access", return_value=True
             ):
                 with patch.object(
                     service.repository, "update", return_value=sample_risk
@@ -243,18 +244,19 @@ class TestReopenRisk:
         """Client users should not be able to reopen risks."""
         service = RiskService(mock_session)
 
-        with patch.object(service.repository, "get_by_id", return_value=resolved_risk):
-            with patch.object(
-                service.project_repository, "user_has_access", return_value=True
-            ):
-                with pytest.raises(AuthorizationError) as exc_info:
-                    service.reopen_risk(
-                        risk_id=resolved_risk.id,
-                        reason="Need to reopen",
-                        user=client_user,
-                    )
+        with patch.object(
+            service.repository,
+            "get_with_access",
+            return_value=(resolved_risk, True, True),
+        ):
+            with pytest.raises(AuthorizationError) as exc_info:
+                service.reopen_risk(
+                    risk_id=resolved_risk.id,
+                    reason="Need to reopen",
+                    user=client_user,
+                )
 
-                assert "Only Cogniters can reopen risks" in str(exc_info.value)
+            assert "Only Cogniters can reopen risks" in str(exc_info.value)
 
     def test_requires_reason(self, mock_session, cogniter_user, resolved_risk):
         """Reopening requires a non-empty reason."""
@@ -262,7 +264,7 @@ class TestReopenRisk:
 
         with patch.object(service.repository, "get_by_id", return_value=resolved_risk):
             with patch.object(
-                service.project_repository, "user_has_access", return_value=True
+                service.project_service.repository, "user_has_access", return_value=True
             ):
                 with pytest.raises(ValidationError) as exc_info:
                     service.reopen_risk(
@@ -279,7 +281,7 @@ class TestReopenRisk:
 
         with patch.object(service.repository, "get_by_id", return_value=resolved_risk):
             with patch.object(
-                service.project_repository, "user_has_access", return_value=True
+                service.project_service.repository, "user_has_access", return_value=True
             ):
                 with patch.object(
                     service.repository, "update", return_value=resolved_risk
@@ -299,7 +301,7 @@ class TestReopenRisk:
 
         with patch.object(service.repository, "get_by_id", return_value=resolved_risk):
             with patch.object(
-                service.project_repository, "user_has_access", return_value=True
+                service.project_service.repository, "user_has_access", return_value=True
             ):
                 with patch.object(
                     service.repository, "update", return_value=resolved_risk
@@ -320,7 +322,7 @@ class TestReopenRisk:
 
         with patch.object(service.repository, "get_by_id", return_value=sample_risk):
             with patch.object(
-                service.project_repository, "user_has_access", return_value=True
+                service.project_service.repository, "user_has_access", return_value=True
             ):
                 with pytest.raises(ValidationError) as exc_info:
                     service.reopen_risk(
@@ -339,17 +341,18 @@ class TestRiskComments:
         """Clients can comment on risks for projects they're assigned to."""
         service = RiskService(mock_session)
 
-        with patch.object(service.repository, "get_by_id", return_value=sample_risk):
-            with patch.object(
-                service.project_repository, "user_has_access", return_value=True
-            ):
-                # Should not raise - client has access
-                mock_session.add = MagicMock()
-                mock_session.commit = MagicMock()
-                mock_session.refresh = MagicMock()
+        with patch.object(
+            service.repository,
+            "get_with_access",
+            return_value=(sample_risk, True, True),
+        ):
+            # Should not raise - client has access
+            mock_session.add = MagicMock()
+            mock_session.commit = MagicMock()
+            mock_session.refresh = MagicMock()
 
-                _ = service.add_comment(sample_risk.id, "Test comment", client_user)
-                # If we get here without exception, test passes
+            _ = service.add_comment(sample_risk.id, "Test comment", client_user)
+            # If we get here without exception, test passes
 
     def test_client_cannot_comment_on_unassigned_project(
         self, mock_session, client_user, sample_risk
@@ -357,12 +360,13 @@ class TestRiskComments:
         """Clients cannot comment on risks for unassigned projects."""
         service = RiskService(mock_session)
 
-        with patch.object(service.repository, "get_by_id", return_value=sample_risk):
-            with patch.object(
-                service.project_repository, "user_has_access", return_value=False
-            ):
-                with pytest.raises(AuthorizationError):
-                    service.add_comment(sample_risk.id, "Test comment", client_user)
+        with patch.object(
+            service.repository,
+            "get_with_access",
+            return_value=(sample_risk, True, False),
+        ):
+            with pytest.raises(AuthorizationError):
+                service.add_comment(sample_risk.id, "Test comment", client_user)
 
     def test_cogniter_can_comment_on_any_project(
         self, mock_session, cogniter_user, sample_risk
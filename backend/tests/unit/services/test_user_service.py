@@ -147,3 +147,17 @@ class TestSearchUsers:
         results = service.search_users(role=UserRole.CLIENT)
 
         assert all(u.role == UserRole.CLIENT for u in results)
+
+    def test_search_pages_with_keyset_cursor(
+        self, session, cogniter_user, client_user, pending_user
+    ):
+        """Passing the last (name, id) continues after it without repeats."""
+        service = UserService(session)
+        everyone = service.search_users()
+
+        first = service.search_users(limit=2)
+        rest = service.search_users(
+            limit=2, after_name=first[-1].name, after_id=first[-1].id
+        )
+
+        assert [u.id for u in first + rest] == [u.id for u in everyone]
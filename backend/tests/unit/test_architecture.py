@@ -249,3 +249,27 @@ class TestArchitectureBoundaries:
             + "\n".join(f"  - {v}" for v in violations)
             + "\n\nExpected layer order: routers -> services -> repositories -> models"
         )
+
+
+class TestRouteTable:
+    """Guard against the same endpoint being registered twice."""
+
+    def test_no_duplicate_routes(self):
+        from fastapi.routing import APIRoute
+
+        from main import app
+
+        seen: Dict[tuple, str] = {}
+        duplicates = []
+        for route in app.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            for method in route.methods:
+                key = (method, route.path)
+                if key in seen:
+                    duplicates.append(f"{method} {route.path}")
+                seen[key] = route.name
+
+        assert not duplicates, "Routes registered more than once:\n" + "\n".join(
+            f"  - {d}" for d in duplicates
+        )
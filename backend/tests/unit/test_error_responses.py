@@ -0,0 +1,76 @@
+"""Tests for the global error envelope helpers in main.py."""
+
+import json
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from starlette.requests import Request
+
+from exceptions import (
+    AuthorizationError,
+    DuplicateResourceError,
+    ResourceNotFoundError,
+    ValidationError,
+)
+from main import (
+    _error_body_suffix,
+    create_error_response,
+    fast_error_response,
+    pm_app_exception_handler,
+    pool_timeout_handler,
+)
+
+
+def test_fast_error_response_matches_create_error_response_shape():
+    """Pre-encoded envelopes must decode to the same dict as the generic builder."""
+    detail = 'Project "Ünïcode" with ID 123 not found'
+    response = fast_error_response(
+        404, detail, _error_body_suffix("ResourceNotFoundError", 404)
+    )
+
+    assert response.status_code == 404
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == create_error_response(
+        404, detail, "ResourceNotFoundError"
+    )
+
+
+def test_fast_error_response_passes_headers():
+    response = fast_error_response(
+        401,
+        "Invalid token",
+        _error_body_suffix("AuthenticationError", 401),
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+
+
+@pytest.mark.parametrize(
+    ("exc", "status_code"),
+    [
+        (ResourceNotFoundError("Project not found"), 404),
+        (AuthorizationError("Access denied"), 403),
+        (ValidationError("Bad input"), 400),
+        (DuplicateResourceError("Already exists"), 409),
+    ],
+)
+async def test_pm_app_exception_handler_uses_class_status(exc, status_code):
+    request = Request({"type": "http", "method": "GET", "path": "/x", "headers": []})
+
+    response = await pm_app_exception_handler(request, exc)
+
+    assert response.status_code == status_code
+    assert json.loads(response.body) == create_error_response(
+        status_code, str(exc), type(exc).__name__
+    )
+
+
+async def test_pool_timeout_sheds_load_with_503():
+    request = Request({"type": "http", "method": "GET", "path": "/x", "headers": []})
+
+    response = await pool_timeout_handler(request, PoolTimeoutError("QueuePool limit"))
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert json.loads(response.body)["error_type"] == "ServiceUnavailable"
@@ -0,0 +1,69 @@
+"""Tests for the queue-based logging setup."""
+
+import io
+import json
+import logging
+import sys
+import threading
+
+import pytest
+import structlog
+
+import logging_config
+import main
+from logging_config import configure_logging
+
+
+@pytest.fixture(name="log_output")
+def log_output_fixture(monkeypatch, test_settings):
+    """Configure production logging into a buffer; restore the app's setup after."""
+    output = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", output)
+    configure_logging(test_settings.model_copy(update={"environment": "production"}))
+    yield output
+    monkeypatch.undo()
+    configure_logging(main.settings)
+
+
+def test_records_are_rendered_on_the_listener_thread(log_output, monkeypatch):
+    render_threads = []
+    render = structlog.processors.JSONRenderer.__call__
+
+    def spy(self, *args):
+        render_threads.append(threading.current_thread())
+        return render(self, *args)
+
+    monkeypatch.setattr(structlog.processors.JSONRenderer, "__call__", spy)
+
+    structlog.get_logger().info("hello", count=1)
+    logging.getLogger("uvicorn.error").warning("foreign %s", "record")
+    logging_config._stop_log_listener()  # Drain the queue
+
+    lines = [json.loads(line) for line in log_output.getvalue().splitlines()]
+    assert [(line["event"], line["level"]) for line in lines] == [
+        ("hello", "info"),
+        ("foreign record", "warning"),
+    ]
+    assert lines[0]["count"] == 1
+    assert render_threads and threading.current_thread() not in render_threads
+
+
+def test_exception_is_captured_on_the_logging_thread(log_output):
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        structlog.get_logger().exception("failed")
+    logging_config._stop_log_listener()  # Drain the queue
+
+    line = json.loads(log_output.getvalue())
+    assert line["exception"].endswith("ValueError: boom")
+
+
+def test_reconfiguring_replaces_the_listener(log_output, test_settings):
+    first = logging_config._log_listener
+
+    configure_logging(test_settings.model_copy(update={"environment": "production"}))
+
+    assert first._thread is None  # Stopped and drained
+    assert logging_config._log_listener is not first
+    assert len(logging.getLogger().handlers) == 1
@@ -0,0 +1,113 @@
+"""Unit tests for model registration and mapper configuration."""
+
+import uuid
+
+import pytest
+from sqlalchemy import Enum, create_engine, inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import class_mapper
+from sqlalchemy.schema import CreateIndex
+from sqlmodel import SQLModel
+
+import models
+from models.action_item import ActionItem, action_search_document
+from models.ids import new_id
+
+
+def test_each_table_is_registered_once():
+    """One canonical model per table: no duplicate or stray mapped classes."""
+    assert set(SQLModel.metadata.tables) == {
+        "user",
+        "project",
+        "userprojectlink",
+        "actionitem",
+        "comment",
+        "risk",
+        "syncjob",
+    }
+
+
+def test_mappers_are_configured_at_import():
+    """Relationships are resolved when the models package is imported."""
+    for model in (models.Project, models.ActionItem, models.Risk, models.Comment):
+        assert class_mapper(model).configured
+
+
+def test_new_id_is_time_ordered_uuid7():
+    first, second = new_id(), new_id()
+
+    assert first.version == 7
+    assert first.variant == uuid.RFC_4122
+    # Millisecond timestamp prefix never goes backwards
+    assert first.int >> 80 <= second.int >> 80
+
+
+def test_enum_columns_use_native_database_enums():
+    """Enum fields map to native ENUM types (4 bytes on PostgreSQL), not VARCHAR."""
+    enum_columns = [
+        column
+        for table in SQLModel.metadata.tables.values()
+        for column in table.columns
+        if isinstance(column.type, Enum)
+    ]
+
+    assert len(enum_columns) == 13
+    for column in enum_columns:
+        assert column.type.native_enum, f"{column.table.name}.{column.name}"
+
+
+# SQLite reflection cannot describe expression indexes (ix_user_email_lower)
+@pytest.mark.filterwarnings("ignore:Skipped unsupported reflection")
+def test_trigram_search_indexes_are_postgres_only_gin():
+    """User search columns get pg_trgm GIN indexes, skipped on other dialects."""
+    indexes = {
+        index.name: index
+        for table in SQLModel.metadata.tables.values()
+        for index in table.indexes
+        if index.name.endswith("_trgm")
+    }
+
+    assert set(indexes) == {
+        "ix_user_name_trgm",
+        "ix_user_email_trgm",
+    }
+    for index in indexes.values():
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        assert "USING gin" in ddl
+        assert "gin_trgm_ops" in ddl
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    created = {
+        index["name"]
+        for table in ("user",)
+        for index in inspect(engine).get_indexes(table)
+    }
+    assert created.isdisjoint(indexes)
+
+
+def test_action_search_index_matches_repository_expression():
+    """The GIN expression index and the search predicate compile identically."""
+    (index,) = [
+        i for i in ActionItem.__table__.indexes if i.name == "ix_actionitem_search"
+    ]
+    index_sql = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    query_sql = str(
+        action_search_document(ActionItem.title, ActionItem.jira_id).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert "USING gin" in index_sql
+    assert query_sql.replace("actionitem.", "") in index_sql
+
+
+def test_open_actions_keyset_index_is_partial():
+    (index,) = [
+        i
+        for i in ActionItem.__table__.indexes
+        if i.name == "ix_actionitem_project_open_keyset"
+    ]
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    assert ddl.endswith("(project_id, id) WHERE status IN ('TO_DO', 'IN_PROGRESS')")
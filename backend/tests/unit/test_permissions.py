@@ -8,6 +8,8 @@ from models import AuthProvider, User, UserRole
 
 # These imports will fail initially - that's expected in TDD
 from permissions import (
+    _ROLE_CAPS,
+    Cap,
     can_create_project,
     can_delete_action,
     can_delete_risk,
@@ -198,3 +200,21 @@ class TestCanPublishProject:
     def test_client_cannot_publish(self, client):
         """Client should not be able to publish/unpublish projects."""
         assert can_publish_project(client) is False
+
+
+class TestRoleCapabilities:
+    """The role bitmask table covers every role and capability."""
+
+    def test_every_role_has_a_capability_mask(self):
+        assert set(_ROLE_CAPS) == set(UserRole)
+
+    def test_cogniter_holds_every_capability(self):
+        for cap in Cap:
+            assert _ROLE_CAPS[UserRole.COGNITER] & cap
+
+    def test_role_change_resets_cached_capabilities(self, client):
+        assert can_view_financials(client) is False
+
+        client.role = UserRole.CLIENT_FINANCIALS
+
+        assert can_view_financials(client) is True
@@ -0,0 +1,29 @@
+"""Tests for request-scoped logging context."""
+
+import structlog
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import main  # noqa: F401 - applies the application's structlog configuration
+from middleware import RequestContextMiddleware
+
+
+def test_logging_merges_request_context_into_every_logger():
+    assert (
+        structlog.contextvars.merge_contextvars in structlog.get_config()["processors"]
+    )
+
+
+def test_request_context_is_visible_to_handlers():
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/ping")
+    def ping():
+        return structlog.contextvars.get_contextvars()
+
+    with TestClient(app) as client:
+        response = client.get("/ping", headers={"X-Request-ID": "abc"})
+
+    assert response.json() == {"request_id": "abc", "path": "/ping", "method": "GET"}
+    assert response.headers["X-Request-ID"] == "abc"
@@ -0,0 +1,165 @@
+"""Tests for the ORM -> read-schema serializers."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from models import (
+    ActionItem,
+    ActionStatus,
+    AuthProvider,
+    Comment,
+    Priority,
+    Project,
+    Risk,
+    RiskImpact,
+    RiskProbability,
+    RiskStatus,
+    User,
+    UserRole,
+)
+from models.project import HealthStatus, ProjectType
+from schemas import (
+    ActionItemRead,
+    CommentRead,
+    ProjectRead,
+    RiskRead,
+    UserRead,
+)
+from serializers.api_models import (
+    ACTION_ITEM_LIST,
+    to_action_item_read,
+    to_comment_read,
+    to_project_read,
+    to_risk_read,
+    to_user_read,
+)
+
+
+def test_to_action_item_read_matches_validated_schema():
+    action = ActionItem(
+        id=uuid4(),
+        project_id=uuid4(),
+        title="Ship it",
+        status=ActionStatus.IN_PROGRESS,
+        priority=Priority.HIGH,
+        assignee="Ann",
+        due_date=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        jira_key="PM-1",
+        comment_count=3,
+    )
+
+    constructed = to_action_item_read(action)
+    validated = ActionItemRead.model_validate(action)
+
+    assert constructed.model_dump_json() == validated.model_dump_json()
+
+
+def test_to_comment_read_matches_validated_schema():
+    author = User(
+        id=uuid4(),
+        email="ann@example.com",
+        name="Ann",
+        role=UserRole.CLIENT,
+        auth_provider=AuthProvider.EMAIL,
+    )
+    comment = Comment(
+        id=uuid4(),
+        user_id=author.id,
+        content="Looks good",
+        created_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        action_item_id=uuid4(),
+    )
+
+    constructed = to_comment_read(comment, author)
+    validated = CommentRead.model_validate(
+        {
+            **comment.model_dump(),
+            "author_name": author.name,
+            "author_email": author.email,
+        }
+    )
+
+    assert constructed.model_dump_json() == validated.model_dump_json()
+
+
+def test_to_user_read_matches_validated_schema():
+    user = User(
+        id=uuid4(),
+        email="ann@example.com",
+        name="Ann",
+        role=UserRole.COGNITER,
+        auth_provider=AuthProvider.GOOGLE,
+    )
+
+    constructed = to_user_read(user)
+    validated = UserRead.model_validate(user)
+
+    assert constructed.model_dump_json() == validated.model_dump_json()
+
+
+def test_to_risk_read_matches_validated_schema():
+    risk = Risk(
+        id=uuid4(),
+        project_id=uuid4(),
+        title="Vendor delay",
+        description="Parts may arrive late",
+        probability=RiskProbability.HIGH,
+        impact=RiskImpact.MEDIUM,
+        status=RiskStatus.CLOSED,
+        decision_record="Second supplier signed",
+        resolved_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        resolved_by_id=uuid4(),
+    )
+
+    constructed = to_risk_read(risk)
+    validated = RiskRead.model_validate(risk)
+
+    assert constructed.model_dump_json() == validated.model_dump_json()
+
+
+def test_action_item_list_adapter_matches_per_item_encoding():
+    reads = [
+        to_action_item_read(
+            ActionItem(
+                id=uuid4(),
+                project_id=uuid4(),
+                title=f"Issue {i}",
+                status=ActionStatus.TO_DO,
+                priority=Priority.LOW,
+                comment_count=i,
+            )
+        )
+        for i in range(3)
+    ]
+
+    encoded = ACTION_ITEM_LIST.dump_json(reads)
+
+    assert (
+        encoded == b"[" + b",".join(r.model_dump_json().encode() for r in reads) + b"]"
+    )
+
+
+def test_to_project_read_redacts_budgets_only_when_hidden():
+    project = Project(
+        id=uuid4(),
+        name="Apollo",
+        type=ProjectType.FIXED_PRICE,
+        precursive_url="https://precursive.example.com/projects/1",
+        jira_url="https://jira.example.com/projects/AP",
+        health_status=HealthStatus.GREEN,
+        total_budget=1000,
+        spent_budget=250,
+        remaining_budget=750,
+    )
+    validated = ProjectRead.model_validate(project)
+
+    shown = to_project_read(project, show_financials=True)
+    hidden = to_project_read(project, show_financials=False)
+
+    assert shown.model_dump_json() == validated.model_dump_json()
+    assert hidden.model_dump() == {
+        **validated.model_dump(),
+        "total_budget": None,
+        "spent_budget": None,
+        "remaining_budget": None,
+    }
@@ -37,13 +37,16 @@ import type { ErrorType, BodyType } from "../../orvalMutator";
 /**
  * Get actions for a project.
 
-If limit/offset are provided, returns paginated response with total count.
+If limit is provided, returns a keyset-paginated response with total count
+and a next_cursor to pass back for the following page.
 Otherwise returns all actions (legacy behavior) with X-Total-Count header.
 
 - **limit**: Maximum number of results (1-100)
-- **offset**: Number of results to skip
+- **cursor**: next_cursor from the previous page (omit for the first page)
 - **search**: Optional search term for title or Jira ID
 - **status**: Optional status filter (can be repeated)
+- **with_total**: Whether to count all matches; by default only the first
+  page (no cursor) is counted, since later pages only need next_cursor
  * @summary Read Actions
  */
 export const readActionsActionsGet = (
@@ -258,6 +261,8 @@ export const useCreateActionActionsPost = <
 };
 /**
  * Get a specific action item by ID.
+
+Sends an ETag; a poll with a matching If-None-Match gets 304 Not Modified.
  * @summary Get Action
  */
 export const getActionActionsActionIdGet = (actionId: string, signal?: AbortSignal) => {
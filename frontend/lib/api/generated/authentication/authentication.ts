@@ -206,6 +206,8 @@ export const useLoginSuperuserAuthSuperuserLoginPost = <
 };
 /**
  * Get current authenticated user information.
+
+Sends an ETag; a poll with a matching If-None-Match gets 304 Not Modified.
  * @summary Get Current User Info
  */
 export const getCurrentUserInfoAuthMeGet = (signal?: AbortSignal) => {
@@ -18,6 +18,8 @@ import type {
     UseQueryResult,
 } from "@tanstack/react-query";
 
+import type { HTTPValidationError } from ".././models";
+
 import { customInstance } from "../../orvalMutator";
 import type { ErrorType } from "../../orvalMutator";
 
@@ -353,6 +355,123 @@ export function useLivenessCheckHealthLiveGet<
     return query;
 }
 
+/**
+ * Request pool occupancy (checked out / overflow), for capacity tuning.
+
+Authenticated unlike the other probes: it reveals deployment sizing.
+ * @summary Pool Status
+ */
+export const poolStatusHealthPoolGet = (signal?: AbortSignal) => {
+    return customInstance<unknown>({ url: `/health/pool`, method: "GET", signal });
+};
+
+export const getPoolStatusHealthPoolGetQueryKey = () => {
+    return [`/health/pool`] as const;
+};
+
+export const getPoolStatusHealthPoolGetQueryOptions = <
+    TData = Awaited<ReturnType<typeof poolStatusHealthPoolGet>>,
+    TError = ErrorType<HTTPValidationError>,
+>(options?: {
+    query?: Partial<
+        UseQueryOptions<Awaited<ReturnType<typeof poolStatusHealthPoolGet>>, TError, TData>
+    >;
+}) => {
+    const { query: queryOptions } = options ?? {};
+
+    const queryKey = queryOptions?.queryKey ?? getPoolStatusHealthPoolGetQueryKey();
+
+    const queryFn: QueryFunction<Awaited<ReturnType<typeof poolStatusHealthPoolGet>>> = ({
+        signal,
+    }) => poolStatusHealthPoolGet(signal);
+
+    return { queryKey, queryFn, ...queryOptions } as UseQueryOptions<
+        Awaited<ReturnType<typeof poolStatusHealthPoolGet>>,
+        TError,
+        TData
+    > & { queryKey: DataTag<QueryKey, TData, TError> };
+};
+
+export type PoolStatusHealthPoolGetQueryResult = NonNullable<
+    Awaited<ReturnType<typeof poolStatusHealthPoolGet>>
+>;
+export type PoolStatusHealthPoolGetQueryError = ErrorType<HTTPValidationError>;
+
+export function usePoolStatusHealthPoolGet<
+    TData = Awaited<ReturnType<typeof poolStatusHealthPoolGet>>,
+    TError = ErrorType<HTTPValidationError>,
+>(
+    options: {
+        query: Partial<
+            UseQueryOptions<Awaited<ReturnType<typeof poolStatusHealthPoolGet>>, TError, TData>
+        > &
+            Pick<
+                DefinedInitialDataOptions<
+                    Awaited<ReturnType<typeof poolStatusHealthPoolGet>>,
+                    TError,
+                    Awaited<ReturnType<typeof poolStatusHealthPoolGet>>
+                >,
+                "initialData"
+            >;
+    },
+    queryClient?: QueryClient
+): DefinedUseQueryResult<TData, TError> & { queryKey: DataTag<QueryKey, TData, TError> };
+export function usePoolStatusHealthPoolGet<
+    TData = Awaited<ReturnType<typeof poolStatusHealthPoolGet>>,
+    TError = ErrorType<HTTPValidationError>,
+>(
+    options?: {
+        query?: Partial<
+            UseQueryOptions<Awaited<ReturnType<typeof poolStatusHealthPoolGet>>, TError, TData>
+        > &
+            Pick<
+                UndefinedInitialDataOptions<
+                    Awaited<ReturnType<typeof poolStatusHealthPoolGet>>,
+                    TError,
+                    Awaited<ReturnType<typeof poolStatusHealthPoolGet>>
+                >,
+                "initialData"
+            >;
+    },
+    queryClient?: QueryClient
+): UseQueryResult<TData, TError> & { queryKey: DataTag<QueryKey, TData, TError> };
+export function usePoolStatusHealthPoolGet<
+    TData = Awaited<ReturnType<typeof poolStatusHealthPoolGet>>,
+    TError = ErrorType<HTTPValidationError>,
+>(
+    options?: {
+        query?: Partial<
+            UseQueryOptions<Awaited<ReturnType<typeof poolStatusHealthPoolGet>>, TError, TData>
+        >;
+    },
+    queryClient?: QueryClient
+): UseQueryResult<TData, TError> & { queryKey: DataTag<QueryKey, TData, TError> };
+/**
+ * @summary Pool Status
+ */
+
+export function usePoolStatusHealthPoolGet<
+    TData = Awaited<ReturnType<typeof poolStatusHealthPoolGet>>,
+    TError = ErrorType<HTTPValidationError>,
+>(
+    options?: {
+        query?: Partial<
+            UseQueryOptions<Awaited<ReturnType<typeof poolStatusHealthPoolGet>>, TError, TData>
+        >;
+    },
+    queryClient?: QueryClient
+): UseQueryResult<TData, TError> & { queryKey: DataTag<QueryKey, TData, TError> } {
+    const queryOptions = getPoolStatusHealthPoolGetQueryOptions(options);
+
+    const query = useQuery(queryOptions, queryClient) as UseQueryResult<TData, TError> & {
+        queryKey: DataTag<QueryKey, TData, TError>;
+    };
+
+    query.queryKey = queryOptions.queryKey;
+
+    return query;
+}
+
 /**
  * Readiness probe - confirms the app is ready to serve traffic.
 Checks database connectivity.
@@ -0,0 +1,16 @@
+/**
+ * Generated by orval v7.13.2 🍺
+ * Do not edit manually.
+ * PM App API
+ * Automated Project Management Tool API
+ * OpenAPI spec version: 1.0.0
+ */
+
+export type GetJobStatusSyncJobsJobIdGetParams = {
+    /**
+     * Seconds to hold the request until the job's status changes
+     * @minimum 0
+     * @maximum 50
+     */
+    wait?: number;
+};
@@ -28,16 +28,21 @@ export * from "./commentReadAuthorEmail";
 export * from "./commentReadAuthorName";
 export * from "./commentReadRiskId";
 export * from "./deleteLogoUploadsLogoFilenameDelete200";
+export * from "./getJobStatusSyncJobsJobIdGetParams";
 export * from "./googleLoginRequest";
 export * from "./hTTPValidationError";
 export * from "./healthStatus";
 export * from "./inviteUserRequest";
 export * from "./inviteUserResponse";
+export * from "./inviteUsersBatchRequest";
+export * from "./inviteUsersBatchResponse";
 export * from "./jiraSyncResult";
 export * from "./jiraSyncResultError";
 export * from "./jiraSyncResultMessage";
 export * from "./listUsersUsersGetParams";
 export * from "./paginatedActionsResponse";
+export * from "./paginatedActionsResponseNextCursor";
+export * from "./paginatedActionsResponseTotal";
 export * from "./precursiveSyncResult";
 export * from "./precursiveSyncResultError";
 export * from "./precursiveSyncResultMessage";
@@ -89,6 +94,8 @@ export * from "./projectReadSprintGoals";
 export * from "./projectReadStartDate";
 export * from "./projectReadTotalBudget";
 export * from "./projectReadTotalDaysActuals";
+export * from "./projectSummary";
+export * from "./projectSummaryClientName";
 export * from "./projectType";
 export * from "./projectUpdate";
 export * from "./projectUpdateClientLogoUrl";
@@ -10,5 +10,9 @@
  * Schema for inviting a user by email.
  */
 export interface InviteUserRequest {
+    /**
+     * @maxLength 320
+     * @pattern ^[^@\s]+@[^@\s]+$
+     */
     email: string;
 }
@@ -0,0 +1,18 @@
+/**
+ * Generated by orval v7.13.2 🍺
+ * Do not edit manually.
+ * PM App API
+ * Automated Project Management Tool API
+ * OpenAPI spec version: 1.0.0
+ */
+
+/**
+ * Schema for inviting several users by email in one request.
+ */
+export interface InviteUsersBatchRequest {
+    /**
+     * @minItems 1
+     * @maxItems 100
+     */
+    emails: string[];
+}
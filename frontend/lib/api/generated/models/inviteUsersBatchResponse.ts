@@ -0,0 +1,17 @@
+/**
+ * Generated by orval v7.13.2 🍺
+ * Do not edit manually.
+ * PM App API
+ * Automated Project Management Tool API
+ * OpenAPI spec version: 1.0.0
+ */
+import type { UserRead } from "./userRead";
+
+/**
+ * Response after inviting/assigning a batch of users.
+ */
+export interface InviteUsersBatchResponse {
+    users: UserRead[];
+    created: string[];
+    message: string;
+}
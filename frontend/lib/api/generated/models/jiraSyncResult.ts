@@ -11,6 +11,8 @@ import type { JiraSyncResultError } from "./jiraSyncResultError";
 export interface JiraSyncResult {
     success: boolean;
     actions_count?: number;
+    actions_created?: number;
+    actions_updated?: number;
     message?: JiraSyncResultMessage;
     error?: JiraSyncResultError;
 }
@@ -11,4 +11,8 @@ export type ListUsersUsersGetParams = {
     search?: string | null;
     role?: UserRole | null;
     limit?: number;
+    /**
+     * X-Next-Cursor header from the previous page
+     */
+    cursor?: string | null;
 };
@@ -6,13 +6,15 @@
  * OpenAPI spec version: 1.0.0
  */
 import type { ActionItemRead } from "./actionItemRead";
+import type { PaginatedActionsResponseTotal } from "./paginatedActionsResponseTotal";
+import type { PaginatedActionsResponseNextCursor } from "./paginatedActionsResponseNextCursor";
 
 /**
  * Paginated response for action items.
  */
 export interface PaginatedActionsResponse {
     items: ActionItemRead[];
-    total: number;
+    total: PaginatedActionsResponseTotal;
     limit: number;
-    offset: number;
+    next_cursor: PaginatedActionsResponseNextCursor;
 }
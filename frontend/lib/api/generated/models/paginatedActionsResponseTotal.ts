@@ -0,0 +1,9 @@
+/**
+ * Generated by orval v7.13.2 🍺
+ * Do not edit manually.
+ * PM App API
+ * Automated Project Management Tool API
+ * OpenAPI spec version: 1.0.0
+ */
+
+export type PaginatedActionsResponseTotal = number | null;
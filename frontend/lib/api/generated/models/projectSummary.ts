@@ -0,0 +1,23 @@
+/**
+ * Generated by orval v7.13.2 🍺
+ * Do not edit manually.
+ * PM App API
+ * Automated Project Management Tool API
+ * OpenAPI spec version: 1.0.0
+ */
+import type { HealthStatus } from "./healthStatus";
+import type { ProjectSummaryClientName } from "./projectSummaryClientName";
+
+/**
+ * Lightweight project listing (pickers, navigation).
+
+Built from a column-pruned query: no financial or sync fields are loaded,
+so no permission gating is needed.
+ */
+export interface ProjectSummary {
+    id: string;
+    name: string;
+    health_status: HealthStatus;
+    is_published: boolean;
+    client_name: ProjectSummaryClientName;
+}
@@ -5,6 +5,7 @@
  * Automated Project Management Tool API
  * OpenAPI spec version: 1.0.0
  */
+import type { ActionStatus } from "./actionStatus";
 
 export type ReadActionsActionsGetParams = {
     project_id: string;
@@ -13,9 +14,9 @@ export type ReadActionsActionsGetParams = {
      */
     limit?: number | null;
     /**
-     * Number of items to skip
+     * next_cursor from the previous page
      */
-    offset?: number | null;
+    cursor?: string | null;
     /**
      * Search in title or Jira ID
      */
@@ -23,5 +24,9 @@ export type ReadActionsActionsGetParams = {
     /**
      * Filter by status
      */
-    status?: string[] | null;
+    status?: ActionStatus[] | null;
+    /**
+     * Include the total match count (default: first page only)
+     */
+    with_total?: boolean | null;
 };
@@ -25,8 +25,11 @@ import type {
     HTTPValidationError,
     InviteUserRequest,
     InviteUserResponse,
+    InviteUsersBatchRequest,
+    InviteUsersBatchResponse,
     ProjectCreate,
     ProjectRead,
+    ProjectSummary,
     ProjectUpdate,
     UserRead,
 } from ".././models";
@@ -236,9 +239,149 @@ export const useCreateProjectProjectsPost = <
 
     return useMutation(mutationOptions, queryClient);
 };
+/**
+ * List accessible projects with only id, name, health and publish state.
+
+Same visibility rules as GET /projects, for callers that do not need the
+full project payload.
+ * @summary List Project Summaries
+ */
+export const listProjectSummariesProjectsSummaryGet = (signal?: AbortSignal) => {
+    return customInstance<ProjectSummary[]>({ url: `/projects/summary`, method: "GET", signal });
+};
+
+export const getListProjectSummariesProjectsSummaryGetQueryKey = () => {
+    return [`/projects/summary`] as const;
+};
+
+export const getListProjectSummariesProjectsSummaryGetQueryOptions = <
+    TData = Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+    TError = ErrorType<HTTPValidationError>,
+>(options?: {
+    query?: Partial<
+        UseQueryOptions<
+            Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+            TError,
+            TData
+        >
+    >;
+}) => {
+    const { query: queryOptions } = options ?? {};
+
+    const queryKey = queryOptions?.queryKey ?? getListProjectSummariesProjectsSummaryGetQueryKey();
+
+    const queryFn: QueryFunction<
+        Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>
+    > = ({ signal }) => listProjectSummariesProjectsSummaryGet(signal);
+
+    return { queryKey, queryFn, ...queryOptions } as UseQueryOptions<
+        Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+        TError,
+        TData
+    > & { queryKey: DataTag<QueryKey, TData, TError> };
+};
+
+export type ListProjectSummariesProjectsSummaryGetQueryResult = NonNullable<
+    Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>
+>;
+export type ListProjectSummariesProjectsSummaryGetQueryError = ErrorType<HTTPValidationError>;
+
+export function useListProjectSummariesProjectsSummaryGet<
+    TData = Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+    TError = ErrorType<HTTPValidationError>,
+>(
+    options: {
+        query: Partial<
+            UseQueryOptions<
+                Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+                TError,
+                TData
+            >
+        > &
+            Pick<
+                DefinedInitialDataOptions<
+                    Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+                    TError,
+                    Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>
+                >,
+                "initialData"
+            >;
+    },
+    queryClient?: QueryClient
+): DefinedUseQueryResult<TData, TError> & { queryKey: DataTag<QueryKey, TData, TError> };
+export function useListProjectSummariesProjectsSummaryGet<
+    TData = Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+    TError = ErrorType<HTTPValidationError>,
+>(
+    options?: {
+        query?: Partial<
+            UseQueryOptions<
+                Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+                TError,
+                TData
+            >
+        > &
+            Pick<
+                UndefinedInitialDataOptions<
+                    Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+                    TError,
+                    Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>
+                >,
+                "initialData"
+            >;
+    },
+    queryClient?: QueryClient
+): UseQueryResult<TData, TError> & { queryKey: DataTag<QueryKey, TData, TError> };
+export function useListProjectSummariesProjectsSummaryGet<
+    TData = Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+    TError = ErrorType<HTTPValidationError>,
+>(
+    options?: {
+        query?: Partial<
+            UseQueryOptions<
+                Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+                TError,
+                TData
+            >
+        >;
+    },
+    queryClient?: QueryClient
+): UseQueryResult<TData, TError> & { queryKey: DataTag<QueryKey, TData, TError> };
+/**
+ * @summary List Project Summaries
+ */
+
+export function useListProjectSummariesProjectsSummaryGet<
+    TData = Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+    TError = ErrorType<HTTPValidationError>,
+>(
+    options?: {
+        query?: Partial<
+            UseQueryOptions<
+                Awaited<ReturnType<typeof listProjectSummariesProjectsSummaryGet>>,
+                TError,
+                TData
+            >
+        >;
+    },
+    queryClient?: QueryClient
+): UseQueryResult<TData, TError> & { queryKey: DataTag<QueryKey, TData, TError> } {
+    const queryOptions = getListProjectSummariesProjectsSummaryGetQueryOptions(options);
+
+    const query = useQuery(queryOptions, queryClient) as UseQueryResult<TData, TError> & {
+        queryKey: DataTag<QueryKey, TData, TError>;
+    };
+
+    query.queryKey = queryOptions.queryKey;
+
+    return query;
+}
+
 /**
  * Get a specific project by ID.
 User must have access to the project.
+
+Sends an ETag; a poll with a matching If-None-Match gets 304 Not Modified.
  * @summary Get Project
  */
 export const getProjectProjectsProjectIdGet = (projectId: string, signal?: AbortSignal) => {
@@ -1124,3 +1267,94 @@ export const useInviteUserToProjectProjectsProjectIdInvitePost = <
 
     return useMutation(mutationOptions, queryClient);
 };
+/**
+ * Invite several users to a project by email.
+Known emails are assigned directly; unknown emails get placeholder users.
+
+Only Cogniters can invite users.
+ * @summary Invite Users To Project
+ */
+export const inviteUsersToProjectProjectsProjectIdInviteBatchPost = (
+    projectId: string,
+    inviteUsersBatchRequest: BodyType<InviteUsersBatchRequest>,
+    signal?: AbortSignal
+) => {
+    return customInstance<InviteUsersBatchResponse>({
+        url: `/projects/${projectId}/invite/batch`,
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        data: inviteUsersBatchRequest,
+        signal,
+    });
+};
+
+export const getInviteUsersToProjectProjectsProjectIdInviteBatchPostMutationOptions = <
+    TError = ErrorType<HTTPValidationError>,
+    TContext = unknown,
+>(options?: {
+    mutation?: UseMutationOptions<
+        Awaited<ReturnType<typeof inviteUsersToProjectProjectsProjectIdInviteBatchPost>>,
+        TError,
+        { projectId: string; data: BodyType<InviteUsersBatchRequest> },
+        TContext
+    >;
+}): UseMutationOptions<
+    Awaited<ReturnType<typeof inviteUsersToProjectProjectsProjectIdInviteBatchPost>>,
+    TError,
+    { projectId: string; data: BodyType<InviteUsersBatchRequest> },
+    TContext
+> => {
+    const mutationKey = ["inviteUsersToProjectProjectsProjectIdInviteBatchPost"];
+    const { mutation: mutationOptions } = options
+        ? options.mutation && "mutationKey" in options.mutation && options.mutation.mutationKey
+            ? options
+            : { ...options, mutation: { ...options.mutation, mutationKey } }
+        : { mutation: { mutationKey } };
+
+    const mutationFn: MutationFunction<
+        Awaited<ReturnType<typeof inviteUsersToProjectProjectsProjectIdInviteBatchPost>>,
+        { projectId: string; data: BodyType<InviteUsersBatchRequest> }
+    > = (props) => {
+        const { projectId, data } = props ?? {};
+
+        return inviteUsersToProjectProjectsProjectIdInviteBatchPost(projectId, data);
+    };
+
+    return { mutationFn, ...mutationOptions };
+};
+
+export type InviteUsersToProjectProjectsProjectIdInviteBatchPostMutationResult = NonNullable<
+    Awaited<ReturnType<typeof inviteUsersToProjectProjectsProjectIdInviteBatchPost>>
+>;
+export type InviteUsersToProjectProjectsProjectIdInviteBatchPostMutationBody =
+    BodyType<InviteUsersBatchRequest>;
+export type InviteUsersToProjectProjectsProjectIdInviteBatchPostMutationError =
+    ErrorType<HTTPValidationError>;
+
+/**
+ * @summary Invite Users To Project
+ */
+export const useInviteUsersToProjectProjectsProjectIdInviteBatchPost = <
+    TError = ErrorType<HTTPValidationError>,
+    TContext = unknown,
+>(
+    options?: {
+        mutation?: UseMutationOptions<
+            Awaited<ReturnType<typeof inviteUsersToProjectProjectsProjectIdInviteBatchPost>>,
+            TError,
+            { projectId: string; data: BodyType<InviteUsersBatchRequest> },
+            TContext
+        >;
+    },
+    queryClient?: QueryClient
+): UseMutationResult<
+    Awaited<ReturnType<typeof inviteUsersToProjectProjectsProjectIdInviteBatchPost>>,
+    TError,
+    { projectId: string; data: BodyType<InviteUsersBatchRequest> },
+    TContext
+> => {
+    const mutationOptions =
+        getInviteUsersToProjectProjectsProjectIdInviteBatchPostMutationOptions(options);
+
+    return useMutation(mutationOptions, queryClient);
+};
@@ -236,6 +236,8 @@ export const useCreateRiskRisksPost = <TError = ErrorType<HTTPValidationError>,
 };
 /**
  * Get a specific risk by ID.
+
+Sends an ETag; a poll with a matching If-None-Match gets 304 Not Modified.
  * @summary Get Risk
  */
 export const getRiskRisksRiskIdGet = (riskId: string, signal?: AbortSignal) => {
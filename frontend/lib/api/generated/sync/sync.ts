@@ -22,6 +22,7 @@ import type {
 } from "@tanstack/react-query";
 
 import type {
+    GetJobStatusSyncJobsJobIdGetParams,
     HTTPValidationError,
     SyncJobEnqueued,
     SyncJobRead,
@@ -35,16 +36,35 @@ import type { ErrorType } from "../../orvalMutator";
 /**
  * Get the status of a sync job.
 
-Poll this endpoint to check if a sync job has completed.
+Poll this endpoint to check if a sync job has completed. With ``wait``,
+the request is held until the job moves out of its current status (or
+finishes), returning early on change instead of polling repeatedly.
 User must have access to the project the job belongs to.
+
+Wake-ups are in-process: a change made by the job's runner in this API
+process returns at once, while a change made by another process
+(including the standalone sync worker, SYNC_WORKER_ENABLED=true) is
+noticed within LONG_POLL_RECHECK_SECONDS (2s).
  * @summary Get Job Status
  */
-export const getJobStatusSyncJobsJobIdGet = (jobId: string, signal?: AbortSignal) => {
-    return customInstance<SyncJobRead>({ url: `/sync/jobs/${jobId}`, method: "GET", signal });
+export const getJobStatusSyncJobsJobIdGet = (
+    jobId: string,
+    params?: GetJobStatusSyncJobsJobIdGetParams,
+    signal?: AbortSignal
+) => {
+    return customInstance<SyncJobRead>({
+        url: `/sync/jobs/${jobId}`,
+        method: "GET",
+        params,
+        signal,
+    });
 };
 
-export const getGetJobStatusSyncJobsJobIdGetQueryKey = (jobId?: string) => {
-    return [`/sync/jobs/${jobId}`] as const;
+export const getGetJobStatusSyncJobsJobIdGetQueryKey = (
+    jobId?: string,
+    params?: GetJobStatusSyncJobsJobIdGetParams
+) => {
+    return [`/sync/jobs/${jobId}`, ...(params ? [params] : [])] as const;
 };
 
 export const getGetJobStatusSyncJobsJobIdGetQueryOptions = <
@@ -52,6 +72,7 @@ export const getGetJobStatusSyncJobsJobIdGetQueryOptions = <
     TError = ErrorType<HTTPValidationError>,
 >(
     jobId: string,
+    params?: GetJobStatusSyncJobsJobIdGetParams,
     options?: {
         query?: Partial<
             UseQueryOptions<Awaited<ReturnType<typeof getJobStatusSyncJobsJobIdGet>>, TError, TData>
@@ -60,11 +81,12 @@ export const getGetJobStatusSyncJobsJobIdGetQueryOptions = <
 ) => {
     const { query: queryOptions } = options ?? {};
 
-    const queryKey = queryOptions?.queryKey ?? getGetJobStatusSyncJobsJobIdGetQueryKey(jobId);
+    const queryKey =
+        queryOptions?.queryKey ?? getGetJobStatusSyncJobsJobIdGetQueryKey(jobId, params);
 
     const queryFn: QueryFunction<Awaited<ReturnType<typeof getJobStatusSyncJobsJobIdGet>>> = ({
         signal,
-    }) => getJobStatusSyncJobsJobIdGet(jobId, signal);
+    }) => getJobStatusSyncJobsJobIdGet(jobId, params, signal);
 
     return { queryKey, queryFn, enabled: !!jobId, ...queryOptions } as UseQueryOptions<
         Awaited<ReturnType<typeof getJobStatusSyncJobsJobIdGet>>,
@@ -83,6 +105,7 @@ export function useGetJobStatusSyncJobsJobIdGet<
     TError = ErrorType<HTTPValidationError>,
 >(
     jobId: string,
+    params: undefined | GetJobStatusSyncJobsJobIdGetParams,
     options: {
         query: Partial<
             UseQueryOptions<Awaited<ReturnType<typeof getJobStatusSyncJobsJobIdGet>>, TError, TData>
@@ -103,6 +126,7 @@ export function useGetJobStatusSyncJobsJobIdGet<
     TError = ErrorType<HTTPValidationError>,
 >(
     jobId: string,
+    params?: GetJobStatusSyncJobsJobIdGetParams,
     options?: {
         query?: Partial<
             UseQueryOptions<Awaited<ReturnType<typeof getJobStatusSyncJobsJobIdGet>>, TError, TData>
@@ -123,6 +147,7 @@ export function useGetJobStatusSyncJobsJobIdGet<
     TError = ErrorType<HTTPValidationError>,
 >(
     jobId: string,
+    params?: GetJobStatusSyncJobsJobIdGetParams,
     options?: {
         query?: Partial<
             UseQueryOptions<Awaited<ReturnType<typeof getJobStatusSyncJobsJobIdGet>>, TError, TData>
@@ -139,6 +164,7 @@ export function useGetJobStatusSyncJobsJobIdGet<
     TError = ErrorType<HTTPValidationError>,
 >(
     jobId: string,
+    params?: GetJobStatusSyncJobsJobIdGetParams,
     options?: {
         query?: Partial<
             UseQueryOptions<Awaited<ReturnType<typeof getJobStatusSyncJobsJobIdGet>>, TError, TData>
@@ -146,7 +172,7 @@ export function useGetJobStatusSyncJobsJobIdGet<
     },
     queryClient?: QueryClient
 ): UseQueryResult<TData, TError> & { queryKey: DataTag<QueryKey, TData, TError> } {
-    const queryOptions = getGetJobStatusSyncJobsJobIdGetQueryOptions(jobId, options);
+    const queryOptions = getGetJobStatusSyncJobsJobIdGetQueryOptions(jobId, params, options);
 
     const query = useQuery(queryOptions, queryClient) as UseQueryResult<TData, TError> & {
         queryKey: DataTag<QueryKey, TData, TError>;
@@ -27,8 +27,8 @@ import type { ErrorType, BodyType } from "../../orvalMutator";
  * Upload a project logo image.
 
 - Only Cogniters can upload logos
-- Accepts: JPEG, PNG, GIF, WebP
-- Max size: 2MB
+- Accepts: JPEG, PNG, GIF, WebP (checked against the file's contents)
+- Max size: 2MB (enforced while streaming to disk)
 - Returns the URL path to access the uploaded file
  * @summary Upload Logo
  */
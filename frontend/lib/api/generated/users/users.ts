@@ -32,11 +32,13 @@ import { customInstance } from "../../orvalMutator";
 import type { ErrorType, BodyType } from "../../orvalMutator";
 
 /**
- * List users with optional filtering.
+ * List users with optional filtering, ordered by name.
 
 - **search**: Optional search string for name or email (case-insensitive)
 - **role**: Optional filter by role (Cogniter, Client + Financials, or Client)
 - **limit**: Maximum number of results to return (default 50, max 200)
+- **cursor**: X-Next-Cursor response header of the previous page (omit for
+  the first page); the header is only sent when more users may follow
 
 Only Cogniters can access this endpoint.
  * @summary List Users